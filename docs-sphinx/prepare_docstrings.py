@@ -269,6 +269,7 @@ for filename in sorted(glob.glob("../src/awkward/**/*.py", recursive=True),
 
     shortname = (modulename.replace("awkward.", "ak.")
                            .replace(".highlevel", "")
+                           .replace(".expr", "")
                            .replace(".operations.convert", "")
                            .replace(".operations.describe", "")
                            .replace(".operations.structure", "")
@@ -282,6 +283,8 @@ for filename in sorted(glob.glob("../src/awkward/**/*.py", recursive=True),
     elif not done_extra and modulename.startswith("awkward._"):
         done_extra = True
         toctree.extend(["ak.numba.register.rst",
+                        "ak.numba.fill_jagged.rst",
+                        "ak.numba.LayoutBuilder.rst",
                         "ak.numexpr.evaluate.rst",
                         "ak.numexpr.re_evaluate.rst",
                         "ak.autograd.elementwise_grad.rst",
@@ -36,6 +36,17 @@ namespace awkward {
     virtual bool
       returns_positions() const;
 
+    /// @brief Number of threads used to reduce lists of numbers
+    /// (a ListOffsetArray of a one-dimensional NumpyArray) at `axis=-1`.
+    ///
+    /// The default is 1 (no threads are started).
+    static int64_t
+      threads();
+
+    /// @brief Sets the number of #threads (for all reducers).
+    static void
+      set_threads(int64_t threads);
+
     /// @brief Apply the reducer algorithm to an array of boolean values.
     ///
     /// @param data The array to reduce.
@@ -1290,6 +1301,55 @@ namespace awkward {
                       int64_t outlength) const override;
   };
 
+  /// @brief Computes the statistics behind ak.mean, ak.var, ak.std,
+  /// ak.moment, ak.covar, ak.corr, and ak.linear_fit for each list of
+  /// numbers in a single pass over the data.
+  ///
+  /// Each list `i` consists of the elements from `starts[i]` (inclusive)
+  /// to `stops[i]` (exclusive) of `x`, `y`, `weight`, and `valid`. The
+  /// sums are accumulated with respect to the first value in each list
+  /// (shifted data), so that the central moments do not suffer from
+  /// cancellation the way that `sum(x**2) - sum(x)**2` does.
+  ///
+  /// The work is divided among Reducer#threads at list boundaries.
+  ///
+  /// @param x The first coordinate.
+  /// @param y The second coordinate or `nullptr`; if `nullptr`,
+  /// `meany`, `cyy`, and `cxy` are not filled.
+  /// @param weight The weight of each element or `nullptr` for weight 1.
+  /// @param valid If not `nullptr`, elements for which `valid` is zero
+  /// are skipped (missing values).
+  /// @param starts Starting index of each list.
+  /// @param stops Stopping index of each list.
+  /// @param length Number of lists (length of all of the outputs).
+  /// @param n The order of the moment; only used if `sumwxn` is not
+  /// `nullptr`.
+  /// @param count Output: number of elements (not skipped) in each list.
+  /// @param sumw Output: sum of weights.
+  /// @param meanx Output: weighted mean of `x`.
+  /// @param meany Output: weighted mean of `y`.
+  /// @param cxx Output: sum of `weight * (x - meanx)**2`.
+  /// @param cyy Output: sum of `weight * (y - meany)**2`.
+  /// @param cxy Output: sum of `weight * (x - meanx) * (y - meany)`.
+  /// @param sumwxn Output: sum of `(x * weight)**n` or `nullptr`.
+  LIBAWKWARD_EXPORT_SYMBOL void
+    reduce_moments(const double* x,
+                   const double* y,
+                   const double* weight,
+                   const uint8_t* valid,
+                   const int64_t* starts,
+                   const int64_t* stops,
+                   int64_t length,
+                   double n,
+                   int64_t* count,
+                   double* sumw,
+                   double* meanx,
+                   double* meany,
+                   double* cxx,
+                   double* cyy,
+                   double* cxy,
+                   double* sumwxn);
+
 }
 
 #endif // AWKWARD_REDUCER_H_
@@ -465,6 +465,29 @@ namespace awkward {
                   bool mask,
                   bool keepdims) const override;
 
+    /// @brief Reduces each list from `offsets[i]` to `offsets[i + 1]` of
+    /// this one-dimensional, contiguous array; the same as #reduce_next with
+    /// the list indexes as `parents` and no `shifts`.
+    ///
+    /// Instead of a `parents` array as long as this array, the lists are
+    /// reduced in blocks of whole lists, each with a small `parents` array.
+    ///
+    /// The lists are divided among Reducer::threads() threads at list
+    /// boundaries, so each output value is computed by one thread in the
+    /// same order as in a serial reduction: the result does not depend on the
+    /// number of threads, even for floating-point values.
+    ///
+    /// @param reducer The reducer algorithm.
+    /// @param offsets Positions where each list starts and stops;
+    /// `offsets[0]` is the first element of this array.
+    /// @param mask If true, lists with no elements become None.
+    /// @param keepdims If true, wrap the output in a RegularArray of size 1.
+    const ContentPtr
+      reduce_next_offsets(const Reducer& reducer,
+                          const Index64& offsets,
+                          bool mask,
+                          bool keepdims) const;
+
     const ContentPtr
       sort_next(int64_t negaxis,
                 const Index64& starts,
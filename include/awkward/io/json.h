@@ -13,6 +13,8 @@
 namespace awkward {
   class Content;
   using ContentPtr    = std::shared_ptr<Content>;
+  class Form;
+  using FormPtr       = std::shared_ptr<Form>;
 
   /// @class ToJson
   ///
@@ -338,12 +340,16 @@ namespace awkward {
   /// representation in JSON format
   /// @param minus_infinity_string user-defined string for a negative
   /// infinity representation in JSON format
+  /// @param schema If not `nullptr`, the Form of the output array: values
+  /// are filled directly into buffers of this Form, rather than discovering
+  /// the type with an ArrayBuilder.
   LIBAWKWARD_EXPORT_SYMBOL const ContentPtr
     FromJsonString(const char* source,
                    const ArrayBuilderOptions& options,
                    const char* nan_string = nullptr,
                    const char* infinity_string = nullptr,
-                   const char* minus_infinity_string = nullptr);
+                   const char* minus_infinity_string = nullptr,
+                   const FormPtr& schema = nullptr);
 
   /// @brief Convert a JSON-encoded file into a Content array using an
   /// ArrayBuilder.
@@ -358,14 +364,74 @@ namespace awkward {
   /// representation in JSON format
   /// @param minus_infinity_string user-defined string for a negative
   /// infinity representation in JSON format
+  /// @param schema If not `nullptr`, the Form of the output array: values
+  /// are filled directly into buffers of this Form, rather than discovering
+  /// the type with an ArrayBuilder.
   LIBAWKWARD_EXPORT_SYMBOL const ContentPtr
     FromJsonFile(FILE* source,
                  const ArrayBuilderOptions& options,
                  int64_t buffersize,
                  const char* nan_string = nullptr,
                  const char* infinity_string = nullptr,
-                 const char* minus_infinity_string = nullptr);
+                 const char* minus_infinity_string = nullptr,
+                 const FormPtr& schema = nullptr);
+
+
+  /// @class FromJsonFileBatches
+  ///
+  /// @brief Converts a file of JSON values, such as JSON Lines, into a
+  /// sequence of Content arrays, one batch of values at a time.
+  ///
+  /// The file position and read buffer are kept between batches, so that
+  /// memory is bounded by the size of one batch.
+  class LIBAWKWARD_EXPORT_SYMBOL FromJsonFileBatches {
+  public:
+    /// @brief Creates a FromJsonFileBatches with a full set of parameters.
+    ///
+    /// @param source C file handle to a file containing JSON values; it is
+    /// not closed by this object.
+    /// @param options Configuration options for building an array with an
+    /// ArrayBuilder.
+    /// @param buffersize Number of bytes for an intermediate buffer.
+    /// @param nan_string user-defined string for a not-a-number (NaN) value
+    /// representation in JSON format
+    /// @param infinity_string user-defined string for a positive infinity
+    /// representation in JSON format
+    /// @param minus_infinity_string user-defined string for a negative
+    /// infinity representation in JSON format
+    /// @param schema If not `nullptr`, the Form of each output array (see
+    /// FromJsonFile).
+    FromJsonFileBatches(FILE* source,
+                        const ArrayBuilderOptions& options,
+                        int64_t buffersize,
+                        const char* nan_string = nullptr,
+                        const char* infinity_string = nullptr,
+                        const char* minus_infinity_string = nullptr,
+                        const FormPtr& schema = nullptr);
+
+    /// @brief Empty destructor; required for some C++ reason.
+    ~FromJsonFileBatches();
+
+    FromJsonFileBatches(const FromJsonFileBatches&) = delete;
+
+    FromJsonFileBatches&
+      operator=(const FromJsonFileBatches&) = delete;
 
+    /// @brief Parses the next batch of top-level JSON values, each of which
+    /// is an item of the output array, or returns `nullptr` if there are
+    /// none left.
+    ///
+    /// @param max_values Maximum number of values in the batch (no limit if
+    /// not positive).
+    /// @param max_bytes Stop starting new values after this many bytes have
+    /// been read (no limit if not positive).
+    const ContentPtr
+      next(int64_t max_values, int64_t max_bytes);
+
+  private:
+    class Impl;
+    Impl* impl_;
+  };
 }
 
 #endif // AWKWARD_IO_JSON_H_
@@ -13,6 +13,9 @@ make_fromjson(py::module& m, const std::string& name);
 void
 make_fromjsonfile(py::module& m, const std::string& name);
 
+void
+make_fromjsonfile_batches(py::module& m, const std::string& name);
+
 void
 make_uproot_issue_90(py::module& m);
 
@@ -40,6 +40,7 @@ behavior = {}
 from awkward.highlevel import Array
 from awkward.highlevel import Record
 from awkward.highlevel import ArrayBuilder
+from awkward.expr import Expr
 
 # third-party jax connectors
 import awkward._connect._jax
@@ -54,6 +55,7 @@ from awkward.operations.convert import *
 from awkward.operations.describe import *
 from awkward.operations.structure import *
 from awkward.operations.reducers import *
+import awkward.strings
 
 # version
 __version__ = awkward._ext.__version__
@@ -5,6 +5,8 @@ from __future__ import absolute_import
 import distutils.version
 import types
 
+import numpy
+
 import awkward as ak
 
 checked_version = False
@@ -111,5 +113,85 @@ def castint(context, builder, fromtype, totype, val):
         return val
 
 
+def fill_jagged(counts, fill, *args, **kwargs):
+    """
+    Args:
+        counts (array of integers): Length of each output list, such as
+            computed by a first `numba.prange` loop.
+        fill (callable): Function called as `fill(offsets, content, *args)`
+            to write the items of list `i` into
+            `content[offsets[i]:offsets[i + 1]]`; typically a second
+            `numba.prange` loop in an `@numba.njit(parallel=True)` function.
+        args: Other arguments for `fill`, such as the input arrays.
+        dtype (NumPy dtype): Type of the output content; default is
+            `np.float64`.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Makes variable-length lists from two parallel passes, for loops that can't
+    share an #ak.ArrayBuilder between threads: the first pass counts the items
+    in each list, this function allocates the output, and `fill` writes each
+    list into its own part of it, so that the threads never write to the same
+    memory.
+
+        >>> @numba.njit(parallel=True)
+        ... def count(array, counts):
+        ...     for i in numba.prange(len(array)):
+        ...         for x in array[i]:
+        ...             if x > 3:
+        ...                 counts[i] += 1
+        ...
+        >>> @numba.njit(parallel=True)
+        ... def fill(offsets, content, array):
+        ...     for i in numba.prange(len(array)):
+        ...         j = offsets[i]
+        ...         for x in array[i]:
+        ...             if x > 3:
+        ...                 content[j] = x
+        ...                 j += 1
+        ...
+        >>> array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 0.5]])
+        >>> counts = np.zeros(len(array), np.int64)
+        >>> count(array, counts)
+        >>> ak.numba.fill_jagged(counts, fill, array)
+        <Array [[3.3], [], [4.4]] type='3 * var * float64'>
+    """
+    dtype, highlevel, behavior = ak._util.extra(
+        (),
+        kwargs,
+        [("dtype", numpy.float64), ("highlevel", True), ("behavior", None)],
+    )
+
+    counts = numpy.asarray(counts)
+    if counts.ndim != 1 or not issubclass(counts.dtype.type, numpy.integer):
+        raise TypeError(
+            "counts must be a one-dimensional array of integers"
+            + ak._util.exception_suffix(__file__)
+        )
+    if (counts < 0).any():
+        raise ValueError(
+            "counts must be non-negative" + ak._util.exception_suffix(__file__)
+        )
+
+    offsets = numpy.empty(len(counts) + 1, dtype=numpy.int64)
+    offsets[0] = 0
+    numpy.cumsum(counts, out=offsets[1:])
+    content = numpy.empty(offsets[-1], dtype=dtype)
+
+    fill(offsets, content, *args)
+
+    out = ak.layout.ListOffsetArray64(
+        ak.layout.Index64(offsets), ak.layout.NumpyArray(content)
+    )
+    return ak._util.maybe_wrap(out, behavior, highlevel)
+
+
 ak.numba = types.ModuleType("numba")
 ak.numba.register = register
+ak.numba.fill_jagged = fill_jagged
+
+from awkward._connect._numba.layoutbuilder import LayoutBuilder  # noqa: E402
+
+ak.numba.LayoutBuilder = LayoutBuilder
@@ -3,6 +3,7 @@
 from __future__ import absolute_import
 
 import operator
+import weakref
 
 import numba
 import numba.core.typing
@@ -310,6 +311,20 @@ def unbox_Lookup(lookuptype, lookupobj, c):
 ########## ArrayView
 
 
+# views of the arrays passed to Numba, by the identities of their layout and
+# behavior; a view lives as long as some ak.Array holds it as its _numbaview
+views = weakref.WeakValueDictionary()
+
+
+def behavior_items(behavior):
+    # the Numba type of a view includes the contents of its behavior, which can
+    # change (e.g. new entries in ak.behavior) after the type was first made
+    if behavior is None:
+        return None
+    else:
+        return tuple(behavior.items())
+
+
 class ArrayView(object):
     @classmethod
     def fromarray(cls, array):
@@ -320,6 +335,13 @@ class ArrayView(object):
             allow_other=False,
             numpytype=(np.number, bool, np.bool_),
         )
+
+        key = (id(layout), id(behavior))
+        view = views.get(key)
+        if view is not None and view.layout is layout and view.behavior is behavior:
+            return view
+
+        original = layout
         while isinstance(layout, ak.layout.VirtualArray) and isinstance(
             layout.generator, ak.layout.SliceGenerator
         ):
@@ -329,20 +351,19 @@ class ArrayView(object):
         )
 
         if isinstance(layout, ak.partition.PartitionedArray):
-            numba_type = None
-            for part in layout.partitions:
-                if numba_type is None:
-                    numba_type = ak._connect._numba.layout.typeof(part)
-                elif numba_type != ak._connect._numba.layout.typeof(part):
+            partitions = layout.partitions
+            numba_type = ak._connect._numba.layout.typeof(partitions[0])
+            for part in partitions[1:]:
+                if numba_type != ak._connect._numba.layout.typeof(part):
                     raise ValueError(
                         "partitioned arrays can only be used in Numba if all "
                         "partitions have the same numba_type"
                         + ak._util.exception_suffix(__file__)
                     )
-            return PartitionedView(
-                ak._connect._numba.layout.typeof(part),
+            view = PartitionedView(
+                numba_type,
                 behavior,
-                [Lookup(x) for x in layout.partitions],
+                [Lookup(x) for x in partitions],
                 ak.nplike.of(layout).asarray(layout.stops, dtype=np.intp),
                 0,
                 len(layout),
@@ -350,7 +371,7 @@ class ArrayView(object):
             )
 
         else:
-            return ArrayView(
+            view = ArrayView(
                 ak._connect._numba.layout.typeof(layout),
                 behavior,
                 Lookup(layout),
@@ -360,6 +381,11 @@ class ArrayView(object):
                 (),
             )
 
+        # holding the layout (and behavior) keeps their ids from being reused
+        view.layout = original
+        views[key] = view
+        return view
+
     def __init__(self, type, behavior, lookup, pos, start, stop, fields):
         self.type = type
         self.behavior = behavior
@@ -368,6 +394,9 @@ class ArrayView(object):
         self.start = start
         self.stop = stop
         self.fields = fields
+        self.layout = None
+        self.numba_type = None
+        self.numba_type_items = None
 
     def toarray(self):
         layout = self.type.tolayout(self.lookup, self.pos, self.fields)
@@ -377,7 +406,11 @@ class ArrayView(object):
 
 @numba.extending.typeof_impl.register(ArrayView)
 def typeof_ArrayView(obj, c):
-    return ArrayViewType(obj.type, obj.behavior, obj.fields)
+    items = behavior_items(obj.behavior)
+    if obj.numba_type is None or obj.numba_type_items != items:
+        obj.numba_type = ArrayViewType(obj.type, obj.behavior, obj.fields)
+        obj.numba_type_items = items
+    return obj.numba_type
 
 
 def wrap(type, viewtype, fields):
@@ -765,6 +798,7 @@ class RecordView(object):
     def __init__(self, arrayview, at):
         self.arrayview = arrayview
         self.at = at
+        self.numba_type = None
 
     def torecord(self):
         arraylayout = self.arrayview.toarray().layout
@@ -775,7 +809,10 @@ class RecordView(object):
 
 @numba.extending.typeof_impl.register(RecordView)
 def typeof_RecordView(obj, c):
-    return RecordViewType(numba.typeof(obj.arrayview))
+    arrayviewtype = numba.typeof(obj.arrayview)
+    if obj.numba_type is None or obj.numba_type.arrayviewtype is not arrayviewtype:
+        obj.numba_type = RecordViewType(arrayviewtype)
+    return obj.numba_type
 
 
 class RecordViewType(numba.types.Type):
@@ -1259,6 +1296,9 @@ class PartitionedView(object):
         self.start = start
         self.stop = stop
         self.fields = fields
+        self.layout = None
+        self.numba_type = None
+        self.numba_type_items = None
 
     def toarray(self):
         output = []
@@ -1299,7 +1339,11 @@ class PartitionedView(object):
 
 @numba.extending.typeof_impl.register(PartitionedView)
 def typeof_PartitionedView(obj, c):
-    return PartitionedViewType(obj.type, obj.behavior, obj.fields)
+    items = behavior_items(obj.behavior)
+    if obj.numba_type is None or obj.numba_type_items != items:
+        obj.numba_type = PartitionedViewType(obj.type, obj.behavior, obj.fields)
+        obj.numba_type_items = items
+    return obj.numba_type
 
 
 class PartitionedViewType(numba.types.IterableType, numba.types.Sized):
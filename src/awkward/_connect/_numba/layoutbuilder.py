@@ -0,0 +1,371 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import itertools
+import json
+import keyword
+import re
+
+import numpy
+
+import awkward as ak
+
+
+_classes = {}
+_counter = itertools.count()
+
+_identifier = re.compile(r"^[A-Za-z_][A-Za-z_0-9]*$")
+
+_grow = """
+        if self.length{plus} == len(self.{buffer}):
+            {buffer} = numpy.empty(int(len(self.{buffer}) * {resize}) + 1, {dtype})
+            {buffer}[: self.length{plus}] = self.{buffer}[: self.length{plus}]
+            self.{buffer} = {buffer}"""
+
+_numpy_template = """
+class {name}(object):
+    def __init__(self, initial):
+        self.data = numpy.empty(initial, {dtype})
+        self.length = 0
+
+    def append(self, x):{grow}
+        self.data[self.length] = x
+        self.length += 1
+"""
+
+_listoffset_template = """
+class {name}(object):
+    def __init__(self, initial):
+        self.offsets = numpy.empty(initial + 1, numpy.int64)
+        self.offsets[0] = 0
+        self.length = 0
+        self.content = {content}(initial)
+
+    def begin_list(self):
+        return self.content
+
+    def end_list(self):{grow}
+        self.length += 1
+        self.offsets[self.length] = self.content.length
+"""
+
+_indexedoption_template = """
+class {name}(object):
+    def __init__(self, initial):
+        self.index = numpy.empty(initial, numpy.int64)
+        self.length = 0
+        self.content = {content}(initial)
+
+    def append_null(self):{grow}
+        self.index[self.length] = -1
+        self.length += 1
+
+    def append_valid(self):{grow}
+        self.index[self.length] = self.content.length
+        self.length += 1
+        return self.content
+"""
+
+_record_template = """
+class {name}(object):
+    def __init__(self, initial):
+        self.length = 0{fields}
+
+    def end_record(self):
+        self.length += 1
+"""
+
+
+def _field_names(form):
+    if form.istuple:
+        return ["f" + str(i) for i in range(form.numfields)]
+    out = []
+    for key in form.keys():
+        if (
+            _identifier.match(key) is None
+            or keyword.iskeyword(key)
+            or key in ("length", "end_record")
+        ):
+            raise ValueError(
+                "LayoutBuilder record fields must be Python identifiers other "
+                "than 'length' and 'end_record', not {0}".format(repr(key))
+                + ak._util.exception_suffix(__file__)
+            )
+        out.append(key)
+    return out
+
+
+def _dtype(form):
+    if (
+        len(form.inner_shape) != 0
+        or form.primitive.startswith("datetime64")
+        or form.primitive.startswith("timedelta64")
+    ):
+        raise TypeError(
+            "LayoutBuilder does not support NumpyArrays of {0}".format(
+                repr(str(form.type({})))
+            )
+            + ak._util.exception_suffix(__file__)
+        )
+    return numpy.dtype(form.primitive)
+
+
+def _make_class(form, resize, jit):
+    # generates the builder class for this node of the Form (and its contents)
+    name = "{0}Builder{1}".format(type(form).__name__[:-4], next(_counter))
+    namespace = {"numpy": numpy}
+
+    if isinstance(form, ak.forms.NumpyForm):
+        dtype = _dtype(form)
+        namespace["dtype"] = dtype.type
+        code = _numpy_template.format(
+            name=name,
+            dtype="dtype",
+            grow=_grow.format(plus="", buffer="data", resize=resize, dtype="dtype"),
+        )
+        spec = [("data", dtype), ("length", None)]
+
+    elif isinstance(form, ak.forms.ListOffsetForm):
+        namespace["Content"] = _make_class(form.content, resize, jit)
+        code = _listoffset_template.format(
+            name=name,
+            content="Content",
+            grow=_grow.format(
+                plus=" + 1", buffer="offsets", resize=resize, dtype="numpy.int64"
+            ),
+        )
+        spec = [
+            ("offsets", numpy.dtype(numpy.int64)),
+            ("length", None),
+            ("content", namespace["Content"]),
+        ]
+
+    elif isinstance(form, ak.forms.IndexedOptionForm):
+        namespace["Content"] = _make_class(form.content, resize, jit)
+        code = _indexedoption_template.format(
+            name=name,
+            content="Content",
+            grow=_grow.format(
+                plus="", buffer="index", resize=resize, dtype="numpy.int64"
+            ),
+        )
+        spec = [
+            ("index", numpy.dtype(numpy.int64)),
+            ("length", None),
+            ("content", namespace["Content"]),
+        ]
+
+    elif isinstance(form, ak.forms.RecordForm):
+        spec = [("length", None)]
+        fields = ""
+        for i, field in enumerate(_field_names(form)):
+            namespace["Field" + str(i)] = _make_class(form.content(i), resize, jit)
+            fields += "\n        self.{0} = Field{1}(initial)".format(field, i)
+            spec.append((field, namespace["Field" + str(i)]))
+        code = _record_template.format(name=name, fields=fields)
+
+    else:
+        raise TypeError(
+            "LayoutBuilder does not support {0}".format(type(form).__name__)
+            + ak._util.exception_suffix(__file__)
+        )
+
+    exec(code, namespace)
+    cls = namespace[name]
+
+    if jit:
+        import numba
+        import numba.experimental
+
+        numba_spec = []
+        for field, x in spec:
+            if x is None:
+                numba_spec.append((field, numba.int64))
+            elif isinstance(x, numpy.dtype):
+                numba_spec.append((field, numba.from_dtype(x)[::1]))
+            else:
+                numba_spec.append((field, x.class_type.instance_type))
+        cls = numba.experimental.jitclass(numba_spec)(cls)
+
+    return cls
+
+
+def _builder_class(form, resize, jit):
+    key = (form.tojson(False, True), resize, jit)
+    cls = _classes.get(key)
+    if cls is None:
+        cls = _classes[key] = _make_class(form, resize, jit)
+    return cls
+
+
+def _snapshot(form, builder, length):
+    if isinstance(form, ak.forms.NumpyForm):
+        return ak.layout.NumpyArray(builder.data[:length], parameters=form.parameters)
+
+    elif isinstance(form, ak.forms.ListOffsetForm):
+        offsets = builder.offsets[: length + 1]
+        return ak.layout.ListOffsetArray64(
+            ak.layout.Index64(offsets),
+            _snapshot(form.content, builder.content, offsets[-1]),
+            parameters=form.parameters,
+        )
+
+    elif isinstance(form, ak.forms.IndexedOptionForm):
+        index = builder.index[:length]
+        content_length = builder.content.length
+        if length != 0 and index.max() >= content_length:
+            raise ValueError(
+                "LayoutBuilder option node has a valid item with no content "
+                "(append_valid without an append to its content)"
+                + ak._util.exception_suffix(__file__)
+            )
+        return ak.layout.IndexedOptionArray64(
+            ak.layout.Index64(index),
+            _snapshot(form.content, builder.content, content_length),
+            parameters=form.parameters,
+        )
+
+    else:
+        contents = []
+        for i, field in enumerate(_field_names(form)):
+            field_builder = getattr(builder, field)
+            if field_builder.length < length:
+                raise ValueError(
+                    "LayoutBuilder record has {0} items, but its field {1} "
+                    "has only {2}".format(length, repr(field), field_builder.length)
+                    + ak._util.exception_suffix(__file__)
+                )
+            contents.append(_snapshot(form.content(i), field_builder, length))
+        return ak.layout.RecordArray(
+            contents,
+            None if form.istuple else form.keys(),
+            length,
+            parameters=form.parameters,
+        )
+
+
+class LayoutBuilder(object):
+    """
+    Args:
+        form (#ak.forms.Form, dict, or str): Type of the array to build, as a
+            Form or its JSON representation.
+        initial (int): Initial number of items allocated in each buffer.
+        resize (float): Factor by which a full buffer grows; must be
+            greater than 1.
+        jit (None or bool): If True, compile the builder with Numba; if
+            False, build with plain Python objects; if None, compile it if
+            Numba is installed.
+
+    Builds an array of a known type, described by `form`, from Numba or
+    Python code. Unlike an #ak.ArrayBuilder, whose type is discovered as
+    data are appended, every node of this builder has a fixed type: it is a
+    Numba jitclass owning a NumPy buffer and a length, so appending a number
+    in a compiled function is a write into that buffer, rather than a call
+    into the Awkward Array library.
+
+    Pass #ak.numba.LayoutBuilder.builder into compiled functions. Each node
+    of it has methods for its kind of Form:
+
+       * NumpyArray: `append(x)`.
+       * ListOffsetArray: `begin_list()`, which returns the builder of the
+         list content, and `end_list()`.
+       * IndexedOptionArray: `append_null()` and `append_valid()`, which
+         returns the builder of the content (append the value to it next).
+       * RecordArray: an attribute for each field (`f0`, `f1`, ... for
+         tuples), which are builders of the field contents, and
+         `end_record()`, which ends a record after all of its fields have
+         been appended.
+
+    For example,
+
+        >>> form = ak.Array([[{"x": 1.1, "y": [1]}]]).layout.form
+        >>> @numba.njit
+        ... def fill(builder, n):
+        ...     for i in range(n):
+        ...         record = builder.begin_list()
+        ...         for j in range(i):
+        ...             record.x.append(j * 1.1)
+        ...             y = record.y.begin_list()
+        ...             y.append(j)
+        ...             record.y.end_list()
+        ...             record.end_record()
+        ...         builder.end_list()
+        ...
+        >>> layoutbuilder = ak.numba.LayoutBuilder(form)
+        >>> fill(layoutbuilder.builder, 3)
+        >>> layoutbuilder.snapshot()
+        <Array [[], ... y: [0]}, {x: 1.1, y: [1]}]] type='3 * var * {"x": float64, "y": ...'>
+
+    Supported Forms are NumpyForm (one-dimensional, not dates or times),
+    ListOffsetForm (built with 64-bit offsets), IndexedOptionForm (built with
+    a 64-bit index), and RecordForm, nested in any combination. The classes
+    for a given Form are generated and compiled once and reused by all
+    LayoutBuilders of that Form.
+    """
+
+    def __init__(self, form, initial=1024, resize=1.5, jit=None):
+        if isinstance(form, dict):
+            form = ak.forms.Form.fromjson(json.dumps(form))
+        elif ak._util.isstr(form):
+            form = ak.forms.Form.fromjson(form)
+        elif not isinstance(form, ak.forms.Form):
+            raise TypeError(
+                "form must be an ak.forms.Form or its JSON representation"
+                + ak._util.exception_suffix(__file__)
+            )
+        if initial < 1:
+            raise ValueError(
+                "initial must be at least 1" + ak._util.exception_suffix(__file__)
+            )
+        if not resize > 1:
+            raise ValueError(
+                "resize must be greater than 1" + ak._util.exception_suffix(__file__)
+            )
+
+        if jit is None:
+            try:
+                import numba  # noqa: F401
+            except ImportError:
+                jit = False
+            else:
+                jit = True
+        if jit:
+            ak._connect._numba.register_and_check()
+
+        self._form = form
+        self._builder = _builder_class(form, float(resize), bool(jit))(int(initial))
+
+    @property
+    def form(self):
+        """
+        The Form of the arrays that this LayoutBuilder makes.
+        """
+        return self._form
+
+    @property
+    def builder(self):
+        """
+        The root node of the builder, to be passed into Numba-compiled (or
+        Python) functions that fill it.
+        """
+        return self._builder
+
+    def __len__(self):
+        return self._builder.length
+
+    def snapshot(self, highlevel=True, behavior=None):
+        """
+        Args:
+            highlevel (bool): If True, return an #ak.Array; otherwise, return
+                a low-level #ak.layout.Content subclass.
+            behavior (None or dict): Custom #ak.behavior for the output array,
+                if high-level.
+
+        Converts the data appended so far into an array of type
+        #ak.numba.LayoutBuilder.form, without copying. Like
+        #ak.ArrayBuilder.snapshot, it is safe to continue filling the builder
+        after taking a snapshot.
+        """
+        out = _snapshot(self._form, self._builder, self._builder.length)
+        return ak._util.maybe_wrap(out, behavior, highlevel)
@@ -65,6 +65,9 @@ def implements(numpy_function):
 def array_ufunc(ufunc, method, inputs, kwargs):
     if method != "__call__" or len(inputs) == 0 or "out" in kwargs:
         return NotImplemented
+    if any(isinstance(x, ak.expr.Expr) for x in inputs):
+        # let the ak.Expr build a deferred expression instead
+        return NotImplemented
 
     behavior = ak._util.behaviorof(*inputs)
 
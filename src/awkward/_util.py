@@ -599,6 +599,55 @@ def completely_flatten(array):
         )
 
 
+def _buffer_key(array):
+    return (
+        array.__array_interface__["data"][0],
+        array.shape,
+        array.strides,
+        array.dtype.str,
+    )
+
+
+def _broadcast_plan(nplike, inputs):
+    # the cache key and the buffers it refers to, or (None, None) if this set
+    # of inputs can't be cached (or is immediately known not to match)
+    if not isinstance(nplike, ak.nplike.Numpy):
+        return None, None
+
+    key, buffers = [], []
+    for x in inputs:
+        if isinstance(
+            x,
+            (
+                ak.layout.ListOffsetArray32,
+                ak.layout.ListOffsetArrayU32,
+                ak.layout.ListOffsetArray64,
+            ),
+        ):
+            offsets = nplike.asarray(x.offsets)
+            key.append(("offsets", _buffer_key(offsets)))
+            buffers.append(offsets)
+        elif isinstance(
+            x,
+            (
+                ak.layout.ListArray32,
+                ak.layout.ListArrayU32,
+                ak.layout.ListArray64,
+            ),
+        ):
+            starts, stops = nplike.asarray(x.starts), nplike.asarray(x.stops)
+            key.append(("starts", _buffer_key(starts), _buffer_key(stops)))
+            buffers.extend([starts, stops])
+        elif isinstance(x, ak.layout.RegularArray):
+            key.append(("regular", x.size, len(x), len(x.content)))
+        elif isinstance(x, ak.layout.Content):
+            return None, None
+        else:
+            key.append(None)
+
+    return tuple(key), buffers
+
+
 def broadcast_and_apply(  # noqa: C901
     inputs,
     getfunction,
@@ -612,6 +661,11 @@ def broadcast_and_apply(  # noqa: C901
     numpy_to_regular=False,
     regular_to_jagged=False,
 ):
+    # verdicts of all_same_offsets during this call, keyed by the identities of
+    # the compared buffers, which are kept alive until it returns so that their
+    # addresses can't be reused by different data
+    plans = {}
+
     def checklength(inputs):
         length = len(inputs[0])
         for x in inputs[1:]:
@@ -625,6 +679,21 @@ def broadcast_and_apply(  # noqa: C901
                 )
 
     def all_same_offsets(nplike, inputs):
+        key, buffers = _broadcast_plan(nplike, inputs)
+        if key is None:
+            return compare_offsets(nplike, inputs)
+
+        # fields of the same record array share their offsets buffer
+        lists = [x for x in key if x is not None]
+        if all(x[0] == "offsets" for x in lists) and len(set(lists)) == 1:
+            return True
+
+        plan = plans.get(key)
+        if plan is None:
+            plan = plans[key] = (compare_offsets(nplike, inputs), buffers)
+        return plan[0]
+
+    def compare_offsets(nplike, inputs):
         offsets = None
         for x in inputs:
             if isinstance(
@@ -18,7 +18,7 @@ class _HashableDict(object):
     def __init__(self, obj):
         self.keys = tuple(sorted(obj))
         self.values = tuple(_hashable(obj[k]) for k in self.keys)
-        self.hash = hash((_HashableDict,) + self.keys, self.values)
+        self.hash = hash((_HashableDict,) + self.keys + self.values)
 
     def __hash__(self):
         return self.hash
@@ -54,6 +54,55 @@ def _hashable(obj):
         return obj
 
 
+def _first_appearance(codes):
+    # renumber codes in order of first appearance and flag the first ones
+    nplike = ak.nplike.of(codes)
+    _, first, inverse = nplike.unique(codes, return_index=True, return_inverse=True)
+    rank = nplike.empty(len(first), dtype=np.int64)
+    rank[nplike.argsort(first)] = nplike.arange(len(first), dtype=np.int64)
+    is_first = nplike.zeros(len(codes), dtype=np.bool_)
+    is_first[first] = True
+    return is_first, rank[inverse]
+
+
+def _remap(one, two):
+    # position of each of one's categories among two's categories, len(two) if
+    # it is missing, and -1 at the end so that a -1 index (None) maps to -1
+    nplike = ak.nplike.of(one, two)
+
+    codes = None
+    try:
+        both = ak.operations.structure.concatenate([one, two], highlevel=False)
+    except ValueError:
+        pass
+    else:
+        codes = ak.operations.structure._factorize(both)
+
+    if codes is None:
+        one_list = ak.operations.convert.to_list(one)
+        two_list = ak.operations.convert.to_list(two)
+        one_hashable = [_hashable(x) for x in one_list]
+        two_hashable = [_hashable(x) for x in two_list]
+        two_lookup = {x: i for i, x in enumerate(two_hashable)}
+
+        one_to_two = nplike.empty(len(one_hashable) + 1, dtype=np.int64)
+        for i, x in enumerate(one_hashable):
+            one_to_two[i] = two_lookup.get(x, len(two_hashable))
+        one_to_two[-1] = -1
+
+    else:
+        codes = nplike.unique(codes, return_inverse=True)[1]
+        one_codes, two_codes = codes[: len(one)], codes[len(one) :]
+        lookup = nplike.full(len(codes), len(two), dtype=np.int64)
+        lookup[two_codes] = nplike.arange(len(two), dtype=np.int64)
+
+        one_to_two = nplike.empty(len(one) + 1, dtype=np.int64)
+        one_to_two[:-1] = lookup[one_codes]
+        one_to_two[-1] = -1
+
+    return one_to_two
+
+
 def _categorical_equal(one, two):
     behavior = ak._util.behaviorof(one, two)
 
@@ -75,17 +124,7 @@ def _categorical_equal(one, two):
         one_mapped = one_index
 
     else:
-        one_list = ak.operations.convert.to_list(one_content)
-        two_list = ak.operations.convert.to_list(two_content)
-        one_hashable = [_hashable(x) for x in one_list]
-        two_hashable = [_hashable(x) for x in two_list]
-        two_lookup = {x: i for i, x in enumerate(two_hashable)}
-
-        one_to_two = ak.nplike.numpy.empty(len(one_hashable) + 1, dtype=np.int64)
-        for i, x in enumerate(one_hashable):
-            one_to_two[i] = two_lookup.get(x, len(two_hashable))
-        one_to_two[-1] = -1
-
+        one_to_two = _remap(one.content, two.content)
         one_mapped = one_to_two[one_index]
 
     out = one_mapped == two_index
@@ -229,9 +268,10 @@ def to_categorical(array, highlevel=True):
         >>> ak.to_list(categorical_records) == ak.to_list(records)
         True
 
-    The check for uniqueness is currently implemented in a Python loop, so
-    conversion to categorical should be regarded as expensive. (This can
-    change, but it would always be an _n log(n)_ operation.)
+    Numbers and strings are deduplicated with vectorized sorting, an
+    _n log(n)_ operation; other categories, such as records or lists of
+    numbers, are checked for uniqueness in a Python loop, so their conversion
+    to categorical should be regarded as expensive.
 
     See also #ak.is_categorical, #ak.categories, #ak.from_categorical.
     """
@@ -254,20 +294,25 @@ def to_categorical(array, highlevel=True):
                 content = layout
                 cls = ak.layout.IndexedArray64
 
-            content_list = ak.operations.convert.to_list(content)
-            hashable = [_hashable(x) for x in content_list]
-
-            lookup = {}
-            is_first = ak.nplike.numpy.empty(len(hashable), dtype=np.bool_)
-            mapping = ak.nplike.numpy.empty(len(hashable), dtype=np.int64)
-            for i, x in enumerate(hashable):
-                if x in lookup:
-                    is_first[i] = False
-                    mapping[i] = lookup[x]
-                else:
-                    is_first[i] = True
-                    lookup[x] = j = len(lookup)
-                    mapping[i] = j
+            codes = ak.operations.structure._factorize(content)
+            if codes is not None:
+                is_first, mapping = _first_appearance(codes)
+
+            else:
+                content_list = ak.operations.convert.to_list(content)
+                hashable = [_hashable(x) for x in content_list]
+
+                lookup = {}
+                is_first = ak.nplike.numpy.empty(len(hashable), dtype=np.bool_)
+                mapping = ak.nplike.numpy.empty(len(hashable), dtype=np.int64)
+                for i, x in enumerate(hashable):
+                    if x in lookup:
+                        is_first[i] = False
+                        mapping[i] = lookup[x]
+                    else:
+                        is_first[i] = True
+                        lookup[x] = j = len(lookup)
+                        mapping[i] = j
 
             if isinstance(layout, ak._util.indexedoptiontypes):
                 original_index = ak.nplike.numpy.asarray(layout.index)
@@ -119,10 +119,70 @@ ak.behavior["string"] = StringBehavior
 ak.behavior["__typestr__", "string"] = "string"
 
 
+def _string_buffers(layout, nplike):
+    if isinstance(
+        layout, (ak.layout.ListArray32, ak.layout.ListArrayU32, ak.layout.ListArray64)
+    ):
+        starts = nplike.asarray(layout.starts)
+        stops = nplike.asarray(layout.stops)
+    else:
+        layout = layout.toListOffsetArray64(False)
+        offsets = nplike.asarray(layout.offsets)
+        starts, stops = offsets[:-1], offsets[1:]
+
+    return (
+        nplike.ascontiguousarray(nplike.asarray(layout.content)),
+        starts.astype(np.int64, copy=False),
+        stops.astype(np.int64, copy=False),
+    )
+
+
+def _string_compare(one, two):
+    # -1, 0, or 1 for each pair of strings, comparing bytes (which is code
+    # point order for UTF-8) in one pass over both offsets arrays
+    nplike = ak.nplike.of(one, two)
+    one, two = one.layout, two.layout
+
+    leftdata, leftstarts, leftstops = _string_buffers(one, nplike)
+    rightdata, rightstarts, rightstops = _string_buffers(two, nplike)
+
+    out = nplike.empty(len(one), dtype=np.int8)
+    error = nplike[
+        "awkward_ListArray_compare_strings",
+        np.int8,
+        np.uint8,
+        np.int64,
+        np.int64,
+        np.uint8,
+        np.int64,
+        np.int64,
+    ](
+        out,
+        leftdata,
+        leftstarts,
+        leftstops,
+        rightdata,
+        rightstarts,
+        rightstops,
+        len(one),
+    )
+    if error.str is not None:
+        raise ValueError(
+            error.str.decode("utf-8", "surrogateescape")
+            + ak._util.exception_suffix(__file__)
+        )
+
+    return out
+
+
 def _string_equal(one, two):
     nplike = ak.nplike.of(one, two)
     behavior = ak._util.behaviorof(one, two)
 
+    if isinstance(nplike, ak.nplike.Numpy):
+        out = _string_compare(one, two) == 0
+        return ak._util.wrap(ak.layout.NumpyArray(out), behavior)
+
     one, two = ak.without_parameters(one).layout, ak.without_parameters(two).layout
 
     # first condition: string lengths must be the same
@@ -151,10 +211,37 @@ def _string_notequal(one, two):
     return ~_string_equal(one, two)
 
 
-ak.behavior[ak.nplike.numpy.equal, "bytestring", "bytestring"] = _string_equal
-ak.behavior[ak.nplike.numpy.equal, "string", "string"] = _string_equal
-ak.behavior[ak.nplike.numpy.not_equal, "bytestring", "bytestring"] = _string_notequal
-ak.behavior[ak.nplike.numpy.not_equal, "string", "string"] = _string_notequal
+def _string_less(one, two):
+    behavior = ak._util.behaviorof(one, two)
+    out = _string_compare(one, two) < 0
+    return ak._util.wrap(ak.layout.NumpyArray(out), behavior)
+
+
+def _string_less_equal(one, two):
+    behavior = ak._util.behaviorof(one, two)
+    out = _string_compare(one, two) <= 0
+    return ak._util.wrap(ak.layout.NumpyArray(out), behavior)
+
+
+def _string_greater(one, two):
+    behavior = ak._util.behaviorof(one, two)
+    out = _string_compare(one, two) > 0
+    return ak._util.wrap(ak.layout.NumpyArray(out), behavior)
+
+
+def _string_greater_equal(one, two):
+    behavior = ak._util.behaviorof(one, two)
+    out = _string_compare(one, two) >= 0
+    return ak._util.wrap(ak.layout.NumpyArray(out), behavior)
+
+
+for _name in ("bytestring", "string"):
+    ak.behavior[ak.nplike.numpy.equal, _name, _name] = _string_equal
+    ak.behavior[ak.nplike.numpy.not_equal, _name, _name] = _string_notequal
+    ak.behavior[ak.nplike.numpy.less, _name, _name] = _string_less
+    ak.behavior[ak.nplike.numpy.less_equal, _name, _name] = _string_less_equal
+    ak.behavior[ak.nplike.numpy.greater, _name, _name] = _string_greater
+    ak.behavior[ak.nplike.numpy.greater_equal, _name, _name] = _string_greater_equal
 
 
 def _string_broadcast(layout, offsets):
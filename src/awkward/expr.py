@@ -0,0 +1,388 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import numbers
+
+import numpy
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+_numexpr_binary = {
+    numpy.add: "({0} + {1})",
+    numpy.subtract: "({0} - {1})",
+    numpy.multiply: "({0} * {1})",
+    numpy.true_divide: "({0} / {1})",
+    numpy.power: "({0} ** {1})",
+    numpy.equal: "({0} == {1})",
+    numpy.not_equal: "({0} != {1})",
+    numpy.less: "({0} < {1})",
+    numpy.less_equal: "({0} <= {1})",
+    numpy.greater: "({0} > {1})",
+    numpy.greater_equal: "({0} >= {1})",
+    numpy.bitwise_and: "({0} & {1})",
+    numpy.bitwise_or: "({0} | {1})",
+    numpy.arctan2: "arctan2({0}, {1})",
+}
+
+_numexpr_unary = {
+    numpy.negative: "(-{0})",
+    numpy.absolute: "abs({0})",
+}
+for _name in (
+    "sqrt",
+    "exp",
+    "expm1",
+    "log",
+    "log10",
+    "log1p",
+    "sin",
+    "cos",
+    "tan",
+    "arcsin",
+    "arccos",
+    "arctan",
+    "sinh",
+    "cosh",
+    "tanh",
+    "arcsinh",
+    "arccosh",
+    "arctanh",
+):
+    _numexpr_unary[getattr(numpy, _name)] = _name + "({0})"
+
+_numexpr_dtypes = (np.bool_, np.int32, np.int64, np.float32, np.float64)
+
+
+class _NotFusable(Exception):
+    pass
+
+
+class Expr(ak._connect._numpy.NDArrayOperatorsMixin):
+    """
+    Args:
+        array: Data to use in a deferred expression (anything #ak.Array
+            accepts, including another #ak.Expr).
+        behavior (None or dict): Custom #ak.behavior for the evaluated
+            output.
+
+    An unevaluated expression of NumPy ufuncs (including operators, such as
+    `+` and `>`) on Awkward Arrays. Applying a ufunc to an #ak.Expr makes a
+    new #ak.Expr instead of computing anything; #ak.Expr.evaluate computes
+    the whole expression at once.
+
+        >>> events = ak.Array([
+        ...     [{"x": 1.1, "y": 2.2}, {"x": 3.3, "y": 4.4}], [], [{"x": 5.5, "y": 6.6}]
+        ... ])
+        >>> e = ak.Expr(events)
+        >>> selection = np.sqrt(e.x**2 + e.y**2) > 3
+        >>> selection
+        <Expr greater(sqrt(add(power(x, 2), power(y, 2))), 3)>
+        >>> selection.evaluate()
+        <Array [[False, True], [], [True]] type='3 * var * bool'>
+
+    Computing the same expression directly on `events` broadcasts the
+    nested lists of each operation's arguments separately and builds a new
+    array after every step. An #ak.Expr broadcasts all of its arrays once and
+    applies the whole expression to the flat numerical buffers. With the
+    numexpr package installed, supported expressions run in a single numexpr
+    pass; otherwise, NumPy evaluates each ufunc in turn, but writes into the
+    expression's own temporary buffers where possible, rather than
+    allocating new ones.
+
+    Only ufuncs are deferred; field access (`e.x` or `e["x"]`) and slicing
+    are only allowed before any ufunc has been applied. If the arrays contain
+    strings, records, or other data with custom ufunc behaviors, the
+    expression is evaluated step by step, like ordinary arrays.
+    """
+
+    def __init__(self, array, behavior=None):
+        if isinstance(array, Expr):
+            self._ufunc = array._ufunc
+            self._inputs = array._inputs
+            self._kwargs = array._kwargs
+            self._name = array._name
+            self._behavior = array._behavior if behavior is None else behavior
+        else:
+            self._ufunc = None
+            self._inputs = (array,)
+            self._kwargs = {}
+            self._name = None
+            self._behavior = behavior
+
+    @classmethod
+    def _node(cls, ufunc, inputs, kwargs):
+        out = cls.__new__(cls)
+        out._ufunc = ufunc
+        out._inputs = tuple(
+            x if isinstance(x, (Expr, numbers.Number, np.generic)) else Expr(x)
+            for x in inputs
+        )
+        out._kwargs = kwargs
+        out._name = None
+        out._behavior = None
+        for x in out._inputs:
+            if isinstance(x, Expr) and x._behavior is not None:
+                out._behavior = x._behavior
+        return out
+
+    @property
+    def is_leaf(self):
+        """
+        True if this #ak.Expr is an array, rather than the result of a ufunc.
+        """
+        return self._ufunc is None
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or "out" in kwargs or ufunc.nout != 1:
+            return NotImplemented
+        return Expr._node(ufunc, inputs, kwargs)
+
+    def __getitem__(self, where):
+        if not self.is_leaf:
+            raise TypeError(
+                "only arrays in an ak.Expr can be sliced, not the results of "
+                "ufuncs; slice before applying ufuncs"
+                + ak._util.exception_suffix(__file__)
+            )
+        array = self._inputs[0]
+        if not isinstance(array, (ak.highlevel.Array, ak.highlevel.Record)):
+            array = ak.highlevel.Array(array, behavior=self._behavior)
+        out = Expr(array[where], self._behavior)
+        if ak._util.isstr(where):
+            out._name = where if self._name is None else self._name + "." + where
+        return out
+
+    def __getattr__(self, where):
+        if where.startswith("_"):
+            raise AttributeError(where)
+        if self.is_leaf:
+            try:
+                return self[where]
+            except (ValueError, TypeError):
+                pass
+        raise AttributeError(
+            "no field named {0}".format(repr(where))
+            + ak._util.exception_suffix(__file__)
+        )
+
+    def __repr__(self):
+        return "<Expr {0}>".format(self._repr())
+
+    def _repr(self):
+        if self.is_leaf:
+            return "array" if self._name is None else self._name
+        else:
+            return "{0}({1})".format(
+                self._ufunc.__name__,
+                ", ".join(
+                    x._repr() if isinstance(x, Expr) else repr(x) for x in self._inputs
+                ),
+            )
+
+    def _leaves(self, leaves):
+        for x in self._inputs:
+            if isinstance(x, Expr):
+                if x.is_leaf:
+                    if not any(x is y for y in leaves):
+                        leaves.append(x)
+                else:
+                    x._leaves(leaves)
+        return leaves
+
+    def _numexpr_string(self, leaves, constants):
+        # None if numexpr can't compute this expression
+        if self._kwargs:
+            return None
+        if self._ufunc in _numexpr_binary:
+            template = _numexpr_binary[self._ufunc]
+        elif self._ufunc in _numexpr_unary:
+            template = _numexpr_unary[self._ufunc]
+        else:
+            return None
+
+        args = []
+        for x in self._inputs:
+            if isinstance(x, Expr) and x.is_leaf:
+                index = [i for i, y in enumerate(leaves) if x is y][0]
+                args.append("leaf{0}".format(index))
+            elif isinstance(x, Expr):
+                arg = x._numexpr_string(leaves, constants)
+                if arg is None:
+                    return None
+                args.append(arg)
+            else:
+                args.append("constant{0}".format(len(constants)))
+                constants.append(x)
+        return template.format(*args)
+
+    def _evaluate_numpy(self, leaves, buffers):
+        # returns the result and whether it is a temporary of this expression
+        args = []
+        for x in self._inputs:
+            if isinstance(x, Expr) and x.is_leaf:
+                index = [i for i, y in enumerate(leaves) if x is y][0]
+                args.append((buffers[index], False))
+            elif isinstance(x, Expr):
+                args.append(x._evaluate_numpy(leaves, buffers))
+            else:
+                args.append((x, False))
+
+        arrays = [x for x, _ in args]
+        probe = self._ufunc(
+            *[x[:0] if isinstance(x, numpy.ndarray) else x for x in arrays],
+            **self._kwargs
+        )
+        shape = numpy.broadcast(*arrays).shape
+
+        for x, is_temporary in args:
+            if is_temporary and x.dtype == probe.dtype and x.shape == shape:
+                return self._ufunc(*arrays, out=x, **self._kwargs), True
+        return self._ufunc(*arrays, **self._kwargs), True
+
+    def _evaluate_numexpr(self, numexpr, expression, constants, leaves, buffers):
+        # None if numexpr can't compute this expression with the same result
+        # type as NumPy (e.g. it casts float32 with Python floats to float64)
+        def local_dict(buffers):
+            out = dict(("leaf{0}".format(i), x) for i, x in enumerate(buffers))
+            for i, x in enumerate(constants):
+                out["constant{0}".format(i)] = x
+            return out
+
+        empty = [x[:0] for x in buffers]
+        expected, _ = self._evaluate_numpy(leaves, empty)
+        try:
+            probe = numexpr.evaluate(expression, local_dict(empty), {})
+        except (TypeError, ValueError, KeyError, NotImplementedError):
+            return None
+        if probe.dtype != expected.dtype:
+            return None
+
+        return numexpr.evaluate(expression, local_dict(buffers), {})
+
+    def _evaluate_eager(self, arrays, leaves):
+        args = []
+        for x in self._inputs:
+            if isinstance(x, Expr) and x.is_leaf:
+                args.append(arrays[[i for i, y in enumerate(leaves) if x is y][0]])
+            elif isinstance(x, Expr):
+                args.append(x._evaluate_eager(arrays, leaves))
+            else:
+                args.append(x)
+        return self._ufunc(*args, **self._kwargs)
+
+    def evaluate(self, engine=None, highlevel=True, behavior=None):
+        """
+        Args:
+            engine (None, "numexpr", or "numpy"): Library that computes the
+                expression on the broadcasted buffers. If None, numexpr is
+                used if it is installed, supports all of the ufuncs and
+                types in the expression, and returns the same type as NumPy
+                would; otherwise, NumPy. If "numexpr" and these conditions
+                are not met, this is a ValueError.
+            highlevel (bool): If True, return an #ak.Array; otherwise, return
+                a low-level #ak.layout.Content subclass.
+            behavior (None or dict): Custom #ak.behavior for the output array,
+                if high-level.
+
+        Computes the expression and returns the result as an array.
+        """
+        if engine not in (None, "numexpr", "numpy"):
+            raise ValueError(
+                "engine must be None, 'numexpr', or 'numpy', not {0}".format(
+                    repr(engine)
+                )
+                + ak._util.exception_suffix(__file__)
+            )
+        if behavior is None:
+            behavior = self._behavior
+
+        if self.is_leaf:
+            out = ak.operations.convert.to_layout(
+                self._inputs[0], allow_record=False, allow_other=False
+            )
+            return ak._util.maybe_wrap_like(out, self._inputs[0], behavior, highlevel)
+
+        leaves = self._leaves([])
+        layouts = [
+            ak.operations.convert.to_layout(
+                x._inputs[0], allow_record=False, allow_other=False
+            )
+            for x in leaves
+        ]
+        behavior = ak._util.behaviorof(
+            *[x._inputs[0] for x in leaves], behavior=behavior
+        )
+
+        constants = []
+        expression = None
+        if engine != "numpy":
+            expression = self._numexpr_string(leaves, constants)
+            if expression is None and engine == "numexpr":
+                raise ValueError(
+                    "expression {0} cannot be computed by numexpr".format(self._repr())
+                    + ak._util.exception_suffix(__file__)
+                )
+            if expression is not None:
+                try:
+                    numexpr = ak._connect._numexpr.import_numexpr()
+                except ImportError:
+                    if engine == "numexpr":
+                        raise
+                    expression = None
+
+        def getfunction(inputs):
+            if any(
+                isinstance(x, ak.layout.Content)
+                and (
+                    x.parameter("__array__") is not None
+                    or x.parameter("__record__") is not None
+                    or isinstance(x, ak.layout.RecordArray)
+                    or (
+                        isinstance(x, ak.layout.NumpyArray)
+                        and x.format.upper().startswith("M")
+                    )
+                )
+                for x in inputs
+            ):
+                raise _NotFusable()
+
+            elif all(isinstance(x, ak.layout.NumpyArray) for x in inputs):
+                nplike = ak.nplike.of(*inputs)
+                buffers = [nplike.asarray(x) for x in inputs]
+
+                result = None
+                if expression is not None and all(
+                    issubclass(x.dtype.type, _numexpr_dtypes) for x in buffers
+                ):
+                    result = self._evaluate_numexpr(
+                        numexpr, expression, constants, leaves, buffers
+                    )
+                if result is None and engine == "numexpr":
+                    raise ValueError(
+                        "numexpr does not support the types in this expression "
+                        "or would not compute them with the same types as NumPy"
+                        + ak._util.exception_suffix(__file__)
+                    )
+                elif result is None:
+                    result, _ = self._evaluate_numpy(leaves, buffers)
+
+                return lambda: (ak.layout.NumpyArray(result),)
+
+            else:
+                return None
+
+        try:
+            out = ak._util.broadcast_and_apply(
+                layouts, getfunction, behavior, pass_depth=False
+            )
+        except _NotFusable:
+            arrays = [ak._util.wrap(x, behavior) for x in layouts]
+            out = self._evaluate_eager(arrays, leaves)
+            return ak._util.maybe_wrap(out.layout, behavior, highlevel)
+
+        assert isinstance(out, tuple) and len(out) == 1
+        return ak._util.maybe_wrap(out[0], behavior, highlevel)
@@ -359,6 +359,7 @@ class Array(
     def behavior(self, behavior):
         if behavior is None or isinstance(behavior, dict):
             self._behavior = behavior
+            self._numbaview = None
         else:
             raise TypeError(
                 "behavior must be None or a dict" + ak._util.exception_suffix(__file__)
@@ -1449,16 +1450,18 @@ class Array(
         See [Numba documentation](https://numba.pydata.org/numba-doc/dev/reference/types.html)
         on types and signatures.
         """
-        import awkward._connect._numba  # noqa: F401
-
-        ak._connect._numba.register_and_check()
         if self._numbaview is None:
+            import awkward._connect._numba  # noqa: F401
+
+            ak._connect._numba.register_and_check()
             self._numbaview = ak._connect._numba.arrayview.ArrayView.fromarray(self)
         import numba
 
         return numba.typeof(self._numbaview)
 
     def __getstate__(self):
+        # The buffers are NumPy arrays that share memory with a packed layout, so
+        # pickle protocol 5 passes them out-of-band (PickleBuffer) without copies.
         packed = ak.operations.structure.packed(self.layout, highlevel=False)
         form, length, container = ak.operations.convert.to_buffers(packed)
         if self._behavior is ak.behavior:
@@ -1673,6 +1676,7 @@ class Record(ak._connect._numpy.NDArrayOperatorsMixin):
     def behavior(self, behavior):
         if behavior is None or isinstance(behavior, dict):
             self._behavior = behavior
+            self._numbaview = None
         else:
             raise TypeError(
                 "behavior must be None or a dict" + ak._util.exception_suffix(__file__)
@@ -2046,10 +2050,10 @@ class Record(ak._connect._numpy.NDArrayOperatorsMixin):
         See [Numba documentation](https://numba.pydata.org/numba-doc/dev/reference/types.html)
         on types and signatures.
         """
-        import awkward._connect._numba  # noqa: F401
-
-        ak._connect._numba.register_and_check()
         if self._numbaview is None:
+            import awkward._connect._numba  # noqa: F401
+
+            ak._connect._numba.register_and_check()
             self._numbaview = ak._connect._numba.arrayview.RecordView.fromrecord(self)
         import numba
 
@@ -401,6 +401,10 @@ class Numpy(NumpyLike):
     def ndarray(self):
         return self._module.ndarray
 
+    def memmap(self, *args, **kwargs):
+        # filename[, dtype=[, mode=]]
+        return self._module.memmap(*args, **kwargs)
+
 
 class Cupy(NumpyLike):
     def to_rectilinear(self, array, *args, **kwargs):
@@ -2,6 +2,8 @@
 
 from __future__ import absolute_import
 
+import numbers
+
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
@@ -832,6 +834,226 @@ def argmax(array, axis=None, keepdims=False, mask_identity=True):
 # reducers and ufuncs.
 
 
+def _moments_data(field):
+    # Returns the values of a record field as float64 and the mask of
+    # missing values (or None), or (None, None) if the field is not numeric.
+    numpy = ak.nplike.Numpy.instance()
+    missing = None
+    if isinstance(field, ak._util.optiontypes):
+        missing = numpy.asarray(field.bytemask()).view(np.bool_)
+        if not isinstance(field, ak._util.indexedoptiontypes):
+            field = field.toIndexedOptionArray64()
+    if isinstance(field, ak._util.indexedoptiontypes + ak._util.indexedtypes):
+        index = numpy.asarray(field.index).astype(np.int64)
+        field = field.content
+    else:
+        index = None
+
+    if (
+        not isinstance(field, ak.layout.NumpyArray)
+        or field.ndim != 1
+        or len(field.parameters) != 0
+    ):
+        return None, None
+    data = numpy.asarray(field)
+    if not (data.dtype.kind in "biu" or data.dtype == np.float64):
+        return None, None
+
+    if index is not None:
+        if len(data) == 0:
+            data = numpy.zeros(len(index), dtype=np.float64)
+        else:
+            # missing values (index -1) pick an arbitrary value; they are skipped
+            data = data[index]
+    return numpy.asarray(data, dtype=np.float64), missing
+
+
+def _moments_wrapper(layout):
+    # Returns a function that puts a new content in `layout`'s place.
+    if isinstance(layout, ak._util.listtypes):
+        if isinstance(layout, ak.layout.RegularArray):
+            return lambda content: ak.layout.RegularArray(
+                content, layout.size, len(layout)
+            )
+        elif isinstance(
+            layout,
+            (ak.layout.ListArray32, ak.layout.ListArrayU32, ak.layout.ListArray64),
+        ):
+            return lambda content: type(layout)(layout.starts, layout.stops, content)
+        else:
+            return lambda content: type(layout)(layout.offsets, content)
+
+    else:
+        if isinstance(layout, ak._util.optiontypes) and not isinstance(
+            layout, ak._util.indexedoptiontypes
+        ):
+            layout = layout.toIndexedOptionArray64()
+        return lambda content: type(layout)(layout.index, content).simplify()
+
+
+def _moments(x, y, weight, axis, n=None):
+    """
+    Computes the sums of weights and the weighted means and central
+    (co)moments of `x` and `y` (and the `n`th moment of `x`) in a single pass
+    with `ak._ext.reduce_moments`.
+
+    Only `axis=None` and the innermost dimension of lists of numbers are
+    computed this way; returns None for anything else, in which case the
+    statistics are computed from separate calls to #ak.sum and #ak.count.
+
+    Otherwise, it returns a `(sums, finish)` pair, in which `sums` is a dict
+    of NumPy arrays, one value per reduced list, and
+    `finish(values, keepdims, mask_identity)` puts an array of such values
+    into the structure that the reducers would return.
+    """
+    arrays = {"x": x}
+    if y is not None:
+        arrays["y"] = y
+    if weight is not None:
+        arrays["weight"] = weight
+
+    layouts = {}
+    for name, array in arrays.items():
+        layout = ak.operations.convert.to_layout(
+            array, allow_record=False, allow_other=True
+        )
+        if isinstance(layout, ak.layout.Content):
+            if not isinstance(ak.nplike.of(layout), ak.nplike.Numpy):
+                return None
+        elif name != "weight" or not isinstance(layout, numbers.Real):
+            return None
+        layouts[name] = layout
+
+    mindepth, depth = layouts["x"].minmax_depth
+    if mindepth != depth:
+        return None
+    if y is not None and layouts["y"].minmax_depth != (depth, depth):
+        return None
+    if axis is not None:
+        if isinstance(layouts.get("weight"), ak.layout.Content):
+            if layouts["weight"].minmax_depth[1] > depth:
+                return None
+        if axis != -1 and axis != depth - 1:
+            return None
+
+    # A scalar weight is not zipped with the arrays; it is filled in below.
+    scalar_weight = layouts.get("weight")
+    if isinstance(scalar_weight, ak.layout.Content):
+        scalar_weight = None
+    else:
+        layouts.pop("weight", None)
+    zipped = ak.operations.structure.zip(layouts, highlevel=False)
+
+    # Find the innermost lists (or flatten everything for a single result),
+    # remembering how to rebuild the nodes above them.
+    wrappers = []
+    node = zipped
+    while not isinstance(node, ak.layout.RecordArray):
+        if isinstance(node, ak._util.virtualtypes):
+            node = node.array
+            continue
+        elif len(node.parameters) != 0:
+            return None
+        elif axis is None or depth == 1:
+            if isinstance(node, ak._util.listtypes):
+                node = node.flatten(axis=1)
+            elif isinstance(node, ak._util.optiontypes + ak._util.indexedtypes):
+                node = node.project()
+            else:
+                return None
+        elif isinstance(node, ak._util.listtypes) and isinstance(
+            node.content, ak.layout.RecordArray
+        ):
+            break
+        elif isinstance(node, ak._util.listtypes + ak._util.indexedtypes) or (
+            isinstance(node, ak._util.optiontypes)
+        ):
+            wrappers.append(_moments_wrapper(node))
+            node = node.content
+        else:
+            return None
+
+    nplike = ak.nplike.Numpy.instance()
+    if isinstance(node, ak.layout.RecordArray):
+        record = node
+        starts = nplike.array([0], dtype=np.int64)
+        stops = nplike.array([len(record)], dtype=np.int64)
+    else:
+        record = node.content
+        if isinstance(node, ak.layout.RegularArray):
+            starts = nplike.arange(len(node), dtype=np.int64) * node.size
+            stops = starts + node.size
+        elif isinstance(
+            node,
+            (ak.layout.ListArray32, ak.layout.ListArrayU32, ak.layout.ListArray64),
+        ):
+            starts = nplike.asarray(node.starts).astype(np.int64)
+            stops = nplike.asarray(node.stops).astype(np.int64)
+        else:
+            offsets = nplike.asarray(node.offsets).astype(np.int64)
+            starts = offsets[:-1]
+            stops = offsets[1:]
+
+    if len(record.parameters) != 0:
+        return None
+    data = {}
+    valid = None
+    for name in layouts:
+        data[name], missing = _moments_data(record.field(name))
+        if data[name] is None:
+            return None
+        if missing is not None:
+            # x and y are averaged separately, so they must not be missing
+            # in different places.
+            if y is not None and name != "weight":
+                return None
+            if valid is None:
+                valid = ~missing
+            else:
+                valid &= ~missing
+
+    if scalar_weight is not None:
+        data["weight"] = nplike.full(len(data["x"]), scalar_weight, dtype=np.float64)
+
+    sums = dict(
+        zip(
+            ("count", "sumw", "meanx", "meany", "cxx", "cyy", "cxy", "sumwxn"),
+            ak._ext.reduce_moments(
+                starts,
+                stops,
+                data["x"],
+                data.get("y"),
+                data.get("weight"),
+                None if valid is None else valid.view(np.uint8),
+                n,
+            ),
+        )
+    )
+    behavior = ak._util.behaviorof(*arrays.values())
+
+    def finish(values, keepdims, mask_identity):
+        if axis is None or (depth == 1 and not keepdims):
+            if axis is not None and mask_identity and sums["count"][0] == 0:
+                return None
+            return values[0]
+
+        out = ak.layout.NumpyArray(values)
+        if mask_identity:
+            index = nplike.arange(len(values), dtype=np.int64)
+            index[sums["count"] == 0] = -1
+            out = ak.layout.IndexedOptionArray64(ak.layout.Index64(index), out)
+        if keepdims and isinstance(node, ak.layout.RegularArray):
+            out = ak.layout.RegularArray(out, 1, len(values))
+        elif keepdims and depth != 1:
+            offsets = nplike.arange(len(values) + 1, dtype=np.int64)
+            out = ak.layout.ListOffsetArray64(ak.layout.Index64(offsets), out)
+        for wrapper in wrappers[::-1]:
+            out = wrapper(out)
+        return ak._util.wrap(out, behavior)
+
+    return sums, finish
+
+
 def moment(x, n, weight=None, axis=None, keepdims=False, mask_identity=True):
     """
     Args:
@@ -874,6 +1096,16 @@ def moment(x, n, weight=None, axis=None, keepdims=False, mask_identity=True):
     missing values (None) in reducers, and #ak.mean for an example with another
     non-reducer.
     """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fused = _moments(x, None, weight, axis, n=n)
+        if fused is not None:
+            sums, finish = fused
+            return finish(
+                sums["sumwxn"] / sums["sumw"],
+                keepdims,
+                mask_identity,
+            )
+
     with np.errstate(invalid="ignore"):
         if weight is None:
             sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
@@ -958,6 +1190,12 @@ def mean(x, weight=None, axis=None, keepdims=False, mask_identity=True):
     See #ak.sum for a complete description of handling nested lists and
     missing values (None) in reducers.
     """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fused = _moments(x, None, weight, axis)
+        if fused is not None:
+            sums, finish = fused
+            return finish(sums["meanx"], keepdims, mask_identity)
+
     with np.errstate(invalid="ignore"):
         if weight is None:
             sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
@@ -1024,6 +1262,15 @@ def var(x, weight=None, ddof=0, axis=None, keepdims=False, mask_identity=True):
     missing values (None) in reducers, and #ak.mean for an example with another
     non-reducer.
     """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fused = _moments(x, None, weight, axis)
+        if fused is not None:
+            sums, finish = fused
+            out = sums["cxx"] / sums["sumw"]
+            if ddof != 0:
+                out = out * (sums["sumw"] / (sums["sumw"] - ddof))
+            return finish(out, keepdims, mask_identity)
+
     with np.errstate(invalid="ignore"):
         xmean = mean(
             x, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
@@ -1151,6 +1398,12 @@ def covar(x, y, weight=None, axis=None, keepdims=False, mask_identity=True):
     missing values (None) in reducers, and #ak.mean for an example with another
     non-reducer.
     """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fused = _moments(x, y, weight, axis)
+        if fused is not None:
+            sums, finish = fused
+            return finish(sums["cxy"] / sums["sumw"], keepdims, mask_identity)
+
     with np.errstate(invalid="ignore"):
         xmean = mean(
             x, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
@@ -1222,6 +1475,17 @@ def corr(x, y, weight=None, axis=None, keepdims=False, mask_identity=True):
     missing values (None) in reducers, and #ak.mean for an example with another
     non-reducer.
     """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fused = _moments(x, y, weight, axis)
+        if fused is not None:
+            sums, finish = fused
+            nplike = ak.nplike.Numpy.instance()
+            return finish(
+                sums["cxy"] / nplike.sqrt(sums["cxx"] * sums["cyy"]),
+                keepdims,
+                mask_identity,
+            )
+
     with np.errstate(invalid="ignore"):
         xmean = mean(
             x, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
@@ -1319,46 +1583,77 @@ def linear_fit(x, y, weight=None, axis=None, keepdims=False, mask_identity=True)
     """
     with np.errstate(invalid="ignore"):
         nplike = ak.nplike.of(x, y, weight)
-        if weight is None:
-            sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwx = sum(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwy = sum(y, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwxx = sum(
-                x ** 2, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-            sumwxy = sum(
-                x * y, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
+        fused = _moments(x, y, weight, axis)
+        if fused is not None:
+            # The same formulas in terms of central moments: delta is
+            # sumw*cxx, and the intercept is meany - slope*meanx.
+            sums, finish = fused
+            sumw, meanx, meany = sums["sumw"], sums["meanx"], sums["meany"]
+            cxx, cxy = sums["cxx"], sums["cxy"]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                slope = cxy / cxx
+                intercept = meany - slope * meanx
+                delta = sumw * cxx
+                intercept_error = nplike.sqrt((cxx + sumw * meanx ** 2) / delta)
+                slope_error = nplike.sqrt(sumw / delta)
+            intercept = finish(intercept, keepdims, mask_identity)
+            slope = finish(slope, keepdims, mask_identity)
+            intercept_error = finish(intercept_error, keepdims, mask_identity)
+            slope_error = finish(slope_error, keepdims, mask_identity)
+
         else:
-            sumw = sum(
-                x * 0 + weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwx = sum(
-                x * weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-            sumwy = sum(
-                y * weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-            sumwxx = sum(
-                (x ** 2) * weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwxy = sum(
-                x * y * weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-        delta = (sumw * sumwxx) - (sumwx * sumwx)
-        intercept = nplike.true_divide(((sumwxx * sumwy) - (sumwx * sumwxy)), delta)
-        slope = nplike.true_divide(((sumw * sumwxy) - (sumwx * sumwy)), delta)
-        intercept_error = nplike.sqrt(nplike.true_divide(sumwxx, delta))
-        slope_error = nplike.sqrt(nplike.true_divide(sumw, delta))
+            if weight is None:
+                sumw = count(
+                    x, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+                )
+                sumwx = sum(
+                    x, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+                )
+                sumwy = sum(
+                    y, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+                )
+                sumwxx = sum(
+                    x ** 2, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+                )
+                sumwxy = sum(
+                    x * y, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+                )
+            else:
+                sumw = sum(
+                    x * 0 + weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+                sumwx = sum(
+                    x * weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+                sumwy = sum(
+                    y * weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+                sumwxx = sum(
+                    (x ** 2) * weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+                sumwxy = sum(
+                    x * y * weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+            delta = (sumw * sumwxx) - (sumwx * sumwx)
+            intercept = nplike.true_divide(((sumwxx * sumwy) - (sumwx * sumwxy)), delta)
+            slope = nplike.true_divide(((sumw * sumwxy) - (sumwx * sumwy)), delta)
+            intercept_error = nplike.sqrt(nplike.true_divide(sumwxx, delta))
+            slope_error = nplike.sqrt(nplike.true_divide(sumw, delta))
 
         intercept = ak.operations.convert.to_layout(
             intercept, allow_record=True, allow_other=True
@@ -1503,8 +1798,39 @@ def softmax(x, axis=None, keepdims=False, mask_identity=False):
         return nplike.true_divide(expx, denom)
 
 
+def set_reducer_threads(threads):
+    """
+    Args:
+        threads (int): Number of threads to use in reductions; 1 means no
+            threads are started.
+
+    Sets the number of threads used by all reducers (#ak.sum, #ak.prod,
+    #ak.min, #ak.max, #ak.argmin, #ak.argmax, #ak.count, #ak.count_nonzero,
+    #ak.any, #ak.all, and the functions based on them) to reduce lists of
+    numbers at `axis=-1`, and returns the previous number.
+
+    The lists are divided among the threads at list boundaries, so every
+    output value is computed by a single thread, adding (etc.) values in the
+    same order as a single-threaded reduction. Thus, the results do not
+    depend on the number of threads, even for floating-point numbers.
+
+    For example,
+
+        >>> previous = ak.set_reducer_threads(8)
+        >>> ak.sum(array, axis=-1)
+        >>> ak.set_reducer_threads(previous)
+
+    Only lists of one-dimensional numeric data are reduced in parallel.
+    """
+    previous = ak._ext.reducer_threads()
+    ak._ext.set_reducer_threads(threads)
+    return previous
+
+
 __all__ = [
-    x for x in list(globals()) if not x.startswith("_") and x not in ("ak", "np")
+    x
+    for x in list(globals())
+    if not x.startswith("_") and x not in ("numbers", "ak", "np")
 ]
 
 
@@ -2176,6 +2176,15 @@ def _pack_layout(layout):
         new_index[is_none] = -1
         new_index[~is_none] = nplike.arange(len(new_index) - nplike.sum(is_none))
 
+        # An index that is already packed can be kept (no copy)
+        if nplike.array_equal(index, new_index):
+            return type(layout)(
+                layout.index,
+                layout.project(),
+                layout.identities,
+                layout.parameters,
+            )
+
         return ak.layout.IndexedOptionArray64(
             ak.layout.Index64(new_index),
             layout.project(),
@@ -2548,6 +2557,962 @@ def argsort(array, axis=-1, ascending=True, stable=True, highlevel=True, behavio
     return ak._util.maybe_wrap_like(out, array, behavior, highlevel)
 
 
+_topk_primitives = (
+    "bool",
+    "int8",
+    "int16",
+    "int32",
+    "int64",
+    "uint8",
+    "uint16",
+    "uint32",
+    "uint64",
+    "float32",
+    "float64",
+)
+
+
+def _argtopk_lists(layout, k, largest):
+    # local indexes of the top k in each list of `layout`, a ListOffsetArray64
+    # whose content starts at zero, as a flat array with -1 for padding
+    nplike = ak.nplike.of(layout)
+
+    content = layout.content
+    if isinstance(content, ak.layout.NumpyArray) and content.ndim == 1:
+        primitive = content.form.primitive
+        if primitive not in _topk_primitives:
+            raise TypeError(
+                "cannot sort NumpyArray with format {0}".format(repr(primitive))
+                + ak._util.exception_suffix(__file__)
+            )
+        out = nplike.empty(len(layout) * k, dtype=np.int64)
+        data = nplike.ascontiguousarray(nplike.asarray(content))
+        offsets = nplike.asarray(layout.offsets)
+        error = nplike[
+            "awkward_ListOffsetArray_argtopk", np.int64, data.dtype.type, np.int64
+        ](out, data, offsets, len(offsets), k, largest)
+        if error.str is not None:
+            raise ValueError(
+                error.str.decode("utf-8", "surrogateescape")
+                + ak._util.exception_suffix(__file__)
+            )
+        return out
+
+    else:
+        # strings, missing values, etc. are fully sorted
+        out = argsort(layout, axis=-1, ascending=not largest, highlevel=False)
+        out = pad_none(out[:, :k], k, axis=1, clip=True, highlevel=False)
+        out = fill_none(out, -1, axis=-1, highlevel=False)
+        return nplike.asarray(out).reshape(-1)
+
+
+def _topk(layout, k, axis, largest, select):
+    if k < 0:
+        raise ValueError("k must be non-negative" + ak._util.exception_suffix(__file__))
+    if isinstance(layout, ak.partition.PartitionedArray):
+        layout = layout.toContent()
+
+    def apply(layout):
+        nplike = ak.nplike.of(layout)
+        layout = layout.toListOffsetArray64(True)
+        local = _argtopk_lists(layout, k, largest)
+        missing = local < 0
+        if select:
+            starts = nplike.repeat(nplike.asarray(layout.offsets)[:-1], k)
+            index = local + starts
+            index[missing] = -1
+            out = ak.layout.IndexedOptionArray64(
+                ak.layout.Index64(index), layout.content
+            )
+        else:
+            out = ak.layout.ByteMaskedArray(
+                ak.layout.Index8(missing.view(np.int8)),
+                ak.layout.NumpyArray(local),
+                valid_when=False,
+            )
+        return ak.layout.RegularArray(out, k, len(layout))
+
+    def innermost(content):
+        # values in lists at the axis of topk, possibly missing
+        if isinstance(content, ak._util.virtualtypes):
+            content = content.array
+        if isinstance(content, ak._util.optiontypes + ak._util.indexedtypes):
+            content = content.content
+        return (
+            isinstance(content, ak.layout.EmptyArray)
+            or (isinstance(content, ak.layout.NumpyArray) and content.ndim == 1)
+            or content.parameter("__array__") in ("string", "bytestring")
+        )
+
+    def getfunction(layout, depth):
+        if isinstance(
+            layout, ak._util.listtypes + (ak.layout.RegularArray,)
+        ) and layout.parameter("__array__") not in ("string", "bytestring"):
+            if innermost(layout.content):
+                if not (axis == -1 or axis == depth):
+                    raise ValueError(
+                        "topk is only implemented at the innermost axis"
+                        + ak._util.exception_suffix(__file__)
+                    )
+                return lambda: apply(layout)
+
+        elif isinstance(layout, (ak.layout.RecordArray, ak._util.uniontypes)):
+            raise TypeError(
+                "topk does not support {0}".format(type(layout).__name__)
+                + ak._util.exception_suffix(__file__)
+            )
+
+        return None
+
+    if innermost(layout):
+        if axis not in (0, -1):
+            raise ValueError(
+                "axis={0} exceeds the depth of this array".format(axis)
+                + ak._util.exception_suffix(__file__)
+            )
+        offsets = ak.layout.Index64(
+            ak.nplike.of(layout).array([0, len(layout)], dtype=np.int64)
+        )
+        return apply(ak.layout.ListOffsetArray64(offsets, layout))[0]
+
+    return ak._util.recursively_apply(
+        layout, getfunction, pass_depth=True, numpy_to_regular=True
+    )
+
+
+def argtopk(array, k, axis=-1, largest=True, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Data for which to find the positions of the `k` largest (or
+            smallest) values in each list.
+        k (int): Number of positions to return for each list.
+        axis (int): The dimension at which this operation is applied; only the
+            innermost dimension (`-1` or its positive equivalent) is
+            supported.
+        largest (bool): If True, select the largest values; otherwise, the
+            smallest.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns lists of exactly `k` local indexes, in order from the largest (or
+    smallest) value, padded with None for lists shorter than `k`. This is the
+    same as `ak.argsort(array, ascending=not largest)[..., :k]` padded with
+    #ak.pad_none, including the order of ties and NaN, but lists of numbers
+    are only partially sorted, which takes _n log(k)_ time instead of
+    _n log(n)_.
+
+    The values may be booleans, integers, floating point numbers, or strings,
+    any of which may be None; other types, such as records, unions, complex
+    numbers, and dates, are a TypeError.
+
+        >>> array = ak.Array([[3.3, 1.1, 5.5, 4.4], [], [2.2]])
+        >>> ak.argtopk(array, 2)
+        <Array [[2, 3], [None, None], [0, None]] type='3 * 2 * ?int64'>
+
+    See also #ak.topk and #ak.argsort.
+    """
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    out = _topk(layout, k, axis, largest, False)
+    return ak._util.maybe_wrap_like(out, array, behavior, highlevel)
+
+
+def topk(array, k, axis=-1, largest=True, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Data from which to select the `k` largest (or smallest) values
+            in each list.
+        k (int): Number of values to return for each list.
+        axis (int): The dimension at which this operation is applied; only the
+            innermost dimension (`-1` or its positive equivalent) is
+            supported.
+        largest (bool): If True, select the largest values; otherwise, the
+            smallest.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns lists of exactly `k` values, from the largest (or smallest),
+    padded with None for lists shorter than `k`.
+
+        >>> array = ak.Array([[3.3, 1.1, 5.5, 4.4], [], [2.2]])
+        >>> ak.topk(array, 2)
+        <Array [[5.5, 4.4], [None, None], [2.2, None]] type='3 * 2 * ?float64'>
+
+    See #ak.argtopk for details.
+    """
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    out = _topk(layout, k, axis, largest, True)
+    return ak._util.maybe_wrap_like(out, array, behavior, highlevel)
+
+
+def _factorize(layout):
+    # integer codes that are equal if and only if the values are equal, or
+    # None if this kind of content has to be compared through Python objects
+    nplike = ak.nplike.of(layout)
+
+    if isinstance(layout, ak._util.optiontypes):
+        # None gets a code of its own, after all of the values
+        mask = nplike.asarray(layout.bytemask()).view(np.bool_)
+        valid = _factorize(layout.project())
+        if valid is None:
+            return None
+        codes = nplike.full(
+            len(layout), int(valid.max()) + 1 if len(valid) != 0 else 0, dtype=np.int64
+        )
+        codes[~mask] = valid
+        return codes
+
+    elif isinstance(layout, ak._util.indexedtypes):
+        return _factorize(layout.project())
+
+    elif isinstance(layout, ak.layout.NumpyArray):
+        data = nplike.asarray(layout)
+        if data.ndim != 1:
+            return None
+        return nplike.unique(data, return_inverse=True)[1]
+
+    elif layout.parameter("__array__") in ("string", "bytestring") and isinstance(
+        layout, ak._util.listtypes
+    ):
+        # sort the strings, then a new code starts wherever a string differs
+        # from its predecessor in sorted order
+        order = nplike.asarray(
+            ak.operations.structure.argsort(layout, axis=-1, highlevel=False)
+        )
+        codes = nplike.empty(len(layout), dtype=np.int64)
+        if len(layout) != 0:
+            ordered = ak._util.wrap(layout[order], None)
+            differs = (
+                ak.behaviors.string._string_compare(ordered[1:], ordered[:-1]) != 0
+            )
+            codes[order[0]] = 0
+            codes[order[1:]] = nplike.cumsum(differs)
+        return codes
+
+    elif isinstance(layout, ak.layout.RecordArray) and layout.numfields != 0:
+        # combine the fields' codes pairwise, renumbering after each step so
+        # that the combined codes stay below len(layout) ** 2
+        codes = None
+        for content in layout.contents:
+            field = _factorize(content[: len(layout)])
+            if field is None:
+                return None
+            elif codes is None:
+                codes = field
+            else:
+                codes = codes * (len(layout) + 1) + field
+                codes = nplike.unique(codes, return_inverse=True)[1]
+        return codes
+
+    else:
+        return None
+
+
+def _unique_atoms(layout):
+    # flattens everything but strings and records, which are single values
+    # for ak.unique, and drops missing values
+    if isinstance(layout, ak._util.optiontypes + ak._util.indexedtypes):
+        return _unique_atoms(layout.project())
+
+    elif isinstance(layout, ak._util.uniontypes):
+        raise ValueError(
+            "cannot find unique values of a union-type array"
+            + ak._util.exception_suffix(__file__)
+        )
+
+    elif isinstance(layout, ak.layout.NumpyArray) and layout.ndim != 1:
+        return _unique_atoms(layout.toRegularArray())
+
+    elif isinstance(
+        layout, ak._util.listtypes + (ak.layout.RegularArray,)
+    ) and layout.parameter("__array__") not in ("string", "bytestring"):
+        return _unique_atoms(layout.flatten(1))
+
+    else:
+        return layout
+
+
+def _unique_lists(layout):
+    # a RecordArray of the unique values, their counts, and the inverse index
+    # in each list of `layout`, whose content must consist of single values
+    nplike = ak.nplike.of(layout)
+
+    layout = layout.toListOffsetArray64(True)
+    offsets = nplike.asarray(layout.offsets)
+    content = layout.content
+    parents = nplike.repeat(
+        nplike.arange(len(layout), dtype=np.int64), offsets[1:] - offsets[:-1]
+    )
+
+    mask = None
+    if isinstance(content, ak._util.optiontypes):
+        mask = nplike.asarray(content.bytemask()).view(np.bool_)
+        parents = parents[~mask]
+    if isinstance(content, ak._util.optiontypes + ak._util.indexedtypes):
+        content = content.project()
+    if isinstance(content, ak.layout.EmptyArray):
+        content = content.toNumpyArray()
+
+    codes = _factorize(content)
+    if codes is None:
+        raise TypeError(
+            "cannot find unique values of {0}".format(
+                ak.operations.describe.type(content)
+            )
+            + ak._util.exception_suffix(__file__)
+        )
+
+    # codes are in sorted order of their values, so (list, code) pairs sort
+    # the values within each list
+    numcodes = int(codes.max()) + 1 if len(codes) != 0 else 1
+    keys = parents * numcodes + codes
+    uniquekeys, first, inverse, counts = nplike.unique(
+        keys, return_index=True, return_inverse=True, return_counts=True
+    )
+    outoffsets = nplike.searchsorted(
+        uniquekeys // numcodes, nplike.arange(len(layout) + 1, dtype=np.int64)
+    )
+    localinverse = inverse - outoffsets[parents]
+
+    if mask is None:
+        inverse = ak.layout.NumpyArray(localinverse)
+    else:
+        inverse = nplike.zeros(len(mask), dtype=np.int64)
+        inverse[~mask] = localinverse
+        inverse = ak.layout.ByteMaskedArray(
+            ak.layout.Index8(mask.view(np.int8)),
+            ak.layout.NumpyArray(inverse),
+            valid_when=False,
+        )
+
+    outoffsets = ak.layout.Index64(outoffsets)
+    return ak.layout.RecordArray(
+        [
+            ak.layout.ListOffsetArray64(
+                outoffsets, content[first], parameters=layout.parameters
+            ),
+            ak.layout.ListOffsetArray64(outoffsets, ak.layout.NumpyArray(counts)),
+            ak.layout.ListOffsetArray64(layout.offsets, inverse),
+        ],
+        ["values", "counts", "inverse"],
+        len(layout),
+    )
+
+
+def _is_unique_atom(layout):
+    # strings and records are single values for ak.unique
+    if isinstance(layout, ak._util.optiontypes + ak._util.indexedtypes):
+        layout = layout.content
+    if isinstance(layout, ak.layout.NumpyArray):
+        return layout.ndim == 1
+    elif isinstance(layout, ak._util.listtypes + (ak.layout.RegularArray,)):
+        return layout.parameter("__array__") in ("string", "bytestring")
+    else:
+        return True
+
+
+def _unique(layout, axis):
+    if isinstance(layout, ak.partition.PartitionedArray):
+        layout = layout.toContent()
+
+    if axis is not None and _is_unique_atom(layout) and axis not in (0, -1):
+        raise ValueError(
+            "axis={0} exceeds the depth of this array".format(axis)
+            + ak._util.exception_suffix(__file__)
+        )
+
+    if axis is None or _is_unique_atom(layout):
+        content = _unique_atoms(layout)
+        offsets = ak.layout.Index64(
+            ak.nplike.of(content).array([0, len(content)], dtype=np.int64)
+        )
+        out = _unique_lists(ak.layout.ListOffsetArray64(offsets, content))
+        return out["values"][0], out["counts"][0], out["inverse"][0]
+
+    def getfunction(layout, depth):
+        if isinstance(layout, ak.layout.RecordArray):
+            raise ValueError(
+                "records in ak.unique are compared as single values, but this "
+                "array has lists inside of records; select a field first"
+                + ak._util.exception_suffix(__file__)
+            )
+
+        elif _is_unique_atom(layout.content):
+            if not (axis == -1 or axis == depth):
+                raise ValueError(
+                    "unique is only implemented at axis=None and the innermost "
+                    "axis" + ak._util.exception_suffix(__file__)
+                )
+            return lambda: _unique_lists(layout)
+
+        else:
+            return None
+
+    out = ak._util.recursively_apply(
+        layout, getfunction, pass_depth=True, numpy_to_regular=True
+    )
+    return out["values"], out["counts"], out["inverse"]
+
+
+def unique(
+    array,
+    axis=None,
+    return_inverse=False,
+    return_counts=False,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        array: Data from which to select distinct values.
+        axis (None or int): If None, find the distinct values of the whole
+            array; otherwise, find the distinct values in each list at the
+            innermost dimension (`-1` or its positive equivalent). Other
+            dimensions are not supported.
+        return_inverse (bool): If True, also return the index of each input
+            value in the output.
+        return_counts (bool): If True, also return the number of times each
+            distinct value appears.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns the distinct values in sorted order, like NumPy's `np.unique`.
+    Strings and records are single values, not lists or fields to descend
+    into, and None values are skipped (but a None field of a record is part
+    of that record's value, sorted after all other values of the field).
+
+        >>> array = ak.Array([[3, 1, 3], [], [2, 2, None, 1]])
+        >>> ak.unique(array)
+        <Array [1, 2, 3] type='3 * int64'>
+        >>> ak.unique(array, axis=-1)
+        <Array [[1, 3], [], [1, 2]] type='3 * var * int64'>
+
+    With `return_inverse` and/or `return_counts`, the output is a tuple of
+    the distinct values, followed by the inverse index and/or the counts.
+    The inverse index has the same structure as `array` (flattened if `axis`
+    is None, in which case None values are omitted), such that
+    `values[inverse]` reconstructs the original values.
+
+        >>> values, inverse, counts = ak.unique(
+        ...     array, axis=-1, return_inverse=True, return_counts=True
+        ... )
+        >>> inverse
+        <Array [[1, 0, 1], [], [1, 1, None, 0]] type='3 * var * ?int64'>
+        >>> counts
+        <Array [[1, 2], [], [1, 2]] type='3 * var * int64'>
+
+    Values are sorted with vectorized kernels: numbers and strings by value,
+    records by their fields in order.
+
+    See also #ak.value_counts.
+    """
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    values, counts, inverse = _unique(layout, axis)
+
+    def wrap(out):
+        return ak._util.maybe_wrap_like(out, array, behavior, highlevel)
+
+    out = (wrap(values),)
+    if return_inverse:
+        out = out + (wrap(inverse),)
+    if return_counts:
+        out = out + (wrap(counts),)
+
+    if len(out) == 1:
+        return out[0]
+    else:
+        return out
+
+
+def value_counts(array, axis=None, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Data in which to count distinct values.
+        axis (None or int): If None, count the distinct values of the whole
+            array; otherwise, count them in each list at the innermost
+            dimension (`-1` or its positive equivalent).
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns records with fields `"value"` and `"count"`, ordered from the
+    most common value to the least common (ties are in sorted order of
+    their values). None values are not counted.
+
+        >>> array = ak.Array(["b", "a", "b", "c", "b", "a"])
+        >>> ak.to_list(ak.value_counts(array))
+        [{'value': 'b', 'count': 3},
+         {'value': 'a', 'count': 2},
+         {'value': 'c', 'count': 1}]
+
+    See also #ak.unique.
+    """
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    values, counts, _ = _unique(layout, axis)
+
+    order = argsort(counts, ascending=False, stable=True, highlevel=False)
+    out = zip(
+        {"value": values[order], "count": counts[order]},
+        depth_limit=(None if axis is None else values.purelist_depth),
+        highlevel=False,
+    )
+    return ak._util.maybe_wrap_like(out, array, behavior, highlevel)
+
+
+def _apply_to_lists(layouts, posaxis, function, name, behavior):
+    # calls `function` on the lists at depth `posaxis` (as ListOffsetArray64s
+    # with content starting at zero) of layouts whose list structure above
+    # that depth must be the same; missing lists stay missing
+    def trimmed(layout):
+        layout = layout.toListOffsetArray64(True)
+        stop = ak.nplike.of(layout).asarray(layout.offsets)[-1]
+        if len(layout.content) == stop:
+            return layout
+        return ak.layout.ListOffsetArray64(
+            layout.offsets, layout.content[:stop], parameters=layout.parameters
+        )
+
+    def getfunction(inputs, depth):
+        if depth < posaxis and any(
+            isinstance(x, ak.layout.RecordArray) for x in inputs
+        ):
+            raise ValueError(
+                "{0} cannot apply to lists inside of records; select a "
+                "field first".format(name) + ak._util.exception_suffix(__file__)
+            )
+
+        elif depth == posaxis:
+            if all(
+                isinstance(x, ak._util.listtypes + (ak.layout.RegularArray,))
+                for x in inputs
+            ):
+                return lambda: function(*[trimmed(x) for x in inputs])
+            elif not any(
+                isinstance(
+                    x,
+                    ak._util.optiontypes
+                    + ak._util.indexedtypes
+                    + ak._util.uniontypes
+                    + ak._util.virtualtypes,
+                )
+                for x in inputs
+            ):
+                raise ValueError(
+                    "{0} requires lists at axis={1}".format(name, posaxis)
+                    + ak._util.exception_suffix(__file__)
+                )
+
+        return None
+
+    if any(len(x) != len(layouts[0]) for x in layouts):
+        raise ValueError(
+            "{0} requires arrays of the same length".format(name)
+            + ak._util.exception_suffix(__file__)
+        )
+
+    return ak._util.broadcast_and_apply(
+        layouts,
+        getfunction,
+        behavior,
+        left_broadcast=False,
+        right_broadcast=False,
+        numpy_to_regular=True,
+    )
+
+
+def _group_lists(arraylists, keylists):
+    # groups the content of each list in `arraylists` by the corresponding
+    # values in `keylists`, both ListOffsetArray64 with the same offsets
+    nplike = ak.nplike.of(arraylists, keylists)
+
+    offsets = nplike.asarray(keylists.offsets)
+    parents = nplike.repeat(
+        nplike.arange(len(keylists), dtype=np.int64), offsets[1:] - offsets[:-1]
+    )
+    keys = keylists.content
+    positions = nplike.arange(len(keys), dtype=np.int64)
+
+    if isinstance(keys, ak._util.optiontypes):
+        valid = ~nplike.asarray(keys.bytemask()).view(np.bool_)
+        parents, positions = parents[valid], positions[valid]
+    if isinstance(keys, ak._util.optiontypes + ak._util.indexedtypes):
+        keys = keys.project()
+    if isinstance(keys, ak.layout.EmptyArray):
+        keys = keys.toNumpyArray()
+
+    codes = _factorize(keys)
+    if codes is None:
+        raise TypeError(
+            "cannot group by keys of type {0}".format(ak.operations.describe.type(keys))
+            + ak._util.exception_suffix(__file__)
+        )
+
+    numcodes = int(codes.max()) + 1 if len(codes) != 0 else 1
+    sortkeys = parents * numcodes + codes
+    order = nplike.argsort(sortkeys, kind="stable")
+    sortkeys = sortkeys[order]
+
+    isfirst = nplike.empty(len(sortkeys), dtype=np.bool_)
+    isfirst[:1] = True
+    isfirst[1:] = sortkeys[1:] != sortkeys[:-1]
+    groupstarts = nplike.nonzero(isfirst)[0]
+
+    groupoffsets = ak.layout.Index64(
+        nplike.append(groupstarts, len(sortkeys)).astype(np.int64)
+    )
+    outoffsets = ak.layout.Index64(
+        nplike.searchsorted(
+            sortkeys[groupstarts] // numcodes,
+            nplike.arange(len(keylists) + 1, dtype=np.int64),
+        )
+    )
+
+    outkeys = ak.layout.ListOffsetArray64(outoffsets, keys[order[groupstarts]])
+    groups = ak.layout.ListOffsetArray64(
+        outoffsets,
+        ak.layout.ListOffsetArray64(
+            groupoffsets,
+            ak.layout.IndexedArray64(
+                ak.layout.Index64(positions[order]), arraylists.content
+            ),
+        ),
+    )
+    return outkeys, groups
+
+
+def group_by(array, key, axis=0, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Data to group.
+        key: Array of numbers, strings, or records with the same structure
+            as `array` down to `axis`, or the name of a field of `array`.
+            Elements of `array` whose key is None are not in any group, and
+            lists that are None in `array` or `key` are None in the output.
+        axis (int): The dimension at which this operation is applied: `0` to
+            group the whole array, or the innermost dimension of `key` (`-1`
+            or its positive equivalent) to group within each list.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns a tuple of the distinct keys, in sorted order, and the groups of
+    elements having each key, as lists in an extra dimension at `axis`.
+    Within a group, elements are in their original order.
+
+        >>> array = ak.Array([
+        ...     {"name": "b", "x": 1}, {"name": "a", "x": 2},
+        ...     {"name": "b", "x": 3}, {"name": "c", "x": 4},
+        ... ])
+        >>> keys, groups = ak.group_by(array, "name")
+        >>> keys
+        <Array ['a', 'b', 'c'] type='3 * string'>
+        >>> ak.to_list(groups.x)
+        [[2], [1, 3], [4]]
+        >>> ak.sum(groups.x, axis=-1)
+        <Array [2, 4, 4] type='3 * int64'>
+
+    Within lists, each list is grouped separately:
+
+        >>> array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+        >>> key = ak.Array([[1, 0, 1], [], [7, 7]])
+        >>> keys, groups = ak.group_by(array, key, axis=1)
+        >>> keys
+        <Array [[0, 1], [], [7]] type='3 * var * int64'>
+        >>> ak.to_list(groups)
+        [[[2.2], [1.1, 3.3]], [], [[4.4, 5.5]]]
+
+    The groups index the original `array`, rather than copying it into the
+    grouped order, so reducing one field of grouped records only permutes
+    that field.
+
+    See also #ak.unique and #ak.run_lengths.
+    """
+    if ak._util.isstr(key):
+        key = ak.operations.convert.to_layout(array, allow_record=False)[key]
+
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    keylayout = ak.operations.convert.to_layout(
+        key, allow_record=False, allow_other=False
+    )
+    if isinstance(layout, ak.partition.PartitionedArray):
+        layout = layout.toContent()
+    if isinstance(keylayout, ak.partition.PartitionedArray):
+        keylayout = keylayout.toContent()
+
+    depth = keylayout.purelist_depth
+    posaxis = axis if axis >= 0 else depth + axis
+    if posaxis != 0 and posaxis != depth - 1:
+        raise ValueError(
+            "group_by is only implemented at axis=0 and the innermost axis of "
+            "the key" + ak._util.exception_suffix(__file__)
+        )
+
+    # both arrays as lists of the elements to group, one list per group_by
+    nplike = ak.nplike.of(layout, keylayout)
+    if posaxis == 0:
+        if len(layout) != len(keylayout):
+            raise ValueError(
+                "array and key must have the same length"
+                + ak._util.exception_suffix(__file__)
+            )
+        offsets = ak.layout.Index64(nplike.array([0, len(layout)], dtype=np.int64))
+        arraylists = ak.layout.ListOffsetArray64(offsets, layout)
+        keylists = ak.layout.ListOffsetArray64(offsets, keylayout)
+        outkeys, groups = _group_lists(arraylists, keylists)
+        outkeys, groups = outkeys[0], groups[0]
+
+    else:
+
+        def function(arraylists, keylists):
+            if not nplike.array_equal(
+                nplike.asarray(arraylists.offsets), nplike.asarray(keylists.offsets)
+            ):
+                raise ValueError(
+                    "array and key must have the same list lengths down to "
+                    "axis={0}".format(axis) + ak._util.exception_suffix(__file__)
+                )
+            return _group_lists(arraylists, keylists)
+
+        outkeys, groups = _apply_to_lists(
+            [layout, keylayout], posaxis, function, "group_by", behavior
+        )
+
+    return (
+        ak._util.maybe_wrap_like(outkeys, array, behavior, highlevel),
+        ak._util.maybe_wrap_like(groups, array, behavior, highlevel),
+    )
+
+
+def _join_codes(leftkeys, rightkeys):
+    # codes for the left and right keys from one factorization of both, so
+    # that equal keys get equal codes; -1 for missing keys
+    nplike = ak.nplike.of(leftkeys, rightkeys)
+
+    codes = []
+    valids = []
+    contents = []
+    for keys in (leftkeys, rightkeys):
+        valid = None
+        if isinstance(keys, ak._util.optiontypes):
+            valid = ~nplike.asarray(keys.bytemask()).view(np.bool_)
+        if isinstance(keys, ak._util.optiontypes + ak._util.indexedtypes):
+            keys = keys.project()
+        valids.append(valid)
+        contents.append(keys)
+
+    both = concatenate(contents, highlevel=False)
+    if isinstance(both, ak.layout.EmptyArray):
+        both = both.toNumpyArray()
+    bothcodes = _factorize(both)
+    if bothcodes is None:
+        raise TypeError(
+            "cannot join on keys of type {0}".format(ak.operations.describe.type(both))
+            + ak._util.exception_suffix(__file__)
+        )
+
+    for i, keys in enumerate((leftkeys, rightkeys)):
+        start = 0 if i == 0 else len(contents[0])
+        stop = start + len(contents[i])
+        if valids[i] is None:
+            codes.append(bothcodes[start:stop])
+        else:
+            full = nplike.full(len(keys), -1, dtype=np.int64)
+            full[valids[i]] = bothcodes[start:stop]
+            codes.append(full)
+
+    numcodes = int(bothcodes.max()) + 1 if len(bothcodes) != 0 else 1
+    return codes[0], codes[1], numcodes
+
+
+def _join_lists(leftlists, rightlists, on, how):
+    # joins the records in each pair of lists, both ListOffsetArray64 with
+    # content starting at zero, returning a list of (left, right) tuples
+    nplike = ak.nplike.of(leftlists, rightlists)
+
+    def keysof(content):
+        if len(on) == 1:
+            return content[on[0]]
+        else:
+            return ak.layout.RecordArray([content[x] for x in on], None, len(content))
+
+    def parentsof(lists):
+        offsets = nplike.asarray(lists.offsets)
+        return nplike.repeat(
+            nplike.arange(len(lists), dtype=np.int64), offsets[1:] - offsets[:-1]
+        )
+
+    leftcodes, rightcodes, numcodes = _join_codes(
+        keysof(leftlists.content), keysof(rightlists.content)
+    )
+
+    # (list, code) pairs are equal if and only if the records match; missing
+    # keys on the left become -1, which is not in `rightkeys` and so matches
+    # nothing, and missing keys on the right are removed
+    leftkeys = parentsof(leftlists) * numcodes + leftcodes
+    leftkeys[leftcodes < 0] = -1
+    rightpositions = nplike.nonzero(rightcodes >= 0)[0]
+    rightkeys = (parentsof(rightlists) * numcodes + rightcodes)[rightpositions]
+
+    order = nplike.argsort(rightkeys, kind="stable")
+    rightkeys = rightkeys[order]
+    rightpositions = rightpositions[order]
+
+    lo = nplike.searchsorted(rightkeys, leftkeys, side="left")
+    hi = nplike.searchsorted(rightkeys, leftkeys, side="right")
+    nummatches = hi - lo
+    if how == "left":
+        numrows = nummatches + (nummatches == 0)
+    else:
+        numrows = nummatches
+
+    rowoffsets = nplike.empty(len(numrows) + 1, dtype=np.int64)
+    rowoffsets[0] = 0
+    nplike.cumsum(numrows, out=rowoffsets[1:])
+    total = int(rowoffsets[-1])
+
+    leftindex = nplike.repeat(nplike.arange(len(numrows), dtype=np.int64), numrows)
+    local = nplike.arange(total, dtype=np.int64) - rowoffsets[:-1][leftindex]
+    rightindex = lo[leftindex] + local
+    nomatch = local >= nummatches[leftindex]
+    rightindex[nomatch] = 0
+    if len(rightpositions) != 0:
+        rightindex = rightpositions[rightindex]
+    rightindex[nomatch] = -1
+
+    if how == "left":
+        right = ak.layout.IndexedOptionArray64(
+            ak.layout.Index64(rightindex), rightlists.content
+        )
+    else:
+        right = ak.layout.IndexedArray64(
+            ak.layout.Index64(rightindex), rightlists.content
+        )
+    left = ak.layout.IndexedArray64(ak.layout.Index64(leftindex), leftlists.content)
+
+    outoffsets = rowoffsets[nplike.asarray(leftlists.offsets)]
+    return ak.layout.ListOffsetArray64(
+        ak.layout.Index64(outoffsets), ak.layout.RecordArray([left, right], None, total)
+    )
+
+
+def join(left, right, on, how="inner", axis=0, highlevel=True, behavior=None):
+    """
+    Args:
+        left: Array of records.
+        right: Array of records.
+        on (str or list of str): Name or names of fields in both `left` and
+            `right` whose values must be equal for records to match. Keys
+            can be numbers, strings, or records; None matches nothing.
+        how (str): If `"inner"`, the output only has matching pairs; if
+            `"left"`, records of `left` without a match are paired with None.
+        axis (int): The dimension at which this operation is applied: `0` to
+            join the whole arrays, or a deeper dimension to join each pair of
+            lists at that depth independently (`left` and `right` must have
+            the same list lengths above that depth, and a list that is None
+            in either is None in the output).
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns 2-tuples of records, left and right, for every pair of matching
+    records, in the order of `left` and then the order of `right`. As with
+    #ak.cartesian, #ak.unzip separates the two sides.
+
+        >>> left = ak.Array([
+        ...     {"id": 3, "x": 1.1}, {"id": 1, "x": 2.2}, {"id": 2, "x": 3.3}
+        ... ])
+        >>> right = ak.Array([
+        ...     {"id": 1, "y": "one"}, {"id": 3, "y": "three"}, {"id": 1, "y": "uno"}
+        ... ])
+        >>> ak.to_list(ak.join(left, right, on="id"))
+        [({'id': 3, 'x': 1.1}, {'id': 3, 'y': 'three'}),
+         ({'id': 1, 'x': 2.2}, {'id': 1, 'y': 'one'}),
+         ({'id': 1, 'x': 2.2}, {'id': 1, 'y': 'uno'})]
+        >>> matched_left, matched_right = ak.unzip(
+        ...     ak.join(left, right, on="id", how="left")
+        ... )
+        >>> matched_right.y
+        <Array ['three', 'one', 'uno', None] type='4 * ?string'>
+
+    The two sides of the output are #ak.layout.IndexedArray64 and (for
+    `how="left"`) #ak.layout.IndexedOptionArray64 over `left` and `right`, so
+    their fields are not copied. Matching is vectorized: keys are
+    factorized together, sorted on the right, and binary-searched from the
+    left.
+
+    See also #ak.cartesian and #ak.group_by.
+    """
+    if how not in ("inner", "left"):
+        raise ValueError(
+            "how must be 'inner' or 'left', not {0}".format(repr(how))
+            + ak._util.exception_suffix(__file__)
+        )
+    if ak._util.isstr(on):
+        on = [on]
+    else:
+        on = list(on)
+
+    layouts = []
+    for array in (left, right):
+        layout = ak.operations.convert.to_layout(
+            array, allow_record=False, allow_other=False
+        )
+        if isinstance(layout, ak.partition.PartitionedArray):
+            layout = layout.toContent()
+        layouts.append(layout)
+
+    if axis < 0:
+        raise ValueError(
+            "join requires a non-negative axis" + ak._util.exception_suffix(__file__)
+        )
+
+    def function(leftlists, rightlists):
+        for layout in (leftlists, rightlists):
+            content = layout.content
+            if isinstance(content, ak._util.optiontypes + ak._util.indexedtypes):
+                content = content.content
+            if not isinstance(content, ak.layout.RecordArray) or not all(
+                content.haskey(x) for x in on
+            ):
+                raise ValueError(
+                    "left and right must be records with fields {0} at "
+                    "axis={1}".format(", ".join(repr(x) for x in on), axis)
+                    + ak._util.exception_suffix(__file__)
+                )
+        return (_join_lists(leftlists, rightlists, on, how),)
+
+    if axis == 0:
+        nplike = ak.nplike.of(*layouts)
+        lists = []
+        for layout in layouts:
+            offsets = ak.layout.Index64(nplike.array([0, len(layout)], dtype=np.int64))
+            lists.append(ak.layout.ListOffsetArray64(offsets, layout))
+        out = function(*lists)[0][0]
+
+    else:
+        out = _apply_to_lists(layouts, axis, function, "join", behavior)[0]
+
+    return ak._util.maybe_wrap_like(out, left, behavior, highlevel)
+
+
 def pad_none(array, target, axis=1, clip=False, highlevel=True, behavior=None):
     """
     Args:
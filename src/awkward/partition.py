@@ -178,6 +178,18 @@ class PartitionedArray(object):
         else:
             return y
 
+    def __getstate__(self):
+        packed = ak.operations.structure.packed(self, highlevel=False)
+        form, lengths, container = ak.operations.convert.to_buffers(packed)
+        return form, lengths, container
+
+    def __setstate__(self, state):
+        form, lengths, container = state
+        layout = ak.operations.convert.from_buffers(
+            form, lengths, container, highlevel=False
+        )
+        self._ext = layout._ext
+
     ############################### Content methods
 
     @property
@@ -0,0 +1,680 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import re
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+_whitespace = b" \t\n\r\x0b\x0c"
+
+
+def _is_string(layout):
+    return layout.parameter("__array__") in ("string", "bytestring")
+
+
+def _buffers(layout):
+    layout = layout.toListOffsetArray64(True)
+    nplike = ak.nplike.of(layout)
+    offsets = nplike.asarray(layout.offsets)
+    content = nplike.asarray(layout.content)[: offsets[-1]]
+    return nplike, layout, offsets, content
+
+
+def _pattern(value, name):
+    if isinstance(value, bytes):
+        return value
+    elif isinstance(value, str) or (
+        ak._util.py27 and isinstance(value, ak._util.unicode)
+    ):
+        return value.encode("utf-8")
+    else:
+        raise TypeError(
+            "{0} must be a str or bytes, not {1}".format(name, repr(value))
+            + ak._util.exception_suffix(__file__)
+        )
+
+
+def _apply(array, function, highlevel, behavior, name):
+    def getfunction(layout):
+        if _is_string(layout):
+            return lambda: function(layout)
+        elif isinstance(layout, (ak.layout.NumpyArray, ak.layout.EmptyArray)):
+            raise TypeError(
+                "ak.strings.{0} applies to strings or bytestrings, not {1}".format(
+                    name, ak.type(layout)
+                )
+                + ak._util.exception_suffix(__file__)
+            )
+        else:
+            return None
+
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    out = ak._util.recursively_apply(layout, getfunction, pass_depth=False)
+    return ak._util.maybe_wrap_like(out, array, behavior, highlevel)
+
+
+def _codepoints(nplike, content):
+    # number of code points before each byte (and after the last one), which
+    # converts byte positions into character positions for UTF-8 strings
+    out = nplike.zeros(len(content) + 1, dtype=np.int64)
+    nplike.cumsum((content & 0xC0) != 0x80, out=out[1:])
+    return out
+
+
+def _matches(nplike, offsets, content, pattern):
+    # start positions of `pattern` in `content` that don't cross string
+    # boundaries, and the strings they belong to
+    length = len(content) - len(pattern) + 1
+    if length <= 0:
+        empty = nplike.empty(0, dtype=np.int64)
+        return empty, empty
+
+    found = nplike.ones(length, dtype=np.bool_)
+    for i, x in enumerate(bytearray(pattern)):
+        found &= content[i : i + length] == x
+    (positions,) = nplike.nonzero(found)
+
+    parents = nplike.searchsorted(offsets, positions, side="right") - 1
+    inside = positions + len(pattern) <= offsets[parents + 1]
+    return positions[inside], parents[inside]
+
+
+def _first_matches(nplike, offsets, content, pattern):
+    positions, parents = _matches(nplike, offsets, content, pattern)
+    first = nplike.ones(len(parents), dtype=np.bool_)
+    first[1:] = parents[1:] != parents[:-1]
+    return positions[first], parents[first]
+
+
+def _string_layout(offsets, content, layout):
+    return ak.layout.ListOffsetArray64(
+        ak.layout.Index64(offsets),
+        ak.layout.NumpyArray(content, parameters=layout.content.parameters),
+        parameters=layout.parameters,
+    )
+
+
+def _replace_strings(nplike, offsets, content, which, replacements):
+    # copies `content` with the strings at index `which` replaced by the
+    # byte strings in `replacements`, which may have different lengths
+    counts = offsets[1:] - offsets[:-1]
+    newcounts = counts.copy()
+    newcounts[which] = [len(x) for x in replacements]
+    newoffsets = nplike.zeros(len(offsets), dtype=np.int64)
+    nplike.cumsum(newcounts, out=newoffsets[1:])
+    out = nplike.empty(newoffsets[-1], dtype=np.uint8)
+
+    keep = nplike.ones(len(counts), dtype=np.bool_)
+    keep[which] = False
+    keepbytes = nplike.repeat(keep, counts)
+    shift = nplike.repeat((newoffsets[:-1] - offsets[:-1])[keep], counts[keep])
+    out[nplike.nonzero(keepbytes)[0] + shift] = content[keepbytes]
+
+    if len(replacements) != 0:
+        joined = nplike.frombuffer(b"".join(replacements), dtype=np.uint8)
+        replacedcounts = newcounts[which]
+        local = nplike.zeros(len(replacedcounts), dtype=np.int64)
+        nplike.cumsum(replacedcounts[:-1], out=local[1:])
+        out[
+            nplike.arange(len(joined))
+            + nplike.repeat(newoffsets[:-1][which] - local, replacedcounts)
+        ] = joined
+
+    return newoffsets, out
+
+
+def length(array, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns the length of each string in code points (like Python's `len` on
+    `str`) or of each bytestring in bytes.
+
+        >>> ak.strings.length(ak.Array(["one", "", "über"]))
+        <Array [3, 0, 4] type='3 * int64'>
+
+    The UTF-8 is not decoded: this counts the bytes that don't continue a
+    multi-byte character.
+    """
+
+    def function(layout):
+        nplike, layout, offsets, content = _buffers(layout)
+        if layout.parameter("__array__") == "string":
+            codepoints = _codepoints(nplike, content)
+            return ak.layout.NumpyArray(
+                codepoints[offsets[1:]] - codepoints[offsets[:-1]]
+            )
+        else:
+            return ak.layout.NumpyArray(offsets[1:] - offsets[:-1])
+
+    return _apply(array, function, highlevel, behavior, "length")
+
+
+def startswith(array, prefix, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        prefix (str or bytes): The prefix to look for.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns True for each string that starts with `prefix`, False otherwise.
+
+        >>> ak.strings.startswith(ak.Array(["one", "two", "three"]), "t")
+        <Array [False, True, True] type='3 * bool'>
+
+    See also #ak.strings.endswith.
+    """
+
+    def function(layout):
+        pattern = _pattern(prefix, "prefix")
+        nplike, layout, offsets, content = _buffers(layout)
+        out = offsets[1:] - offsets[:-1] >= len(pattern)
+        (candidates,) = nplike.nonzero(out)
+        starts = offsets[:-1][candidates]
+        for i, x in enumerate(bytearray(pattern)):
+            out[candidates] &= content[starts + i] == x
+        return ak.layout.NumpyArray(out)
+
+    return _apply(array, function, highlevel, behavior, "startswith")
+
+
+def endswith(array, suffix, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        suffix (str or bytes): The suffix to look for.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns True for each string that ends with `suffix`, False otherwise.
+
+        >>> ak.strings.endswith(ak.Array(["one", "two", "three"]), "e")
+        <Array [True, False, True] type='3 * bool'>
+
+    See also #ak.strings.startswith.
+    """
+
+    def function(layout):
+        pattern = _pattern(suffix, "suffix")
+        nplike, layout, offsets, content = _buffers(layout)
+        out = offsets[1:] - offsets[:-1] >= len(pattern)
+        (candidates,) = nplike.nonzero(out)
+        starts = offsets[1:][candidates] - len(pattern)
+        for i, x in enumerate(bytearray(pattern)):
+            out[candidates] &= content[starts + i] == x
+        return ak.layout.NumpyArray(out)
+
+    return _apply(array, function, highlevel, behavior, "endswith")
+
+
+def contains(array, substring, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        substring (str or bytes): The substring to look for.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns True for each string that contains `substring` (like Python's
+    `substring in string`), False otherwise.
+
+        >>> ak.strings.contains(ak.Array(["one", "two", "three"]), "o")
+        <Array [True, True, False] type='3 * bool'>
+
+    See also #ak.strings.find and #ak.strings.match_regex.
+    """
+
+    def function(layout):
+        pattern = _pattern(substring, "substring")
+        nplike, layout, offsets, content = _buffers(layout)
+        if len(pattern) == 0:
+            return ak.layout.NumpyArray(nplike.ones(len(layout), dtype=np.bool_))
+        positions, parents = _matches(nplike, offsets, content, pattern)
+        out = nplike.zeros(len(layout), dtype=np.bool_)
+        out[parents] = True
+        return ak.layout.NumpyArray(out)
+
+    return _apply(array, function, highlevel, behavior, "contains")
+
+
+def find(array, substring, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        substring (str or bytes): The substring to look for.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns the position of the first occurrence of `substring` in each string,
+    or -1 if it is not found (like Python's `str.find`). Positions are counted
+    in code points for strings and in bytes for bytestrings.
+
+        >>> ak.strings.find(ak.Array(["one", "two", "three"]), "e")
+        <Array [2, -1, 3] type='3 * int64'>
+
+    See also #ak.strings.contains.
+    """
+
+    def function(layout):
+        pattern = _pattern(substring, "substring")
+        nplike, layout, offsets, content = _buffers(layout)
+        if len(pattern) == 0:
+            return ak.layout.NumpyArray(nplike.zeros(len(layout), dtype=np.int64))
+        positions, parents = _first_matches(nplike, offsets, content, pattern)
+        starts = offsets[:-1][parents]
+        if layout.parameter("__array__") == "string":
+            codepoints = _codepoints(nplike, content)
+            positions, starts = codepoints[positions], codepoints[starts]
+        out = nplike.full(len(layout), -1, dtype=np.int64)
+        out[parents] = positions - starts
+        return ak.layout.NumpyArray(out)
+
+    return _apply(array, function, highlevel, behavior, "find")
+
+
+def _change_case(array, method, highlevel, behavior):
+    first = ord("a") if method == "upper" else ord("A")
+
+    def function(layout):
+        nplike, layout, offsets, content = _buffers(layout)
+        content = content.copy()
+        letters = (content >= first) & (content < first + 26)
+        content[letters] ^= 0x20
+
+        if layout.parameter("__array__") == "string":
+            # the non-ASCII strings are converted by Python
+            (which,) = nplike.nonzero(content >= 0x80)
+            if len(which) != 0:
+                parents = nplike.searchsorted(offsets, which, side="right") - 1
+                which = nplike.unique(parents)
+                replacements = [
+                    getattr(
+                        content[offsets[i] : offsets[i + 1]]
+                        .tobytes()
+                        .decode("utf-8", "surrogateescape"),
+                        method,
+                    )().encode("utf-8", "surrogateescape")
+                    for i in which
+                ]
+                offsets, content = _replace_strings(
+                    nplike, offsets, content, which, replacements
+                )
+
+        return _string_layout(offsets, content, layout)
+
+    return _apply(array, function, highlevel, behavior, method)
+
+
+def upper(array, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Converts each string to uppercase, like Python's `str.upper` (or
+    `bytes.upper` for bytestrings, which only changes ASCII letters).
+
+        >>> ak.strings.upper(ak.Array(["one", "Two", "ß"]))
+        <Array ['ONE', 'TWO', 'SS'] type='3 * string'>
+
+    ASCII letters are converted in one pass over all characters; only strings
+    with non-ASCII characters are converted one by one.
+
+    See also #ak.strings.lower.
+    """
+    return _change_case(array, "upper", highlevel, behavior)
+
+
+def lower(array, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Converts each string to lowercase, like Python's `str.lower` (or
+    `bytes.lower` for bytestrings, which only changes ASCII letters).
+
+        >>> ak.strings.lower(ak.Array(["ONE", "Two", "Ä"]))
+        <Array ['one', 'two', 'ä'] type='3 * string'>
+
+    ASCII letters are converted in one pass over all characters; only strings
+    with non-ASCII characters are converted one by one.
+
+    See also #ak.strings.upper.
+    """
+    return _change_case(array, "lower", highlevel, behavior)
+
+
+def _strip(array, chars, left, right, highlevel, behavior, name):
+    def function(layout):
+        if chars is None:
+            pattern = _whitespace
+        else:
+            pattern = _pattern(chars, "chars")
+        if layout.parameter("__array__") == "string" and any(
+            x >= 0x80 for x in bytearray(pattern)
+        ):
+            raise ValueError(
+                "ak.strings.{0} only strips ASCII characters".format(name)
+                + ak._util.exception_suffix(__file__)
+            )
+
+        nplike, layout, offsets, content = _buffers(layout)
+        starts, stops = offsets[:-1], offsets[1:]
+
+        stripped = nplike.zeros(256, dtype=np.bool_)
+        stripped[nplike.frombuffer(pattern, dtype=np.uint8)] = True
+        (kept,) = nplike.nonzero(~stripped[content])
+        kept = nplike.concatenate([kept, [len(content)]])
+
+        if left:
+            starts = kept[nplike.searchsorted(kept, starts)]
+            empty = starts > stops
+            starts[empty] = stops[empty]
+        if right:
+            index = nplike.searchsorted(kept, stops) - 1
+            stops = kept[index] + 1
+            empty = (index < 0) | (stops < starts)
+            stops[empty] = starts[empty]
+
+        return ak.layout.ListArray64(
+            ak.layout.Index64(starts),
+            ak.layout.Index64(stops),
+            layout.content,
+            parameters=layout.parameters,
+        )
+
+    return _apply(array, function, highlevel, behavior, name)
+
+
+def strip(array, chars=None, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        chars (None, str, or bytes): The characters to remove; if None, ASCII
+            whitespace.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Removes leading and trailing `chars` from each string, like Python's
+    `str.strip`, except that only ASCII characters can be stripped.
+
+        >>> ak.strings.strip(ak.Array(["  one ", "two\\n", ""]))
+        <Array ['one', 'two', ''] type='3 * string'>
+
+    The characters are not copied: the output is a view of the input.
+
+    See also #ak.strings.lstrip and #ak.strings.rstrip.
+    """
+    return _strip(array, chars, True, True, highlevel, behavior, "strip")
+
+
+def lstrip(array, chars=None, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        chars (None, str, or bytes): The characters to remove; if None, ASCII
+            whitespace.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Removes leading `chars` from each string, like Python's `str.lstrip`.
+
+    See #ak.strings.strip.
+    """
+    return _strip(array, chars, True, False, highlevel, behavior, "lstrip")
+
+
+def rstrip(array, chars=None, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        chars (None, str, or bytes): The characters to remove; if None, ASCII
+            whitespace.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Removes trailing `chars` from each string, like Python's `str.rstrip`.
+
+    See #ak.strings.strip.
+    """
+    return _strip(array, chars, False, True, highlevel, behavior, "rstrip")
+
+
+def split(array, separator, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        separator (str or bytes): The non-empty delimiter.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Splits each string into a list of strings on `separator`, like Python's
+    `str.split(separator)`, adding a dimension.
+
+        >>> ak.strings.split(ak.Array(["one two", "", "three"]), " ")
+        <Array [['one', 'two'], [''], ['three']] type='3 * var * string'>
+
+    The characters are not copied: the output strings are views of the input.
+
+    See also #ak.strings.join.
+    """
+
+    def function(layout):
+        pattern = _pattern(separator, "separator")
+        if len(pattern) == 0:
+            raise ValueError(
+                "ak.strings.split separator must not be empty"
+                + ak._util.exception_suffix(__file__)
+            )
+        nplike, layout, offsets, content = _buffers(layout)
+        positions, parents = _matches(nplike, offsets, content, pattern)
+
+        # like str.split, overlapping occurrences are taken from left to right
+        while True:
+            overlapping = nplike.zeros(len(positions), dtype=np.bool_)
+            overlapping[1:] = (positions[1:] - positions[:-1] < len(pattern)) & (
+                parents[1:] == parents[:-1]
+            )
+            if not overlapping.any():
+                break
+            dropped = overlapping.copy()
+            dropped[1:] &= ~overlapping[:-1]
+            positions, parents = positions[~dropped], parents[~dropped]
+
+        # number of separators before each string (parents are sorted)
+        before = nplike.searchsorted(parents, nplike.arange(len(layout) + 1))
+        outer = before + nplike.arange(len(layout) + 1)
+
+        rank = nplike.arange(len(positions)) - before[parents]
+        starts = nplike.empty(outer[-1], dtype=np.int64)
+        stops = nplike.empty(outer[-1], dtype=np.int64)
+        starts[outer[:-1]] = offsets[:-1]
+        stops[outer[1:] - 1] = offsets[1:]
+        starts[outer[parents] + rank + 1] = positions + len(pattern)
+        stops[outer[parents] + rank] = positions
+
+        return ak.layout.ListOffsetArray64(
+            ak.layout.Index64(outer),
+            ak.layout.ListArray64(
+                ak.layout.Index64(starts),
+                ak.layout.Index64(stops),
+                layout.content,
+                parameters=layout.parameters,
+            ),
+        )
+
+    return _apply(array, function, highlevel, behavior, "split")
+
+
+def join(array, separator, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of lists of strings or bytestrings, possibly nested.
+        separator (str or bytes): The delimiter to put between strings.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Concatenates each list of strings into one string with `separator`
+    between them, like Python's `separator.join(strings)`, removing a
+    dimension.
+
+        >>> ak.strings.join(ak.Array([["one", "two"], [], ["three"]]), "-")
+        <Array ['one-two', '', 'three'] type='3 * string'>
+
+    See also #ak.strings.split.
+    """
+
+    def getfunction(layout):
+        if isinstance(layout, ak._util.listtypes) and _is_string(layout.content):
+            return lambda: function(layout)
+        elif _is_string(layout) or isinstance(
+            layout, (ak.layout.NumpyArray, ak.layout.EmptyArray)
+        ):
+            raise TypeError(
+                "ak.strings.join applies to lists of strings or bytestrings, "
+                "not {0}".format(ak.type(layout)) + ak._util.exception_suffix(__file__)
+            )
+        else:
+            return None
+
+    def function(layout):
+        layout = layout.toListOffsetArray64(True)
+        strings = layout.content
+        pattern = _pattern(separator, "separator")
+        nplike, strings, offsets, content = _buffers(strings)
+        outer = nplike.asarray(layout.offsets)
+
+        # each string is followed by a separator unless it is last in its list
+        counts = offsets[1:] - offsets[:-1]
+        separated = nplike.ones(len(counts), dtype=np.bool_)
+        separated[outer[1:][outer[1:] > outer[:-1]] - 1] = False
+        separated = separated[: outer[-1]]
+        counts = counts[: outer[-1]]
+
+        newoffsets = nplike.zeros(len(counts) + 1, dtype=np.int64)
+        nplike.cumsum(counts + separated * len(pattern), out=newoffsets[1:])
+        out = nplike.empty(newoffsets[-1], dtype=np.uint8)
+
+        shift = nplike.repeat(newoffsets[:-1] - offsets[: len(counts)], counts)
+        out[nplike.arange(offsets[len(counts)]) + shift] = content[
+            : offsets[len(counts)]
+        ]
+        (which,) = nplike.nonzero(separated)
+        for i, x in enumerate(bytearray(pattern)):
+            out[newoffsets[which] + counts[which] + i] = x
+
+        return _string_layout(newoffsets[outer], out, strings)
+
+    layout = ak.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    out = ak._util.recursively_apply(layout, getfunction, pass_depth=False)
+    return ak._util.maybe_wrap_like(out, array, behavior, highlevel)
+
+
+def match_regex(array, pattern, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array of strings or bytestrings, possibly nested.
+        pattern (str or bytes): The regular expression.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns True for each string in which the regular expression `pattern`
+    matches anywhere (like Python's `re.search`), False otherwise.
+
+        >>> ak.strings.match_regex(ak.Array(["one", "two", "three"]), "^t.*e$")
+        <Array [False, False, True] type='3 * bool'>
+
+    If pyarrow is installed, the whole array is matched by Arrow's RE2 engine
+    without converting the strings to Python objects; otherwise, each string is
+    matched by Python's `re` module. Patterns that are valid in both (most
+    patterns) have the same meaning.
+
+    See also #ak.strings.contains.
+    """
+
+    def function(layout):
+        regex = _pattern(pattern, "pattern")
+        nplike, layout, offsets, content = _buffers(layout)
+        isstring = layout.parameter("__array__") == "string"
+
+        try:
+            import pyarrow
+            import pyarrow.compute
+        except ImportError:
+            pyarrow = None
+
+        if pyarrow is not None and nplike is ak.nplike.Numpy.instance():
+            arrow = pyarrow.Array.from_buffers(
+                pyarrow.large_utf8() if isstring else pyarrow.large_binary(),
+                len(layout),
+                [None, pyarrow.py_buffer(offsets), pyarrow.py_buffer(content)],
+            )
+            out = pyarrow.compute.match_substring_regex(
+                arrow, pattern=regex.decode("utf-8") if isstring else regex
+            )
+            return ak.layout.NumpyArray(
+                nplike.asarray(out.to_numpy(zero_copy_only=False), dtype=np.bool_)
+            )
+
+        if isstring:
+            compiled = re.compile(regex.decode("utf-8"))
+        else:
+            compiled = re.compile(regex)
+        out = nplike.empty(len(layout), dtype=np.bool_)
+        for i in range(len(layout)):
+            data = content[offsets[i] : offsets[i + 1]].tobytes()
+            if isstring:
+                data = data.decode("utf-8", "surrogateescape")
+            out[i] = compiled.search(data) is not None
+        return ak.layout.NumpyArray(out)
+
+    return _apply(array, function, highlevel, behavior, "match_regex")
+
+
+__all__ = [
+    x for x in list(globals()) if not x.startswith("_") and x not in ("ak", "np", "re")
+]
+
+
+def __dir__():
+    return __all__
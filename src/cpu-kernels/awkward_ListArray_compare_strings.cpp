@@ -0,0 +1,38 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_ListArray_compare_strings.cpp", line)
+
+#include <cstring>
+
+#include "awkward/kernels.h"
+
+ERROR awkward_ListArray_compare_strings(
+  int8_t* tocmp,
+  const uint8_t* leftdata,
+  const int64_t* leftstarts,
+  const int64_t* leftstops,
+  const uint8_t* rightdata,
+  const int64_t* rightstarts,
+  const int64_t* rightstops,
+  int64_t length) {
+  for (int64_t i = 0;  i < length;  i++) {
+    int64_t leftlength = leftstops[i] - leftstarts[i];
+    int64_t rightlength = rightstops[i] - rightstarts[i];
+    if (leftlength < 0  ||  rightlength < 0) {
+      return failure("stops[i] < starts[i]", i, kSliceNone, FILENAME(__LINE__));
+    }
+    int64_t common = leftlength < rightlength ? leftlength : rightlength;
+    int cmp = 0;
+    if (common > 0) {
+      // memcmp compares as unsigned char, which is code point order for UTF-8
+      cmp = std::memcmp(&leftdata[leftstarts[i]],
+                        &rightdata[rightstarts[i]],
+                        (size_t)common);
+    }
+    if (cmp == 0) {
+      cmp = (leftlength > rightlength) - (leftlength < rightlength);
+    }
+    tocmp[i] = (int8_t)((cmp > 0) - (cmp < 0));
+  }
+  return success();
+}
@@ -0,0 +1,255 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_ListOffsetArray_argtopk.cpp", line)
+
+#include <algorithm>
+#include <cmath>
+#include <numeric>
+#include <vector>
+
+#include "awkward/kernels.h"
+
+// same order as awkward_argsort (NaN first), with ties broken by position
+// so that the result equals the first k of a stable argsort
+template <typename T>
+bool argtopk_order_smallest(T l, T r, int64_t il, int64_t ir)
+{
+  bool lnan = std::isnan(static_cast<double>(l));
+  bool rnan = std::isnan(static_cast<double>(r));
+  if (lnan  ||  rnan) {
+    return (lnan  &&  !rnan)  ||  (lnan  &&  rnan  &&  il < ir);
+  }
+  return l < r  ||  (!(r < l)  &&  il < ir);
+}
+
+template <typename T>
+bool argtopk_order_largest(T l, T r, int64_t il, int64_t ir)
+{
+  bool lnan = std::isnan(static_cast<double>(l));
+  bool rnan = std::isnan(static_cast<double>(r));
+  if (lnan  ||  rnan) {
+    return (lnan  &&  !rnan)  ||  (lnan  &&  rnan  &&  il < ir);
+  }
+  return l > r  ||  (!(r > l)  &&  il < ir);
+}
+
+template <typename T>
+ERROR awkward_ListOffsetArray_argtopk(
+  int64_t* toptr,
+  const T* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  if (k < 0) {
+    return failure("k must be non-negative", kSliceNone, k, FILENAME(__LINE__));
+  }
+  std::vector<int64_t> result;
+  for (int64_t i = 0;  i < offsetslength - 1;  i++) {
+    int64_t start = offsets[i];
+    int64_t length = offsets[i + 1] - start;
+    if (length < 0) {
+      return failure("offsets[i] > offsets[i + 1]", i, kSliceNone, FILENAME(__LINE__));
+    }
+    int64_t selected = std::min(k, length);
+    result.resize((size_t)length);
+    std::iota(result.begin(), result.end(), 0);
+    const T* values = fromptr + start;
+    // partial_sort only orders the first `selected` items: O(length log k)
+    if (largest) {
+      std::partial_sort(result.begin(), result.begin() + selected, result.end(),
+        [&values](int64_t i1, int64_t i2) {
+          return argtopk_order_largest<T>(values[i1], values[i2], i1, i2);
+        });
+    }
+    else {
+      std::partial_sort(result.begin(), result.begin() + selected, result.end(),
+        [&values](int64_t i1, int64_t i2) {
+          return argtopk_order_smallest<T>(values[i1], values[i2], i1, i2);
+        });
+    }
+    for (int64_t j = 0;  j < selected;  j++) {
+      toptr[i*k + j] = result[(size_t)j];
+    }
+    for (int64_t j = selected;  j < k;  j++) {
+      toptr[i*k + j] = -1;
+    }
+  }
+  return success();
+}
+
+ERROR awkward_ListOffsetArray_argtopk_bool(
+  int64_t* toptr,
+  const bool* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  return awkward_ListOffsetArray_argtopk<bool>(
+    toptr,
+    fromptr,
+    offsets,
+    offsetslength,
+    k,
+    largest);
+}
+
+ERROR awkward_ListOffsetArray_argtopk_int8(
+  int64_t* toptr,
+  const int8_t* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  return awkward_ListOffsetArray_argtopk<int8_t>(
+    toptr,
+    fromptr,
+    offsets,
+    offsetslength,
+    k,
+    largest);
+}
+
+ERROR awkward_ListOffsetArray_argtopk_int16(
+  int64_t* toptr,
+  const int16_t* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  return awkward_ListOffsetArray_argtopk<int16_t>(
+    toptr,
+    fromptr,
+    offsets,
+    offsetslength,
+    k,
+    largest);
+}
+
+ERROR awkward_ListOffsetArray_argtopk_int32(
+  int64_t* toptr,
+  const int32_t* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  return awkward_ListOffsetArray_argtopk<int32_t>(
+    toptr,
+    fromptr,
+    offsets,
+    offsetslength,
+    k,
+    largest);
+}
+
+ERROR awkward_ListOffsetArray_argtopk_int64(
+  int64_t* toptr,
+  const int64_t* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  return awkward_ListOffsetArray_argtopk<int64_t>(
+    toptr,
+    fromptr,
+    offsets,
+    offsetslength,
+    k,
+    largest);
+}
+
+ERROR awkward_ListOffsetArray_argtopk_uint8(
+  int64_t* toptr,
+  const uint8_t* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  return awkward_ListOffsetArray_argtopk<uint8_t>(
+    toptr,
+    fromptr,
+    offsets,
+    offsetslength,
+    k,
+    largest);
+}
+
+ERROR awkward_ListOffsetArray_argtopk_uint16(
+  int64_t* toptr,
+  const uint16_t* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  return awkward_ListOffsetArray_argtopk<uint16_t>(
+    toptr,
+    fromptr,
+    offsets,
+    offsetslength,
+    k,
+    largest);
+}
+
+ERROR awkward_ListOffsetArray_argtopk_uint32(
+  int64_t* toptr,
+  const uint32_t* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  return awkward_ListOffsetArray_argtopk<uint32_t>(
+    toptr,
+    fromptr,
+    offsets,
+    offsetslength,
+    k,
+    largest);
+}
+
+ERROR awkward_ListOffsetArray_argtopk_uint64(
+  int64_t* toptr,
+  const uint64_t* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  return awkward_ListOffsetArray_argtopk<uint64_t>(
+    toptr,
+    fromptr,
+    offsets,
+    offsetslength,
+    k,
+    largest);
+}
+
+ERROR awkward_ListOffsetArray_argtopk_float32(
+  int64_t* toptr,
+  const float* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  return awkward_ListOffsetArray_argtopk<float>(
+    toptr,
+    fromptr,
+    offsets,
+    offsetslength,
+    k,
+    largest);
+}
+
+ERROR awkward_ListOffsetArray_argtopk_float64(
+  int64_t* toptr,
+  const double* fromptr,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  int64_t k,
+  bool largest) {
+  return awkward_ListOffsetArray_argtopk<double>(
+    toptr,
+    fromptr,
+    offsets,
+    offsetslength,
+    k,
+    largest);
+}
@@ -2,13 +2,38 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/Reducer.cpp", line)
 
+#include <algorithm>
+#include <atomic>
+#include <cmath>
 #include <limits>
+#include <stdexcept>
+#include <thread>
+#include <vector>
 
 #include "awkward/kernels.h"
 
 #include "awkward/Reducer.h"
 
 namespace awkward {
+  namespace {
+    std::atomic<int64_t> reducer_threads(1);
+  }
+
+  int64_t
+  Reducer::threads() {
+    return reducer_threads.load();
+  }
+
+  void
+  Reducer::set_threads(int64_t threads) {
+    if (threads < 1) {
+      throw std::invalid_argument(
+        std::string("number of reducer threads must be at least 1, not ")
+        + std::to_string(threads) + FILENAME(__LINE__));
+    }
+    reducer_threads.store(threads);
+  }
+
   util::dtype
   Reducer::return_dtype(util::dtype given_dtype) const {
     return given_dtype;
@@ -2926,4 +2951,87 @@ namespace awkward {
                                  int64_t outlength) const {
     return apply_int64(data, parents, outlength);
   }
+
+  void
+  reduce_moments(const double* x,
+                 const double* y,
+                 const double* weight,
+                 const uint8_t* valid,
+                 const int64_t* starts,
+                 const int64_t* stops,
+                 int64_t length,
+                 double n,
+                 int64_t* count,
+                 double* sumw,
+                 double* meanx,
+                 double* meany,
+                 double* cxx,
+                 double* cyy,
+                 double* cxy,
+                 double* sumwxn) {
+    auto reduce_lists = [&](int64_t startlist, int64_t stoplist) -> void {
+      for (int64_t i = startlist;  i < stoplist;  i++) {
+        int64_t num = 0;
+        double kx = 0.0;
+        double ky = 0.0;
+        double sw = 0.0;
+        double sx = 0.0;
+        double sy = 0.0;
+        double sxx = 0.0;
+        double syy = 0.0;
+        double sxy = 0.0;
+        double sxn = 0.0;
+        for (int64_t j = starts[i];  j < stops[i];  j++) {
+          if (valid != nullptr  &&  !valid[j]) {
+            continue;
+          }
+          if (num == 0) {
+            kx = x[j];
+            if (y != nullptr) {
+              ky = y[j];
+            }
+          }
+          num++;
+          double w = (weight == nullptr ? 1.0 : weight[j]);
+          double dx = x[j] - kx;
+          sw += w;
+          sx += w*dx;
+          sxx += w*dx*dx;
+          if (y != nullptr) {
+            double dy = y[j] - ky;
+            sy += w*dy;
+            syy += w*dy*dy;
+            sxy += w*dx*dy;
+          }
+          if (sumwxn != nullptr) {
+            sxn += std::pow(x[j]*w, n);
+          }
+        }
+        count[i] = num;
+        sumw[i] = sw;
+        meanx[i] = kx + sx / sw;
+        cxx[i] = sxx - sx*sx / sw;
+        if (y != nullptr) {
+          meany[i] = ky + sy / sw;
+          cyy[i] = syy - sy*sy / sw;
+          cxy[i] = sxy - sx*sy / sw;
+        }
+        if (sumwxn != nullptr) {
+          sumwxn[i] = sxn;
+        }
+      }
+    };
+
+    int64_t numchunks = std::max((int64_t)1, std::min(Reducer::threads(), length));
+    std::vector<std::thread> workers;
+    for (int64_t chunk = 1;  chunk < numchunks;  chunk++) {
+      workers.push_back(std::thread(reduce_lists,
+                                    length * chunk / numchunks,
+                                    length * (chunk + 1) / numchunks));
+    }
+    reduce_lists(0, length / numchunks);
+    for (auto& worker : workers) {
+      worker.join();
+    }
+  }
 }
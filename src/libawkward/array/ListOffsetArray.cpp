@@ -1509,24 +1509,42 @@ namespace awkward {
         offsets_.length() - 1);
       util::handle_error(err1, classname(), identities_.get());
 
-      Index64 nextparents(globalstop - globalstart);
-      struct Error err2 = kernel::ListOffsetArray_reduce_local_nextparents_64(
-        kernel::lib::cpu,   // DERIVE
-        nextparents.data(),
-        offsets_.data(),
-        offsets_.length() - 1);
-      util::handle_error(err2, classname(), identities_.get());
-
       ContentPtr trimmed = content_.get()->getitem_range_nowrap(globalstart,
                                                                 globalstop);
-      ContentPtr outcontent = trimmed.get()->reduce_next(reducer,
-                                                         negaxis,
-                                                         util::make_starts(offsets_),
-                                                         shifts,
-                                                         nextparents,
-                                                         offsets_.length() - 1,
-                                                         mask,
-                                                         keepdims);
+      ContentPtr outcontent;
+
+      // Lists of numbers are reduced directly from the offsets, without
+      // making a parents array as large as the content.
+      NumpyArray* rawcontent = dynamic_cast<NumpyArray*>(trimmed.get());
+      if (rawcontent != nullptr  &&
+          rawcontent->ndim() == 1  &&
+          rawcontent->iscontiguous()  &&
+          rawcontent->ptr_lib() == kernel::lib::cpu  &&
+          offsets_.ptr_lib() == kernel::lib::cpu  &&
+          (shifts.length() == 0  ||  !reducer.returns_positions())) {
+        outcontent = rawcontent->reduce_next_offsets(reducer,
+                                                     offsets_,
+                                                     mask,
+                                                     keepdims);
+      }
+      else {
+        Index64 nextparents(globalstop - globalstart);
+        struct Error err2 = kernel::ListOffsetArray_reduce_local_nextparents_64(
+          kernel::lib::cpu,   // DERIVE
+          nextparents.data(),
+          offsets_.data(),
+          offsets_.length() - 1);
+        util::handle_error(err2, classname(), identities_.get());
+
+        outcontent = trimmed.get()->reduce_next(reducer,
+                                                negaxis,
+                                                util::make_starts(offsets_),
+                                                shifts,
+                                                nextparents,
+                                                offsets_.length() - 1,
+                                                mask,
+                                                keepdims);
+      }
 
       Index64 outoffsets(outlength + 1);
       struct Error err3 = kernel::ListOffsetArray_reduce_local_outoffsets_64(
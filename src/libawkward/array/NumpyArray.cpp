@@ -5,10 +5,13 @@
 
 #include <algorithm>
 #include <complex>
+#include <cstring>
+#include <exception>
 #include <iomanip>
 #include <numeric>
 #include <sstream>
 #include <stdexcept>
+#include <thread>
 
 #include "awkward/kernels.h"
 #include "awkward/kernel-utils.h"
@@ -3171,123 +3174,125 @@ namespace awkward {
     return rpad_axis0(target, true);
   }
 
-  const ContentPtr
-  NumpyArray::reduce_next(const Reducer& reducer,
-                          int64_t negaxis,
-                          const Index64& starts,
-                          const Index64& shifts,
-                          const Index64& parents,
-                          int64_t outlength,
-                          bool mask,
-                          bool keepdims) const {
-    if (shape_.empty()) {
-      throw std::runtime_error(
-        std::string("attempting to reduce a scalar") + FILENAME(__LINE__));
-    }
-    else if (shape_.size() != 1  ||  !iscontiguous()) {
-      return toRegularArray().get()->reduce_next(reducer,
-                                                 negaxis,
-                                                 starts,
-                                                 shifts,
-                                                 parents,
-                                                 outlength,
-                                                 mask,
-                                                 keepdims);
-    }
-    else {
-      std::shared_ptr<void> ptr;
-      switch (dtype_) {
+  namespace {
+    // Maximum number of elements in a block of lists in reduce_next_offsets.
+    const int64_t reduce_blocksize = 65536;
+
+    const std::shared_ptr<void>
+    apply_reducer(const Reducer& reducer,
+                  util::dtype dtype,
+                  const std::string& format,
+                  const void* data,
+                  const Index64& parents,
+                  int64_t outlength) {
+      switch (dtype) {
       case util::dtype::boolean:
-        ptr = reducer.apply_bool(reinterpret_cast<bool*>(data()),
-                                 parents,
-                                 outlength);
-        break;
-      case util::dtype::int8:
-        ptr = reducer.apply_int8(reinterpret_cast<int8_t*>(data()),
-                                 parents,
-                                 outlength);
-        break;
-      case util::dtype::int16:
-        ptr = reducer.apply_int16(reinterpret_cast<int16_t*>(data()),
-                                  parents,
-                                  outlength);
-        break;
-      case util::dtype::int32:
-        ptr = reducer.apply_int32(reinterpret_cast<int32_t*>(data()),
-                                  parents,
-                                  outlength);
-        break;
-      case util::dtype::int64:
-        ptr = reducer.apply_int64(reinterpret_cast<int64_t*>(data()),
+        return reducer.apply_bool(reinterpret_cast<const bool*>(data),
                                   parents,
                                   outlength);
-        break;
-      case util::dtype::uint8:
-        ptr = reducer.apply_uint8(reinterpret_cast<uint8_t*>(data()),
+      case util::dtype::int8:
+        return reducer.apply_int8(reinterpret_cast<const int8_t*>(data),
                                   parents,
                                   outlength);
-        break;
-      case util::dtype::uint16:
-        ptr = reducer.apply_uint16(reinterpret_cast<uint16_t*>(data()),
+      case util::dtype::int16:
+        return reducer.apply_int16(reinterpret_cast<const int16_t*>(data),
                                    parents,
                                    outlength);
-        break;
-      case util::dtype::uint32:
-        ptr = reducer.apply_uint32(reinterpret_cast<uint32_t*>(data()),
+      case util::dtype::int32:
+        return reducer.apply_int32(reinterpret_cast<const int32_t*>(data),
                                    parents,
                                    outlength);
-        break;
-      case util::dtype::uint64:
-        ptr = reducer.apply_uint64(reinterpret_cast<uint64_t*>(data()),
+      case util::dtype::int64:
+        return reducer.apply_int64(reinterpret_cast<const int64_t*>(data),
                                    parents,
                                    outlength);
-        break;
+      case util::dtype::uint8:
+        return reducer.apply_uint8(reinterpret_cast<const uint8_t*>(data),
+                                   parents,
+                                   outlength);
+      case util::dtype::uint16:
+        return reducer.apply_uint16(reinterpret_cast<const uint16_t*>(data),
+                                    parents,
+                                    outlength);
+      case util::dtype::uint32:
+        return reducer.apply_uint32(reinterpret_cast<const uint32_t*>(data),
+                                    parents,
+                                    outlength);
+      case util::dtype::uint64:
+        return reducer.apply_uint64(reinterpret_cast<const uint64_t*>(data),
+                                    parents,
+                                    outlength);
       case util::dtype::float16:
         throw std::runtime_error(
           std::string("FIXME: reducers on float16") + FILENAME(__LINE__));
       case util::dtype::float32:
-        ptr = reducer.apply_float32(reinterpret_cast<float*>(data()),
-                                    parents,
-                                    outlength);
-        break;
+        return reducer.apply_float32(reinterpret_cast<const float*>(data),
+                                     parents,
+                                     outlength);
       case util::dtype::float64:
-        ptr = reducer.apply_float64(reinterpret_cast<double*>(data()),
-                                    parents,
-                                    outlength);
-        break;
+        return reducer.apply_float64(reinterpret_cast<const double*>(data),
+                                     parents,
+                                     outlength);
       case util::dtype::float128:
         throw std::runtime_error(
           std::string("FIXME: reducers on float128") + FILENAME(__LINE__));
-        break;
       case util::dtype::complex64:
-        ptr = reducer.apply_complex64(reinterpret_cast<std::complex<float>*>(data()),
-                                      parents,
-                                      outlength);
-        break;
-      case util::dtype::complex128:
-        ptr = reducer.apply_complex128(reinterpret_cast<std::complex<double>*>(data()),
+        return reducer.apply_complex64(reinterpret_cast<const std::complex<float>*>(data),
                                        parents,
                                        outlength);
-        break;
+      case util::dtype::complex128:
+        return reducer.apply_complex128(reinterpret_cast<const std::complex<double>*>(data),
+                                        parents,
+                                        outlength);
       case util::dtype::complex256:
         throw std::runtime_error(
           std::string("FIXME: reducers on complex256") + FILENAME(__LINE__));
-        break;
       case util::dtype::datetime64:
-        ptr = reducer.apply_datetime(reinterpret_cast<int64_t*>(data()),
-                                     parents,
-                                     outlength);
-        break;
-      case util::dtype::timedelta64:
-        ptr = reducer.apply_timedelta(reinterpret_cast<int64_t*>(data()),
+        return reducer.apply_datetime(reinterpret_cast<const int64_t*>(data),
                                       parents,
                                       outlength);
-        break;
+      case util::dtype::timedelta64:
+        return reducer.apply_timedelta(reinterpret_cast<const int64_t*>(data),
+                                       parents,
+                                       outlength);
       default:
         throw std::invalid_argument(
           std::string("cannot apply reducers to NumpyArray with format \"")
-          + format_ + std::string("\"") + FILENAME(__LINE__));
+          + format + std::string("\"") + FILENAME(__LINE__));
       }
+    }
+  }
+
+  const ContentPtr
+  NumpyArray::reduce_next(const Reducer& reducer,
+                          int64_t negaxis,
+                          const Index64& starts,
+                          const Index64& shifts,
+                          const Index64& parents,
+                          int64_t outlength,
+                          bool mask,
+                          bool keepdims) const {
+    if (shape_.empty()) {
+      throw std::runtime_error(
+        std::string("attempting to reduce a scalar") + FILENAME(__LINE__));
+    }
+    else if (shape_.size() != 1  ||  !iscontiguous()) {
+      return toRegularArray().get()->reduce_next(reducer,
+                                                 negaxis,
+                                                 starts,
+                                                 shifts,
+                                                 parents,
+                                                 outlength,
+                                                 mask,
+                                                 keepdims);
+    }
+    else {
+      std::shared_ptr<void> ptr = apply_reducer(reducer,
+                                                dtype_,
+                                                format_,
+                                                data(),
+                                                parents,
+                                                outlength);
 
       if (reducer.returns_positions()) {
         struct Error err3;
@@ -3356,6 +3361,159 @@ namespace awkward {
     }
   }
 
+  const ContentPtr
+  NumpyArray::reduce_next_offsets(const Reducer& reducer,
+                                  const Index64& offsets,
+                                  bool mask,
+                                  bool keepdims) const {
+    if (shape_.size() != 1  ||  !iscontiguous()  ||
+        ptr_lib_ != kernel::lib::cpu) {
+      throw std::runtime_error(
+        std::string("reduce_next_offsets requires a one-dimensional, "
+                    "contiguous array in main memory") + FILENAME(__LINE__));
+    }
+
+    int64_t outlength = offsets.length() - 1;
+    const int64_t* rawoffsets = offsets.data();
+    int64_t first = rawoffsets[0];
+
+    util::dtype dtype = reducer.return_dtype(dtype_);
+    std::string format = util::dtype_to_format(dtype, format_);
+    ssize_t itemsize = util::dtype_to_itemsize(dtype);
+
+    std::shared_ptr<uint8_t> ptr = kernel::malloc<uint8_t>(
+      kernel::lib::cpu, outlength*(int64_t)itemsize);
+    Index8 outmask(mask ? outlength : 0);
+
+    // Divide the lists into chunks with about the same number of elements.
+    int64_t numchunks = std::max(
+      (int64_t)1, std::min(Reducer::threads(), outlength));
+    std::vector<int64_t> bounds({ 0 });
+    for (int64_t i = 1;  i < numchunks;  i++) {
+      int64_t target = first + (rawoffsets[outlength] - first) * i / numchunks;
+      int64_t bound = (int64_t)(std::upper_bound(rawoffsets,
+                                                 rawoffsets + outlength,
+                                                 target) - rawoffsets);
+      bounds.push_back(std::max(bounds.back(), bound));
+    }
+    bounds.push_back(outlength);
+
+    std::vector<std::exception_ptr> errors((size_t)numchunks);
+    auto reduce_chunk = [&](int64_t chunk) -> void {
+      try {
+        // Lists are reduced in blocks of whole lists with at most
+        // reduce_blocksize elements (or one list, if it is longer), so that
+        // the parents array is never as large as the data.
+        std::shared_ptr<Index64> parents = std::make_shared<Index64>(0);
+        int64_t startlist = bounds[(size_t)chunk];
+        int64_t stoplist = bounds[(size_t)chunk + 1];
+        while (startlist < stoplist) {
+          int64_t start = rawoffsets[startlist];
+          int64_t blockstop = (int64_t)(std::upper_bound(
+            rawoffsets + startlist + 1,
+            rawoffsets + stoplist + 1,
+            start + reduce_blocksize) - rawoffsets) - 1;
+          if (blockstop == startlist) {
+            blockstop = startlist + 1;
+          }
+          int64_t numlists = blockstop - startlist;
+          int64_t numitems = rawoffsets[blockstop] - start;
+
+          if (parents.get()->length() < numitems) {
+            parents = std::make_shared<Index64>(numitems);
+          }
+          struct Error err1 = kernel::ListOffsetArray_reduce_local_nextparents_64(
+            kernel::lib::cpu,
+            parents.get()->data(),
+            rawoffsets + startlist,
+            numlists);
+          util::handle_error(err1, classname(), identities_.get());
+          Index64 blockparents = parents.get()->getitem_range_nowrap(0, numitems);
+
+          std::shared_ptr<void> blockptr = apply_reducer(
+            reducer,
+            dtype_,
+            format_,
+            reinterpret_cast<uint8_t*>(data()) + (start - first)*itemsize_,
+            blockparents,
+            numlists);
+
+          if (reducer.returns_positions()) {
+            int64_t* positions = reinterpret_cast<int64_t*>(blockptr.get());
+            for (int64_t i = 0;  i < numlists;  i++) {
+              if (positions[i] >= 0) {
+                positions[i] -= rawoffsets[startlist + i] - start;
+              }
+            }
+          }
+          std::memcpy(ptr.get() + startlist*(int64_t)itemsize,
+                      blockptr.get(),
+                      (size_t)(numlists*(int64_t)itemsize));
+
+          if (mask) {
+            struct Error err2 = kernel::NumpyArray_reduce_mask_ByteMaskedArray_64(
+              kernel::lib::cpu,
+              outmask.data() + startlist,
+              blockparents.data(),
+              numitems,
+              numlists);
+            util::handle_error(err2, classname(), nullptr);
+          }
+
+          startlist = blockstop;
+        }
+      }
+      catch (...) {
+        errors[(size_t)chunk] = std::current_exception();
+      }
+    };
+
+    std::vector<std::thread> workers;
+    for (int64_t chunk = 1;  chunk < numchunks;  chunk++) {
+      workers.push_back(std::thread(reduce_chunk, chunk));
+    }
+    reduce_chunk(0);
+    for (auto& worker : workers) {
+      worker.join();
+    }
+    for (auto error : errors) {
+      if (error) {
+        std::rethrow_exception(error);
+      }
+    }
+
+    std::vector<ssize_t> shape({ (ssize_t)outlength });
+    std::vector<ssize_t> strides({ itemsize });
+    ContentPtr out = std::make_shared<NumpyArray>(Identities::none(),
+                                                  util::Parameters(),
+                                                  ptr,
+                                                  shape,
+                                                  strides,
+                                                  0,
+                                                  itemsize,
+                                                  format,
+                                                  dtype,
+                                                  kernel::lib::cpu);
+
+    if (mask) {
+      out = std::make_shared<ByteMaskedArray>(Identities::none(),
+                                              util::Parameters(),
+                                              outmask,
+                                              out,
+                                              false);
+    }
+
+    if (keepdims) {
+      out = std::make_shared<RegularArray>(Identities::none(),
+                                           util::Parameters(),
+                                           out,
+                                           1,
+                                           length());
+    }
+
+    return out;
+  }
+
   const ContentPtr
   NumpyArray::localindex(int64_t axis, int64_t depth) const {
     int64_t posaxis = axis_wrap_if_negative(axis);
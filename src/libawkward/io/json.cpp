@@ -2,7 +2,9 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/io/json.cpp", line)
 
+#include <cmath>
 #include <complex>
+#include <cstring>
 
 #include "rapidjson/document.h"
 #include "rapidjson/reader.h"
@@ -14,8 +16,11 @@
 #include "rapidjson/error/en.h"
 
 #include "awkward/builder/ArrayBuilder.h"
+#include "awkward/builder/GrowableBuffer.h"
 #include "awkward/Content.h"
 #include "awkward/refactoring.h"
+#include "awkward/array/VirtualArray.h"
+#include "awkward/type/Type.h"
 
 #include "awkward/io/json.h"
 
@@ -758,11 +763,28 @@ namespace awkward {
       return true;
     }
 
+    const std::string
+    error() const {
+      return std::string();
+    }
+
     // FIXME: refactor
-    const ContentPtr snapshot() const {
+    const ContentPtr
+    snapshot() const {
       return ::builder_snapshot(builder_.builder());
     }
 
+    const ContentPtr
+    result(int64_t number) const {
+      ContentPtr obj = snapshot();
+      if (number == 1) {
+        return obj.get()->getitem_at_nowrap(0);
+      }
+      else {
+        return obj;
+      }
+    }
+
   private:
     ArrayBuilder builder_;
     bool moved_;
@@ -771,16 +793,1162 @@ namespace awkward {
     const char* minus_infinity_string_;
   };
 
+  ////////// reading from JSON with a known Form
+
+  namespace {
+    /// @brief Options shared by all FormFillers in one parse.
+    struct FillerOptions {
+      FillerOptions(const ArrayBuilderOptions& builder,
+                    const char* nan_string,
+                    const char* infinity_string,
+                    const char* minus_infinity_string)
+          : builder_(builder)
+          , nan_string_(nan_string)
+          , infinity_string_(infinity_string)
+          , minus_infinity_string_(minus_infinity_string) { }
+
+      const ArrayBuilderOptions builder_;
+      const char* nan_string_;
+      const char* infinity_string_;
+      const char* minus_infinity_string_;
+    };
+
+    /// @brief Fills the buffers of one node of a known Form.
+    ///
+    /// Unlike the Builders behind ArrayBuilder, a FormFiller never changes
+    /// type: a value that does not fit is rejected (the methods return
+    /// `false`) and the SchemaHandler decides whether that is an error or a
+    /// missing value.
+    class FormFiller {
+    public:
+      FormFiller(const FormPtr& form): form_(form) { }
+
+      virtual ~FormFiller() = default;
+
+      const FormPtr
+      form() const {
+        return form_;
+      }
+
+      const std::string
+      typestr() const {
+        return form_.get()->type(util::TypeStrs()).get()->tostring();
+      }
+
+      virtual int64_t
+      length() const = 0;
+
+      virtual bool
+      isoption() const {
+        return false;
+      }
+
+      virtual bool
+      islist() const {
+        return false;
+      }
+
+      virtual bool
+      isrecord() const {
+        return false;
+      }
+
+      virtual bool
+      null() {
+        return false;
+      }
+
+      virtual bool
+      boolean(bool x) {
+        return false;
+      }
+
+      virtual bool
+      integer(int64_t x) {
+        return false;
+      }
+
+      /// @brief Integers too large for `int64_t`.
+      virtual bool
+      unsigned_integer(uint64_t x) {
+        return false;
+      }
+
+      virtual bool
+      real(double x) {
+        return false;
+      }
+
+      virtual bool
+      string(const char* x, int64_t length) {
+        return false;
+      }
+
+      /// @brief Appends the length of every buffer in this subtree to `out`.
+      virtual void
+      checkpoint(std::vector<int64_t>& out) const = 0;
+
+      /// @brief Truncates every buffer in this subtree to a #checkpoint.
+      virtual void
+      rollback(const std::vector<int64_t>& in, size_t& pos) = 0;
+
+      virtual const ContentPtr
+      snapshot() const = 0;
+
+    protected:
+      const FormPtr form_;
+    };
+
+    using FormFillerPtr = std::unique_ptr<FormFiller>;
+
+    FormFillerPtr
+    make_filler(const FormPtr& form, const FillerOptions& options);
+
+    template <typename T>
+    class NumpyFiller: public FormFiller {
+    public:
+      NumpyFiller(const FormPtr& form,
+                  const FillerOptions& options,
+                  util::dtype dtype)
+          : FormFiller(form)
+          , options_(options)
+          , dtype_(dtype)
+          , isfloat_(dtype == util::dtype::float32  ||
+                     dtype == util::dtype::float64)
+          , buffer_(GrowableBuffer<T>::empty(options.builder_)) { }
+
+      int64_t
+      length() const override {
+        return buffer_.length();
+      }
+
+      bool
+      boolean(bool x) override {
+        if (dtype_ == util::dtype::boolean) {
+          buffer_.append((T)x);
+          return true;
+        }
+        return false;
+      }
+
+      bool
+      integer(int64_t x) override {
+        if (dtype_ == util::dtype::boolean) {
+          return false;
+        }
+        if (!isfloat_) {
+          // out-of-range integers are rejected, rather than wrapped around
+          if (std::numeric_limits<T>::is_signed) {
+            if (x < (int64_t)std::numeric_limits<T>::min()  ||
+                x > (int64_t)std::numeric_limits<T>::max()) {
+              return false;
+            }
+          }
+          else if (x < 0  ||
+                   (uint64_t)x > (uint64_t)std::numeric_limits<T>::max()) {
+            return false;
+          }
+        }
+        buffer_.append((T)x);
+        return true;
+      }
+
+      bool
+      unsigned_integer(uint64_t x) override {
+        if (isfloat_  ||  dtype_ == util::dtype::uint64) {
+          buffer_.append((T)x);
+          return true;
+        }
+        return false;
+      }
+
+      bool
+      real(double x) override {
+        if (isfloat_) {
+          buffer_.append((T)x);
+          return true;
+        }
+        else if (dtype_ != util::dtype::boolean  &&
+                 std::isfinite(x)  &&  x == std::floor(x)  &&
+                 x >= (double)std::numeric_limits<T>::min()  &&
+                 x < std::ldexp(1.0, std::numeric_limits<T>::digits)) {
+          buffer_.append((T)x);
+          return true;
+        }
+        return false;
+      }
+
+      bool
+      string(const char* x, int64_t length) override {
+        if (!isfloat_) {
+          return false;
+        }
+        if (options_.nan_string_ != nullptr  &&
+            strcmp(x, options_.nan_string_) == 0) {
+          buffer_.append((T)std::numeric_limits<double>::quiet_NaN());
+          return true;
+        }
+        else if (options_.infinity_string_ != nullptr  &&
+                 strcmp(x, options_.infinity_string_) == 0) {
+          buffer_.append((T)std::numeric_limits<double>::infinity());
+          return true;
+        }
+        else if (options_.minus_infinity_string_ != nullptr  &&
+                 strcmp(x, options_.minus_infinity_string_) == 0) {
+          buffer_.append((T)-std::numeric_limits<double>::infinity());
+          return true;
+        }
+        return false;
+      }
+
+      void
+      checkpoint(std::vector<int64_t>& out) const override {
+        out.push_back(buffer_.length());
+      }
+
+      void
+      rollback(const std::vector<int64_t>& in, size_t& pos) override {
+        buffer_.set_length(in[pos++]);
+      }
+
+      const ContentPtr
+      snapshot() const override {
+        std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+        std::vector<ssize_t> strides = { (ssize_t)sizeof(T) };
+        return std::make_shared<NumpyArray>(Identities::none(),
+                                            form_.get()->parameters(),
+                                            buffer_.ptr(),
+                                            shape,
+                                            strides,
+                                            0,
+                                            sizeof(T),
+                                            util::dtype_to_format(dtype_),
+                                            dtype_,
+                                            kernel::lib::cpu);
+      }
+
+    private:
+      const FillerOptions& options_;
+      const util::dtype dtype_;
+      const bool isfloat_;
+      GrowableBuffer<T> buffer_;
+    };
+
+    class StringFiller: public FormFiller {
+    public:
+      StringFiller(const FormPtr& form,
+                   const FormPtr& content,
+                   const FillerOptions& options)
+          : FormFiller(form)
+          , content_(content)
+          , offsets_(GrowableBuffer<int64_t>::full(options.builder_, 0, 1))
+          , chars_(GrowableBuffer<uint8_t>::empty(options.builder_)) { }
+
+      int64_t
+      length() const override {
+        return offsets_.length() - 1;
+      }
+
+      bool
+      string(const char* x, int64_t length) override {
+        for (int64_t i = 0;  i < length;  i++) {
+          chars_.append((uint8_t)x[i]);
+        }
+        offsets_.append(chars_.length());
+        return true;
+      }
+
+      void
+      checkpoint(std::vector<int64_t>& out) const override {
+        out.push_back(offsets_.length());
+        out.push_back(chars_.length());
+      }
+
+      void
+      rollback(const std::vector<int64_t>& in, size_t& pos) override {
+        offsets_.set_length(in[pos++]);
+        chars_.set_length(in[pos++]);
+      }
+
+      const ContentPtr
+      snapshot() const override {
+        std::vector<ssize_t> shape = { (ssize_t)chars_.length() };
+        std::vector<ssize_t> strides = { (ssize_t)sizeof(uint8_t) };
+        ContentPtr content = std::make_shared<NumpyArray>(
+          Identities::none(),
+          content_.get()->parameters(),
+          chars_.ptr(),
+          shape,
+          strides,
+          0,
+          sizeof(uint8_t),
+          "B",
+          util::dtype::uint8,
+          kernel::lib::cpu);
+        Index64 offsets(offsets_.ptr(), 0, offsets_.length(), kernel::lib::cpu);
+        return std::make_shared<ListOffsetArray64>(Identities::none(),
+                                                   form_.get()->parameters(),
+                                                   offsets,
+                                                   content);
+      }
+
+    private:
+      const FormPtr content_;
+      GrowableBuffer<int64_t> offsets_;
+      GrowableBuffer<uint8_t> chars_;
+    };
+
+    class ListFiller: public FormFiller {
+    public:
+      /// @brief Creates a variable-length (`size < 0`) or regular list.
+      ListFiller(const FormPtr& form,
+                 const FormPtr& content,
+                 int64_t size,
+                 const FillerOptions& options)
+          : FormFiller(form)
+          , content_(make_filler(content, options))
+          , size_(size)
+          , length_(0)
+          , offsets_(GrowableBuffer<int64_t>::full(options.builder_, 0, 1)) { }
+
+      int64_t
+      length() const override {
+        return length_;
+      }
+
+      bool
+      islist() const override {
+        return true;
+      }
+
+      FormFiller*
+      content() const {
+        return content_.get();
+      }
+
+      /// @brief Closes a list whose first item was at `start` in the content.
+      bool
+      endlist(int64_t start) {
+        int64_t stop = content_.get()->length();
+        if (size_ >= 0) {
+          if (stop - start != size_) {
+            return false;
+          }
+        }
+        else {
+          offsets_.append(stop);
+        }
+        length_++;
+        return true;
+      }
+
+      void
+      checkpoint(std::vector<int64_t>& out) const override {
+        out.push_back(length_);
+        out.push_back(offsets_.length());
+        content_.get()->checkpoint(out);
+      }
+
+      void
+      rollback(const std::vector<int64_t>& in, size_t& pos) override {
+        length_ = in[pos++];
+        offsets_.set_length(in[pos++]);
+        content_.get()->rollback(in, pos);
+      }
+
+      const ContentPtr
+      snapshot() const override {
+        if (size_ >= 0) {
+          return std::make_shared<RegularArray>(Identities::none(),
+                                                form_.get()->parameters(),
+                                                content_.get()->snapshot(),
+                                                size_,
+                                                length_);
+        }
+        Index64 offsets(offsets_.ptr(), 0, offsets_.length(), kernel::lib::cpu);
+        return std::make_shared<ListOffsetArray64>(Identities::none(),
+                                                   form_.get()->parameters(),
+                                                   offsets,
+                                                   content_.get()->snapshot());
+      }
+
+    private:
+      const FormFillerPtr content_;
+      const int64_t size_;
+      int64_t length_;
+      GrowableBuffer<int64_t> offsets_;
+    };
+
+    class RecordFiller: public FormFiller {
+    public:
+      RecordFiller(const std::shared_ptr<RecordForm>& form,
+                   const FillerOptions& options)
+          : FormFiller(form)
+          , recordlookup_(form.get()->recordlookup())
+          , keys_(form.get()->keys())
+          , length_(0)
+          , next_(0) {
+        for (auto content : form.get()->contents()) {
+          contents_.push_back(make_filler(content, options));
+        }
+      }
+
+      int64_t
+      length() const override {
+        return length_;
+      }
+
+      bool
+      isrecord() const override {
+        return true;
+      }
+
+      const std::string
+      key(int64_t fieldindex) const {
+        return keys_[(size_t)fieldindex];
+      }
+
+      FormFiller*
+      field(int64_t fieldindex) const {
+        return contents_[(size_t)fieldindex].get();
+      }
+
+      /// @brief Returns the index of a field or `-1` if it's not in the Form.
+      ///
+      /// Fields usually arrive in the same order in every record, so the one
+      /// after the last match is tried before searching the others.
+      int64_t
+      fieldindex(const char* x, int64_t length) {
+        int64_t numfields = (int64_t)keys_.size();
+        for (int64_t j = 0;  j < numfields;  j++) {
+          int64_t i = (next_ + j) % numfields;
+          const std::string& key = keys_[(size_t)i];
+          if ((int64_t)key.length() == length  &&
+              strncmp(key.c_str(), x, (size_t)length) == 0) {
+            next_ = i + 1;
+            return i;
+          }
+        }
+        return -1;
+      }
+
+      /// @brief Fills missing fields with None (if allowed) and closes the
+      /// record; returns the name of a missing field that can't be None.
+      const std::string
+      endrecord() {
+        for (size_t i = 0;  i < contents_.size();  i++) {
+          FormFiller* content = contents_[i].get();
+          if (content->length() == length_) {
+            if (!content->null()) {
+              return keys_[i];
+            }
+          }
+        }
+        length_++;
+        next_ = 0;
+        return std::string();
+      }
+
+      void
+      checkpoint(std::vector<int64_t>& out) const override {
+        out.push_back(length_);
+        for (auto& content : contents_) {
+          content.get()->checkpoint(out);
+        }
+      }
+
+      void
+      rollback(const std::vector<int64_t>& in, size_t& pos) override {
+        length_ = in[pos++];
+        for (auto& content : contents_) {
+          content.get()->rollback(in, pos);
+        }
+      }
+
+      const ContentPtr
+      snapshot() const override {
+        ContentPtrVec contents;
+        for (auto& content : contents_) {
+          contents.push_back(content.get()->snapshot());
+        }
+        std::vector<ArrayCachePtr> caches;  // nothing is virtual here
+        return std::make_shared<RecordArray>(Identities::none(),
+                                             form_.get()->parameters(),
+                                             contents,
+                                             recordlookup_,
+                                             length_,
+                                             caches);
+      }
+
+    private:
+      const util::RecordLookupPtr recordlookup_;
+      const std::vector<std::string> keys_;
+      std::vector<FormFillerPtr> contents_;
+      int64_t length_;
+      int64_t next_;
+    };
+
+    class OptionFiller: public FormFiller {
+    public:
+      OptionFiller(const FormPtr& form,
+                   const FormPtr& content,
+                   const FillerOptions& options)
+          : FormFiller(form)
+          , content_(make_filler(content, options))
+          , index_(GrowableBuffer<int64_t>::empty(options.builder_)) { }
+
+      int64_t
+      length() const override {
+        return index_.length();
+      }
+
+      bool
+      isoption() const override {
+        return true;
+      }
+
+      FormFiller*
+      content() const {
+        return content_.get();
+      }
+
+      /// @brief Points the next item at the next item of the content, which
+      /// the caller is about to fill.
+      void
+      valid() {
+        index_.append(content_.get()->length());
+      }
+
+      /// @brief Replaces the last item with None.
+      void
+      invalidate() {
+        index_.ptr().get()[index_.length() - 1] = -1;
+      }
+
+      bool
+      null() override {
+        index_.append(-1);
+        return true;
+      }
+
+      bool
+      boolean(bool x) override {
+        int64_t at = content_.get()->length();
+        index_.append(content_.get()->boolean(x) ? at : -1);
+        return true;
+      }
+
+      bool
+      integer(int64_t x) override {
+        int64_t at = content_.get()->length();
+        index_.append(content_.get()->integer(x) ? at : -1);
+        return true;
+      }
+
+      bool
+      unsigned_integer(uint64_t x) override {
+        int64_t at = content_.get()->length();
+        index_.append(content_.get()->unsigned_integer(x) ? at : -1);
+        return true;
+      }
+
+      bool
+      real(double x) override {
+        int64_t at = content_.get()->length();
+        index_.append(content_.get()->real(x) ? at : -1);
+        return true;
+      }
+
+      bool
+      string(const char* x, int64_t length) override {
+        int64_t at = content_.get()->length();
+        index_.append(content_.get()->string(x, length) ? at : -1);
+        return true;
+      }
+
+      void
+      checkpoint(std::vector<int64_t>& out) const override {
+        out.push_back(index_.length());
+        content_.get()->checkpoint(out);
+      }
+
+      void
+      rollback(const std::vector<int64_t>& in, size_t& pos) override {
+        index_.set_length(in[pos++]);
+        content_.get()->rollback(in, pos);
+      }
+
+      const ContentPtr
+      snapshot() const override {
+        Index64 index(index_.ptr(), 0, index_.length(), kernel::lib::cpu);
+        return std::make_shared<IndexedOptionArray64>(Identities::none(),
+                                                      form_.get()->parameters(),
+                                                      index,
+                                                      content_.get()->snapshot());
+      }
+
+    private:
+      const FormFillerPtr content_;
+      GrowableBuffer<int64_t> index_;
+    };
+
+    class EmptyFiller: public FormFiller {
+    public:
+      EmptyFiller(const FormPtr& form): FormFiller(form) { }
+
+      int64_t
+      length() const override {
+        return 0;
+      }
+
+      void
+      checkpoint(std::vector<int64_t>& out) const override { }
+
+      void
+      rollback(const std::vector<int64_t>& in, size_t& pos) override { }
+
+      const ContentPtr
+      snapshot() const override {
+        return std::make_shared<EmptyArray>(Identities::none(),
+                                            form_.get()->parameters());
+      }
+    };
+
+    bool
+    is_string_form(const FormPtr& form) {
+      return form.get()->parameter("__array__") == std::string("\"string\"")  ||
+             form.get()->parameter("__array__") == std::string("\"bytestring\"");
+    }
+
+    FormFillerPtr
+    make_list_filler(const FormPtr& form,
+                     const FormPtr& content,
+                     int64_t size,
+                     const FillerOptions& options) {
+      if (is_string_form(form)) {
+        return FormFillerPtr(new StringFiller(form, content, options));
+      }
+      return FormFillerPtr(new ListFiller(form, content, size, options));
+    }
+
+    FormFillerPtr
+    make_filler(const FormPtr& form, const FillerOptions& options) {
+      if (auto raw = std::dynamic_pointer_cast<NumpyForm>(form)) {
+        if (!raw.get()->inner_shape().empty()) {
+          // Nested JSON lists of fixed length are regular dimensions.
+          std::vector<int64_t> inner_shape = raw.get()->inner_shape();
+          FormPtr out = std::make_shared<NumpyForm>(false,
+                                                    raw.get()->parameters(),
+                                                    FormKey(nullptr),
+                                                    std::vector<int64_t>(),
+                                                    raw.get()->itemsize(),
+                                                    raw.get()->format(),
+                                                    raw.get()->dtype());
+          for (auto it = inner_shape.rbegin();  it != inner_shape.rend();  ++it) {
+            out = std::make_shared<RegularForm>(false,
+                                                util::Parameters(),
+                                                FormKey(nullptr),
+                                                out,
+                                                *it);
+          }
+          return make_filler(out, options);
+        }
+        switch (raw.get()->dtype()) {
+          case util::dtype::boolean:
+            return FormFillerPtr(new NumpyFiller<bool>(form, options, raw.get()->dtype()));
+          case util::dtype::int8:
+            return FormFillerPtr(new NumpyFiller<int8_t>(form, options, raw.get()->dtype()));
+          case util::dtype::int16:
+            return FormFillerPtr(new NumpyFiller<int16_t>(form, options, raw.get()->dtype()));
+          case util::dtype::int32:
+            return FormFillerPtr(new NumpyFiller<int32_t>(form, options, raw.get()->dtype()));
+          case util::dtype::int64:
+            return FormFillerPtr(new NumpyFiller<int64_t>(form, options, raw.get()->dtype()));
+          case util::dtype::uint8:
+            return FormFillerPtr(new NumpyFiller<uint8_t>(form, options, raw.get()->dtype()));
+          case util::dtype::uint16:
+            return FormFillerPtr(new NumpyFiller<uint16_t>(form, options, raw.get()->dtype()));
+          case util::dtype::uint32:
+            return FormFillerPtr(new NumpyFiller<uint32_t>(form, options, raw.get()->dtype()));
+          case util::dtype::uint64:
+            return FormFillerPtr(new NumpyFiller<uint64_t>(form, options, raw.get()->dtype()));
+          case util::dtype::float32:
+            return FormFillerPtr(new NumpyFiller<float>(form, options, raw.get()->dtype()));
+          case util::dtype::float64:
+            return FormFillerPtr(new NumpyFiller<double>(form, options, raw.get()->dtype()));
+          default:
+            throw std::invalid_argument(
+              std::string("JSON schema: unsupported primitive type ")
+              + util::quote(raw.get()->primitive())
+              + FILENAME(__LINE__));
+        }
+      }
+      else if (auto raw = std::dynamic_pointer_cast<ListOffsetForm>(form)) {
+        return make_list_filler(form, raw.get()->content(), -1, options);
+      }
+      else if (auto raw = std::dynamic_pointer_cast<ListForm>(form)) {
+        return make_list_filler(form, raw.get()->content(), -1, options);
+      }
+      else if (auto raw = std::dynamic_pointer_cast<RegularForm>(form)) {
+        return make_list_filler(form, raw.get()->content(), raw.get()->size(), options);
+      }
+      else if (auto raw = std::dynamic_pointer_cast<RecordForm>(form)) {
+        return FormFillerPtr(new RecordFiller(raw, options));
+      }
+      else if (auto raw = std::dynamic_pointer_cast<IndexedOptionForm>(form)) {
+        return FormFillerPtr(new OptionFiller(form, raw.get()->content(), options));
+      }
+      else if (auto raw = std::dynamic_pointer_cast<ByteMaskedForm>(form)) {
+        return FormFillerPtr(new OptionFiller(form, raw.get()->content(), options));
+      }
+      else if (auto raw = std::dynamic_pointer_cast<BitMaskedForm>(form)) {
+        return FormFillerPtr(new OptionFiller(form, raw.get()->content(), options));
+      }
+      else if (auto raw = std::dynamic_pointer_cast<UnmaskedForm>(form)) {
+        return FormFillerPtr(new OptionFiller(form, raw.get()->content(), options));
+      }
+      else if (auto raw = std::dynamic_pointer_cast<IndexedForm>(form)) {
+        // An IndexedArray is not needed to represent parsed values.
+        return make_filler(raw.get()->content(), options);
+      }
+      else if (auto raw = std::dynamic_pointer_cast<VirtualForm>(form)) {
+        if (raw.get()->has_form()) {
+          return make_filler(raw.get()->form(), options);
+        }
+        throw std::invalid_argument(
+          std::string("JSON schema: VirtualForm must have a form")
+          + FILENAME(__LINE__));
+      }
+      else if (std::dynamic_pointer_cast<EmptyForm>(form)) {
+        return FormFillerPtr(new EmptyFiller(form));
+      }
+      else {
+        throw std::invalid_argument(
+          std::string("JSON schema: unsupported Form: ")
+          + form.get()->tostring()
+          + FILENAME(__LINE__));
+      }
+    }
+  }
+
+  /// @brief Rapidjson handler that fills a tree of FormFillers.
+  ///
+  /// Each top-level JSON value is an item of the output, except that
+  /// top-level JSON arrays are sequences of items if `toplevel_sequences`.
+  class SchemaHandler: public rj::BaseReaderHandler<rj::UTF8<>, SchemaHandler> {
+  public:
+    SchemaHandler(const FormPtr& schema,
+                  const ArrayBuilderOptions& options,
+                  const char* nan_string,
+                  const char* infinity_string,
+                  const char* minus_infinity_string,
+                  bool toplevel_sequences)
+        : options_(options, nan_string, infinity_string, minus_infinity_string)
+        , root_(make_filler(schema, options_))
+        , toplevel_sequences_(toplevel_sequences)
+        , moved_(false)
+        , skipdepth_(0)
+        , toplevel_values_(0)
+        , toplevel_arrays_(0) { }
+
+    void
+    reset_moved() {
+      moved_ = false;
+    }
+
+    bool
+    moved() const {
+      return moved_;
+    }
+
+    const std::string
+    error() const {
+      return error_;
+    }
+
+    const ContentPtr
+    snapshot() const {
+      return root_.get()->snapshot();
+    }
+
+    const ContentPtr
+    result(int64_t number) const {
+      ContentPtr out = snapshot();
+      if (toplevel_arrays_ == 0  &&  toplevel_values_ == 1) {
+        return out.get()->getitem_at_nowrap(0);
+      }
+      return out;
+    }
+
+    bool Null() {
+      moved_ = true;
+      if (skipdepth_ > 0) {
+        return true;
+      }
+      FormFiller* filler = target();
+      if (filler == nullptr) {
+        return true;
+      }
+      if (!filler->null()) {
+        return fail(filler, "null", 0);
+      }
+      return finish_value();
+    }
+
+    bool Bool(bool x) {
+      moved_ = true;
+      if (skipdepth_ > 0) {
+        return true;
+      }
+      FormFiller* filler = target();
+      if (filler == nullptr) {
+        return true;
+      }
+      if (!filler->boolean(x)) {
+        return fail(filler, "boolean", 0);
+      }
+      return finish_value();
+    }
+
+    bool Int(int x) {
+      return Int64((int64_t)x);
+    }
+
+    bool Uint(unsigned int x) {
+      return Int64((int64_t)x);
+    }
+
+    bool Uint64(uint64_t x) {
+      if (x <= (uint64_t)std::numeric_limits<int64_t>::max()) {
+        return Int64((int64_t)x);
+      }
+      moved_ = true;
+      if (skipdepth_ > 0) {
+        return true;
+      }
+      FormFiller* filler = target();
+      if (filler == nullptr) {
+        return true;
+      }
+      if (!filler->unsigned_integer(x)) {
+        return fail(filler, "integer", 0);
+      }
+      return finish_value();
+    }
+
+    bool Int64(int64_t x) {
+      moved_ = true;
+      if (skipdepth_ > 0) {
+        return true;
+      }
+      FormFiller* filler = target();
+      if (filler == nullptr) {
+        return true;
+      }
+      if (!filler->integer(x)) {
+        return fail(filler, "integer", 0);
+      }
+      return finish_value();
+    }
+
+    bool Double(double x) {
+      moved_ = true;
+      if (skipdepth_ > 0) {
+        return true;
+      }
+      FormFiller* filler = target();
+      if (filler == nullptr) {
+        return true;
+      }
+      if (!filler->real(x)) {
+        return fail(filler, "number", 0);
+      }
+      return finish_value();
+    }
+
+    bool
+    String(const char* str, rj::SizeType length, bool copy) {
+      moved_ = true;
+      if (skipdepth_ > 0) {
+        return true;
+      }
+      FormFiller* filler = target();
+      if (filler == nullptr) {
+        return true;
+      }
+      if (!filler->string(str, (int64_t)length)) {
+        return fail(filler, "string", 0);
+      }
+      return finish_value();
+    }
+
+    bool
+    StartArray() {
+      moved_ = true;
+      if (skipdepth_ > 0) {
+        skipdepth_++;
+        return true;
+      }
+      if (stack_.empty()  &&  toplevel_sequences_) {
+        stack_.push_back(Frame(Frame::toplevel, root_.get()));
+        return true;
+      }
+      FormFiller* filler = target();
+      if (filler == nullptr) {
+        skipdepth_ = 1;
+        return true;
+      }
+      filler = enter_options(filler);
+      if (!filler->islist()) {
+        return fail(filler, "array", 1);
+      }
+      Frame frame(Frame::list, filler);
+      frame.start_ = static_cast<ListFiller*>(filler)->content()->length();
+      stack_.push_back(frame);
+      return true;
+    }
+
+    bool
+    EndArray(rj::SizeType numfields) {
+      moved_ = true;
+      if (skipdepth_ > 0) {
+        return skip_end();
+      }
+      Frame& frame = stack_.back();
+      if (frame.kind_ == Frame::toplevel) {
+        stack_.pop_back();
+        toplevel_arrays_++;
+        return true;
+      }
+      ListFiller* filler = static_cast<ListFiller*>(frame.filler_);
+      if (!filler->endlist(frame.start_)) {
+        return fail(filler, "array of a different length", -1);
+      }
+      stack_.pop_back();
+      return finish_value();
+    }
+
+    bool
+    StartObject() {
+      moved_ = true;
+      if (skipdepth_ > 0) {
+        skipdepth_++;
+        return true;
+      }
+      FormFiller* filler = target();
+      if (filler == nullptr) {
+        skipdepth_ = 1;
+        return true;
+      }
+      filler = enter_options(filler);
+      if (!filler->isrecord()) {
+        return fail(filler, "object", 1);
+      }
+      stack_.push_back(Frame(Frame::record, filler));
+      return true;
+    }
+
+    bool
+    EndObject(rj::SizeType numfields) {
+      moved_ = true;
+      if (skipdepth_ > 0) {
+        return skip_end();
+      }
+      Frame& frame = stack_.back();
+      RecordFiller* filler = static_cast<RecordFiller*>(frame.filler_);
+      std::string missing = filler->endrecord();
+      if (!missing.empty()) {
+        return fail(filler,
+                    std::string("object without field ") + util::quote(missing),
+                    -1);
+      }
+      stack_.pop_back();
+      return finish_value();
+    }
+
+    bool
+    Key(const char* str, rj::SizeType length, bool copy) {
+      moved_ = true;
+      if (skipdepth_ > 0) {
+        return true;
+      }
+      Frame& frame = stack_.back();
+      RecordFiller* filler = static_cast<RecordFiller*>(frame.filler_);
+      frame.fieldindex_ = filler->fieldindex(str, (int64_t)length);
+      if (frame.fieldindex_ >= 0  &&
+          filler->field(frame.fieldindex_)->length() > filler->length()) {
+        return fail(filler,
+                    std::string("object with duplicate field ")
+                    + util::quote(std::string(str, length)),
+                    0);
+      }
+      return true;
+    }
+
+  private:
+    /// @brief One level of nesting in the JSON input.
+    ///
+    /// Option nodes get a frame of their own (without a JSON level) so that
+    /// a mismatch anywhere inside can be rolled back to None.
+    struct Frame {
+      enum Kind { toplevel, list, record, option };
+
+      Frame(Kind kind, FormFiller* filler)
+          : kind_(kind)
+          , filler_(filler)
+          , start_(0)
+          , fieldindex_(-1) { }
+
+      Kind kind_;
+      FormFiller* filler_;
+      int64_t start_;
+      int64_t fieldindex_;
+      std::vector<int64_t> checkpoint_;
+    };
+
+    /// @brief The FormFiller that receives the next value or `nullptr` if
+    /// the value belongs to a field that is not in the schema.
+    FormFiller*
+    target() const {
+      if (stack_.empty()) {
+        return root_.get();
+      }
+      const Frame& frame = stack_.back();
+      switch (frame.kind_) {
+        case Frame::list:
+          return static_cast<ListFiller*>(frame.filler_)->content();
+        case Frame::record:
+          if (frame.fieldindex_ < 0) {
+            return nullptr;
+          }
+          return static_cast<RecordFiller*>(frame.filler_)->field(frame.fieldindex_);
+        default:
+          return root_.get();
+      }
+    }
+
+    /// @brief Passes through the option nodes around an array or object.
+    FormFiller*
+    enter_options(FormFiller* filler) {
+      while (filler->isoption()) {
+        OptionFiller* option = static_cast<OptionFiller*>(filler);
+        Frame frame(Frame::option, option);
+        option->content()->checkpoint(frame.checkpoint_);
+        option->valid();
+        stack_.push_back(frame);
+        filler = option->content();
+      }
+      return filler;
+    }
+
+    /// @brief Completes a value, including its enclosing option nodes.
+    bool
+    finish_value() {
+      while (!stack_.empty()  &&  stack_.back().kind_ == Frame::option) {
+        stack_.pop_back();
+      }
+      if (stack_.empty()) {
+        toplevel_values_++;
+      }
+      return true;
+    }
+
+    bool
+    skip_end() {
+      skipdepth_--;
+      if (skipdepth_ == 0) {
+        return finish_value();
+      }
+      return true;
+    }
+
+    /// @brief Handles a value that does not match the schema.
+    ///
+    /// If any enclosing node is an option type, the value of that node
+    /// becomes None and the rest of its JSON is skipped; otherwise, parsing
+    /// stops with an error. The `opened` argument is the number of JSON
+    /// levels opened (1) or closed (-1) by the offending event.
+    bool
+    fail(const FormFiller* filler, const std::string& what, int64_t opened) {
+      for (int64_t k = (int64_t)stack_.size() - 1;  k >= 0;  k--) {
+        if (stack_[(size_t)k].kind_ == Frame::option) {
+          int64_t depth = opened;
+          for (size_t j = (size_t)k + 1;  j < stack_.size();  j++) {
+            if (stack_[j].kind_ != Frame::option) {
+              depth++;
+            }
+          }
+          OptionFiller* option = static_cast<OptionFiller*>(stack_[(size_t)k].filler_);
+          size_t pos = 0;
+          option->content()->rollback(stack_[(size_t)k].checkpoint_, pos);
+          option->invalidate();
+          stack_.erase(stack_.begin() + k, stack_.end());
+          skipdepth_ = depth;
+          if (skipdepth_ == 0) {
+            return finish_value();
+          }
+          return true;
+        }
+      }
+      error_ = std::string("JSON ") + what
+               + std::string(" does not match schema type ")
+               + util::quote(filler->typestr())
+               + std::string(" at ") + path();
+      return false;
+    }
+
+    const std::string
+    path() const {
+      std::string out("item");
+      for (auto& frame : stack_) {
+        if (frame.kind_ == Frame::list) {
+          out += std::string("[]");
+        }
+        else if (frame.kind_ == Frame::record  &&  frame.fieldindex_ >= 0) {
+          out += std::string(".")
+                 + static_cast<RecordFiller*>(frame.filler_)->key(frame.fieldindex_);
+        }
+      }
+      return out;
+    }
+
+    const FillerOptions options_;
+    const FormFillerPtr root_;
+    const bool toplevel_sequences_;
+    std::vector<Frame> stack_;
+    bool moved_;
+    int64_t skipdepth_;
+    int64_t toplevel_values_;
+    int64_t toplevel_arrays_;
+    std::string error_;
+  };
+
+  /// @brief Parses top-level JSON values until the end of the stream or
+  /// until `max_values` values or `max_bytes` bytes (if positive) have been
+  /// read; returns the number of values.
   template<typename HANDLER, typename STREAM>
-  const ContentPtr
-  do_parse(HANDLER& handler, rj::Reader& reader, STREAM& stream) {
+  int64_t
+  parse_values(HANDLER& handler,
+               rj::Reader& reader,
+               STREAM& stream,
+               int64_t max_values,
+               int64_t max_bytes) {
     int64_t number = 0;
-    while (stream.Peek() != 0) {
+    size_t start = stream.Tell();
+    while (stream.Peek() != 0  &&
+           (max_values <= 0  ||  number < max_values)  &&
+           (max_bytes <= 0  ||  (int64_t)(stream.Tell() - start) < max_bytes)) {
       handler.reset_moved();
       bool fully_parsed = reader.Parse<rj::kParseStopWhenDoneFlag>(stream, handler);
       if (handler.moved()) {
         if (!fully_parsed) {
-          if (stream.Peek() == 0) {
+          if (!handler.error().empty()) {
+            throw std::invalid_argument(
+              handler.error() + std::string(" at char ")
+              + std::to_string(stream.Tell())
+              + FILENAME(__LINE__));
+          }
+          else if (stream.Peek() == 0) {
             throw std::invalid_argument(
                 std::string("incomplete JSON object at the end of the stream")
                 + FILENAME(__LINE__));
@@ -805,14 +1973,14 @@ namespace awkward {
           + FILENAME(__LINE__));
       }
     }
+    return number;
+  }
 
-    ContentPtr obj = handler.snapshot();
-    if (number == 1) {
-      return obj.get()->getitem_at_nowrap(0);
-    }
-    else {
-      return obj;
-    }
+  template<typename HANDLER, typename STREAM>
+  const ContentPtr
+  do_parse(HANDLER& handler, rj::Reader& reader, STREAM& stream) {
+    int64_t number = parse_values(handler, reader, stream, -1, -1);
+    return handler.result(number);
   }
 
   const ContentPtr
@@ -820,9 +1988,19 @@ namespace awkward {
                  const ArrayBuilderOptions& options,
                  const char* nan_string,
                  const char* infinity_string,
-                 const char* minus_infinity_string) {
+                 const char* minus_infinity_string,
+                 const FormPtr& schema) {
     rj::Reader reader;
     rj::StringStream stream(source);
+    if (schema.get() != nullptr) {
+      SchemaHandler handler(schema,
+                            options,
+                            nan_string,
+                            infinity_string,
+                            minus_infinity_string,
+                            true);
+      return do_parse(handler, reader, stream);
+    }
     Handler handler(options,
                     nan_string,
                     infinity_string,
@@ -836,16 +2014,138 @@ namespace awkward {
                int64_t buffersize,
                const char* nan_string,
                const char* infinity_string,
-               const char* minus_infinity_string) {
+               const char* minus_infinity_string,
+               const FormPtr& schema) {
     rj::Reader reader;
     std::shared_ptr<char> buffer = kernel::malloc<char>(kernel::lib::cpu, buffersize);
     rj::FileReadStream stream(source,
                               buffer.get(),
                               ((size_t)buffersize)*sizeof(char));
+    if (schema.get() != nullptr) {
+      SchemaHandler handler(schema,
+                            options,
+                            nan_string,
+                            infinity_string,
+                            minus_infinity_string,
+                            true);
+      return do_parse(handler, reader, stream);
+    }
     Handler handler(options,
                     nan_string,
                     infinity_string,
                     minus_infinity_string);
     return do_parse(handler, reader, stream);
   }
+
+  class FromJsonFileBatches::Impl {
+  public:
+    Impl(FILE* source,
+         const ArrayBuilderOptions& options,
+         int64_t buffersize,
+         const char* nan_string,
+         const char* infinity_string,
+         const char* minus_infinity_string,
+         const FormPtr& schema)
+        : options_(options)
+        , buffer_(kernel::malloc<char>(kernel::lib::cpu, buffersize))
+        , stream_(source, buffer_.get(), ((size_t)buffersize)*sizeof(char))
+        , has_nan_string_(nan_string != nullptr)
+        , has_infinity_string_(infinity_string != nullptr)
+        , has_minus_infinity_string_(minus_infinity_string != nullptr)
+        , nan_string_(nan_string == nullptr ? "" : nan_string)
+        , infinity_string_(infinity_string == nullptr ? "" : infinity_string)
+        , minus_infinity_string_(minus_infinity_string == nullptr ? ""
+                                 : minus_infinity_string)
+        , schema_(schema) { }
+
+    const ContentPtr
+    next(int64_t max_values, int64_t max_bytes) {
+      if (stream_.Peek() == 0) {
+        return ContentPtr(nullptr);
+      }
+      // Each batch gets a new handler (and buffers); the stream, with its
+      // file position and read buffer, carries over from batch to batch.
+      if (schema_.get() != nullptr) {
+        SchemaHandler handler(schema_,
+                              options_,
+                              nan_string(),
+                              infinity_string(),
+                              minus_infinity_string(),
+                              false);
+        return batch(handler, max_values, max_bytes);
+      }
+      Handler handler(options_,
+                      nan_string(),
+                      infinity_string(),
+                      minus_infinity_string());
+      return batch(handler, max_values, max_bytes);
+    }
+
+  private:
+    template <typename HANDLER>
+    const ContentPtr
+    batch(HANDLER& handler, int64_t max_values, int64_t max_bytes) {
+      int64_t number = parse_values(handler,
+                                    reader_,
+                                    stream_,
+                                    max_values,
+                                    max_bytes);
+      if (number == 0) {
+        return ContentPtr(nullptr);
+      }
+      return handler.snapshot();
+    }
+
+    const char*
+    nan_string() const {
+      return has_nan_string_ ? nan_string_.c_str() : nullptr;
+    }
+
+    const char*
+    infinity_string() const {
+      return has_infinity_string_ ? infinity_string_.c_str() : nullptr;
+    }
+
+    const char*
+    minus_infinity_string() const {
+      return has_minus_infinity_string_ ? minus_infinity_string_.c_str()
+                                        : nullptr;
+    }
+
+    const ArrayBuilderOptions options_;
+    std::shared_ptr<char> buffer_;
+    rj::FileReadStream stream_;
+    rj::Reader reader_;
+    const bool has_nan_string_;
+    const bool has_infinity_string_;
+    const bool has_minus_infinity_string_;
+    const std::string nan_string_;
+    const std::string infinity_string_;
+    const std::string minus_infinity_string_;
+    const FormPtr schema_;
+  };
+
+  FromJsonFileBatches::FromJsonFileBatches(FILE* source,
+                                           const ArrayBuilderOptions& options,
+                                           int64_t buffersize,
+                                           const char* nan_string,
+                                           const char* infinity_string,
+                                           const char* minus_infinity_string,
+                                           const FormPtr& schema)
+      : impl_(new Impl(source,
+                       options,
+                       buffersize,
+                       nan_string,
+                       infinity_string,
+                       minus_infinity_string,
+                       schema)) { }
+
+  FromJsonFileBatches::~FromJsonFileBatches() {
+    delete impl_;
+  }
+
+  const ContentPtr
+  FromJsonFileBatches::next(int64_t max_values, int64_t max_bytes) {
+    return impl_->next(max_values, max_bytes);
+  }
 }
@@ -3,6 +3,9 @@
 #include <string>
 
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+#include "awkward/Reducer.h"
 
 #include "awkward/python/startup.h"
 #include "awkward/python/kernel_utils.h"
@@ -89,6 +92,88 @@ PYBIND11_MODULE(_ext, m) {
   m.def("_slice_tostring", [](py::object obj) -> std::string {
     return toslice(obj).tostring();
   });
+  m.def("reducer_threads", []() -> int64_t {
+    return ak::Reducer::threads();
+  });
+  m.def("set_reducer_threads", [](int64_t threads) -> void {
+    ak::Reducer::set_threads(threads);
+  }, py::arg("threads"));
+  m.def("reduce_moments", [](const py::array_t<int64_t, py::array::c_style | py::array::forcecast>& starts,
+                             const py::array_t<int64_t, py::array::c_style | py::array::forcecast>& stops,
+                             const py::array_t<double, py::array::c_style | py::array::forcecast>& x,
+                             const py::object& y,
+                             const py::object& weight,
+                             const py::object& valid,
+                             const py::object& n) -> py::tuple {
+    typedef py::array_t<double, py::array::c_style | py::array::forcecast> doubles;
+    typedef py::array_t<uint8_t, py::array::c_style | py::array::forcecast> bytes;
+    int64_t length = (int64_t)starts.size();
+    if ((int64_t)stops.size() != length) {
+      throw std::invalid_argument("starts and stops must have the same length");
+    }
+    int64_t maxstop = 0;
+    for (int64_t i = 0;  i < length;  i++) {
+      if (starts.data()[i] < 0  ||  stops.data()[i] < starts.data()[i]) {
+        throw std::invalid_argument("starts and stops must be non-decreasing and non-negative");
+      }
+      maxstop = std::max(maxstop, stops.data()[i]);
+    }
+    doubles yarray = (y.is_none() ? doubles(0) : y.cast<doubles>());
+    doubles warray = (weight.is_none() ? doubles(0) : weight.cast<doubles>());
+    bytes varray = (valid.is_none() ? bytes(0) : valid.cast<bytes>());
+    if ((int64_t)x.size() < maxstop  ||
+        (!y.is_none()  &&  (int64_t)yarray.size() < maxstop)  ||
+        (!weight.is_none()  &&  (int64_t)warray.size() < maxstop)  ||
+        (!valid.is_none()  &&  (int64_t)varray.size() < maxstop)) {
+      throw std::invalid_argument("stops exceed the length of the data");
+    }
+
+    py::array_t<int64_t> count(length);
+    doubles sumw(length);
+    doubles meanx(length);
+    doubles meany(y.is_none() ? 0 : length);
+    doubles cxx(length);
+    doubles cyy(y.is_none() ? 0 : length);
+    doubles cxy(y.is_none() ? 0 : length);
+    doubles sumwxn(n.is_none() ? 0 : length);
+    double order = (n.is_none() ? 0.0 : n.cast<double>());
+    {
+      py::gil_scoped_release release;
+      ak::reduce_moments(
+        x.data(),
+        y.is_none() ? nullptr : yarray.data(),
+        weight.is_none() ? nullptr : warray.data(),
+        valid.is_none() ? nullptr : varray.data(),
+        starts.data(),
+        stops.data(),
+        length,
+        order,
+        count.mutable_data(),
+        sumw.mutable_data(),
+        meanx.mutable_data(),
+        y.is_none() ? nullptr : meany.mutable_data(),
+        cxx.mutable_data(),
+        y.is_none() ? nullptr : cyy.mutable_data(),
+        y.is_none() ? nullptr : cxy.mutable_data(),
+        n.is_none() ? nullptr : sumwxn.mutable_data());
+    }
+    py::object none = py::none();
+    return py::make_tuple(
+      count,
+      sumw,
+      meanx,
+      y.is_none() ? none : py::object(meany),
+      cxx,
+      y.is_none() ? none : py::object(cyy),
+      y.is_none() ? none : py::object(cxy),
+      n.is_none() ? none : py::object(sumwxn));
+  }, py::arg("starts"),
+     py::arg("stops"),
+     py::arg("x"),
+     py::arg("y") = py::none(),
+     py::arg("weight") = py::none(),
+     py::arg("valid") = py::none(),
+     py::arg("n") = py::none());
 
   ////////// types.h
 
@@ -134,6 +219,7 @@ PYBIND11_MODULE(_ext, m) {
 
   make_fromjson(m, "fromjson");
   make_fromjsonfile(m, "fromjsonfile");
+  make_fromjsonfile_batches(m, "FromJsonFileBatches");
   make_uproot_issue_90(m);
 
   ////////// forth.h
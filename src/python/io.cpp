@@ -27,12 +27,18 @@ make_fromjson(py::module& m, const std::string& name) {
            const char* minus_infinity_string,
            int64_t initial,
            double resize,
-           int64_t buffersize) -> py::object {
-    ak::ContentPtr out = ak::FromJsonString(source.c_str(),
-                                            ak::ArrayBuilderOptions(initial, resize),
-                                            nan_string,
-                                            infinity_string,
-                                            minus_infinity_string);
+           int64_t buffersize,
+           const ak::FormPtr& schema) -> py::object {
+    ak::ContentPtr out(nullptr);
+    {
+      py::gil_scoped_release release;
+      out = ak::FromJsonString(source.c_str(),
+                               ak::ArrayBuilderOptions(initial, resize),
+                               nan_string,
+                               infinity_string,
+                               minus_infinity_string,
+                               schema);
+    }
     return box(out);
   }, py::arg("source"),
      py::arg("nan_string") = nullptr,
@@ -40,7 +46,8 @@ make_fromjson(py::module& m, const std::string& name) {
      py::arg("minus_infinity_string") = nullptr,
      py::arg("initial") = 1024,
      py::arg("resize") = 1.5,
-     py::arg("buffersize") = 65536);
+     py::arg("buffersize") = 65536,
+     py::arg("schema") = py::none());
 }
 
 void
@@ -52,7 +59,8 @@ make_fromjsonfile(py::module& m, const std::string& name) {
            const char* minus_infinity_string,
            int64_t initial,
            double resize,
-           int64_t buffersize) -> py::object {
+           int64_t buffersize,
+           const ak::FormPtr& schema) -> py::object {
 #ifdef _MSC_VER
       FILE* file;
       if (fopen_s(&file, source.c_str(), "rb") != 0) {
@@ -67,12 +75,14 @@ make_fromjsonfile(py::module& m, const std::string& name) {
       }
       std::shared_ptr<ak::Content> out(nullptr);
       try {
+        py::gil_scoped_release release;
         out = FromJsonFile(file,
                            ak::ArrayBuilderOptions(initial, resize),
                            buffersize,
                            nan_string,
                            infinity_string,
-                           minus_infinity_string);
+                           minus_infinity_string,
+                           schema);
       }
       catch (...) {
         fclose(file);
@@ -86,7 +96,89 @@ make_fromjsonfile(py::module& m, const std::string& name) {
      py::arg("minus_infinity_string") = nullptr,
      py::arg("initial") = 1024,
      py::arg("resize") = 1.5,
-     py::arg("buffersize") = 65536);
+     py::arg("buffersize") = 65536,
+     py::arg("schema") = py::none());
+}
+
+////////// fromjsonfile_batches
+
+/// @brief Owns the file handle that an ak::FromJsonFileBatches reads.
+class JsonFileBatches {
+public:
+  JsonFileBatches(const std::string& source,
+                  const char* nan_string,
+                  const char* infinity_string,
+                  const char* minus_infinity_string,
+                  int64_t initial,
+                  double resize,
+                  int64_t buffersize,
+                  const ak::FormPtr& schema) {
+#ifdef _MSC_VER
+    if (fopen_s(&file_, source.c_str(), "rb") != 0) {
+#else
+    file_ = fopen(source.c_str(), "rb");
+    if (file_ == nullptr) {
+#endif
+      throw std::invalid_argument(
+        std::string("file \"") + source
+        + std::string("\" could not be opened for reading")
+        + FILENAME(__LINE__));
+    }
+    batches_ = std::make_shared<ak::FromJsonFileBatches>(
+      file_,
+      ak::ArrayBuilderOptions(initial, resize),
+      buffersize,
+      nan_string,
+      infinity_string,
+      minus_infinity_string,
+      schema);
+  }
+
+  ~JsonFileBatches() {
+    batches_.reset();
+    fclose(file_);
+  }
+
+  py::object
+  next(int64_t max_values, int64_t max_bytes) {
+    ak::ContentPtr out(nullptr);
+    {
+      py::gil_scoped_release release;
+      out = batches_.get()->next(max_values, max_bytes);
+    }
+    if (out.get() == nullptr) {
+      return py::none();
+    }
+    return box(out);
+  }
+
+private:
+  FILE* file_;
+  std::shared_ptr<ak::FromJsonFileBatches> batches_;
+};
+
+void
+make_fromjsonfile_batches(py::module& m, const std::string& name) {
+  py::class_<JsonFileBatches>(m, name.c_str())
+      .def(py::init<const std::string&,
+                    const char*,
+                    const char*,
+                    const char*,
+                    int64_t,
+                    double,
+                    int64_t,
+                    const ak::FormPtr&>(),
+           py::arg("source"),
+           py::arg("nan_string") = nullptr,
+           py::arg("infinity_string") = nullptr,
+           py::arg("minus_infinity_string") = nullptr,
+           py::arg("initial") = 1024,
+           py::arg("resize") = 1.5,
+           py::arg("buffersize") = 65536,
+           py::arg("schema") = py::none())
+      .def("next", &JsonFileBatches::next,
+           py::arg("max_values"),
+           py::arg("max_bytes") = 0);
 }
 
 ////////// Uproot connector
@@ -0,0 +1,186 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_primitives():
+    form = ak.forms.NumpyForm([], 8, "d")
+    array = ak.from_json("[1, 2.2, 3]", schema=form)
+    assert ak.to_list(array) == [1.0, 2.2, 3.0]
+    assert str(ak.type(array)) == "3 * float64"
+
+    form = ak.forms.NumpyForm([], 4, "i")
+    array = ak.from_json("[1, 2, 3.0]", schema=form)
+    assert ak.to_list(array) == [1, 2, 3]
+    assert str(ak.type(array)) == "3 * int32"
+
+    form = ak.forms.NumpyForm([], 1, "?")
+    array = ak.from_json("[true, false]", schema=form)
+    assert ak.to_list(array) == [True, False]
+
+    with pytest.raises(ValueError):
+        ak.from_json("[1, 2.2, 3]", schema=ak.forms.NumpyForm([], 8, "q"))
+
+
+def test_records_in_lists():
+    form = ak.forms.Form.fromjson(
+        """
+{
+    "class": "ListOffsetArray64",
+    "offsets": "i64",
+    "content": {
+        "class": "RecordArray",
+        "contents": {
+            "x": "float64",
+            "y": {"class": "ListOffsetArray64", "offsets": "i64",
+                  "content": "int64"},
+            "z": {"class": "ListOffsetArray64", "offsets": "i64",
+                  "content": {"class": "NumpyArray", "primitive": "uint8",
+                              "parameters": {"__array__": "char"}},
+                  "parameters": {"__array__": "string"}}
+        }
+    }
+}"""
+    )
+    source = """[
+        [{"y": [1, 2], "x": 1.1, "z": "one"}, {"x": 2.2, "y": [], "z": "two"}],
+        [],
+        [{"x": 3.3, "z": "three", "y": [3], "ignored": {"a": [1, 2]}}]
+    ]"""
+    array = ak.from_json(source, schema=form)
+    assert ak.to_list(array) == [
+        [{"x": 1.1, "y": [1, 2], "z": "one"}, {"x": 2.2, "y": [], "z": "two"}],
+        [],
+        [{"x": 3.3, "y": [3], "z": "three"}],
+    ]
+    assert ak.type(array) == ak.type(ak.from_json(source)[:, :, ["x", "y", "z"]])
+
+
+def test_type_as_schema():
+    array = ak.Array([{"x": 1, "y": [1.1, 2.2]}, {"x": 2, "y": []}])
+    source = ak.to_json(array)
+    assert ak.to_list(ak.from_json(source, schema=ak.type(array))) == ak.to_list(array)
+    assert ak.to_list(ak.from_json(source, schema=array.layout.form)) == ak.to_list(
+        array
+    )
+
+
+def test_json_lines_and_single_record():
+    form = ak.forms.Form.fromjson(
+        '{"class": "RecordArray", "contents": {"x": "int64", "y": "float64"}}'
+    )
+    array = ak.from_json('{"x": 1, "y": 1.1}\n{"x": 2, "y": 2.2}\n', schema=form)
+    assert ak.to_list(array) == [{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}]
+
+    record = ak.from_json('{"x": 1, "y": 1.1}', schema=form)
+    assert isinstance(record, ak.Record)
+    assert ak.to_list(record) == {"x": 1, "y": 1.1}
+
+
+def test_out_of_range_integers():
+    with pytest.raises(ValueError):
+        ak.from_json("[1, 300, -200]", schema=ak.forms.NumpyForm([], 1, "b"))
+    with pytest.raises(ValueError):
+        ak.from_json("[-1]", schema=ak.forms.NumpyForm([], 1, "B"))
+    with pytest.raises(ValueError):
+        ak.from_json("[18446744073709551615]", schema=ak.forms.NumpyForm([], 8, "q"))
+    with pytest.raises(ValueError):
+        ak.from_json("[1e30]", schema=ak.forms.NumpyForm([], 8, "q"))
+
+    array = ak.from_json("[127, -128, 255.0]", schema=ak.forms.NumpyForm([], 2, "h"))
+    assert ak.to_list(array) == [127, -128, 255]
+
+    source = "[18446744073709551615, 9223372036854775809, 0]"
+    array = ak.from_json(source, schema=ak.forms.NumpyForm([], 8, "Q"))
+    assert ak.to_list(array) == [18446744073709551615, 9223372036854775809, 0]
+    array = ak.from_json(source, schema=ak.forms.NumpyForm([], 8, "d"))
+    assert ak.to_list(array) == [18446744073709551615.0, 9223372036854775809.0, 0.0]
+
+    form = ak.forms.Form.fromjson(
+        '{"class": "IndexedOptionArray64", "index": "i64", "content": "int8"}'
+    )
+    array = ak.from_json("[1, 300, null, 1e300, 18446744073709551615]", schema=form)
+    assert ak.to_list(array) == [1, None, None, None, None]
+
+
+def test_mismatch_is_an_error():
+    form = ak.forms.Form.fromjson(
+        '{"class": "RecordArray", "contents": {"x": "int64", "y": "float64"}}'
+    )
+    with pytest.raises(ValueError) as err:
+        ak.from_json('[{"x": 1, "y": 1.1}, {"x": "two", "y": 2.2}]', schema=form)
+    assert "does not match schema" in str(err.value)
+    assert "item.x" in str(err.value)
+
+    with pytest.raises(ValueError) as err:
+        ak.from_json('[{"x": 1}]', schema=form)
+    assert "without field" in str(err.value)
+
+
+def test_mismatch_under_option_is_none():
+    form = ak.forms.Form.fromjson(
+        """
+{
+    "class": "IndexedOptionArray64",
+    "index": "i64",
+    "content": {
+        "class": "RecordArray",
+        "contents": {
+            "x": "int64",
+            "y": {"class": "ListOffsetArray64", "offsets": "i64",
+                  "content": "float64"},
+            "z": {"class": "ByteMaskedArray", "mask": "i8", "valid_when": true,
+                  "content": "float64"}
+        }
+    }
+}"""
+    )
+    source = """
+    {"x": 1, "y": [1.1], "z": 1}
+    {"x": 2, "y": [2.2, "bad", [3.3]], "z": 2}
+    null
+    {"x": 4, "y": [], "z": "bad"}
+    {"x": 5, "y": [5.5]}
+    "not a record"
+    """
+    array = ak.from_json(source, schema=form)
+    assert ak.to_list(array) == [
+        {"x": 1, "y": [1.1], "z": 1.0},
+        None,
+        None,
+        {"x": 4, "y": [], "z": None},
+        {"x": 5, "y": [5.5], "z": None},
+        None,
+    ]
+    assert len(array.layout.content) == 3
+
+
+def test_regular_and_nan_strings():
+    form = ak.forms.RegularForm(ak.forms.NumpyForm([], 8, "d"), 2)
+    array = ak.from_json(
+        '[[1, "nan"], ["inf", 2]]',
+        schema=form,
+        nan_string="nan",
+        infinity_string="inf",
+    )
+    assert isinstance(array.layout, ak.layout.RegularArray)
+    assert np.isnan(array[0, 1])
+    assert array[1, 0] == np.inf
+
+    with pytest.raises(ValueError):
+        ak.from_json("[[1, 2], [3]]", schema=form)
+
+
+def test_file(tmp_path):
+    filename = os.path.join(str(tmp_path), "tmp.json")
+    with open(filename, "w") as file:
+        file.write("[[1.1, 2.2], [], [3.3]]")
+    form = ak.forms.ListOffsetForm("i64", ak.forms.NumpyForm([], 8, "d"))
+    array = ak.from_json(filename, schema=form, buffersize=16)
+    assert ak.to_list(array) == [[1.1, 2.2], [], [3.3]]
@@ -0,0 +1,70 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def write_lines(tmp_path, lines):
+    filename = os.path.join(str(tmp_path), "tmp.jsonl")
+    with open(filename, "w") as file:
+        for line in lines:
+            file.write(line + "\n")
+    return filename
+
+
+def test_batches(tmp_path):
+    filename = write_lines(
+        tmp_path,
+        [
+            '{{"x": {0}, "y": [{1}]}}'.format(i, ", ".join(["1.5"] * i))
+            for i in range(10)
+        ],
+    )
+    batches = list(ak.from_json_iter(filename, batch_size=4, buffersize=16))
+    assert [len(x) for x in batches] == [4, 4, 2]
+    assert ak.to_list(ak.concatenate(batches)) == ak.to_list(ak.from_json(filename))
+
+    batches = list(ak.from_json_iter(filename, batch_size=None, batch_bytes=50))
+    assert sum(len(x) for x in batches) == 10
+    assert all(len(x) < 10 for x in batches)
+
+    with pytest.raises(ValueError):
+        list(ak.from_json_iter(filename, batch_size=None))
+
+
+def test_single_value_is_still_an_array(tmp_path):
+    filename = write_lines(tmp_path, ['{"x": 1}'])
+    (batch,) = ak.from_json_iter(filename, batch_size=10)
+    assert isinstance(batch, ak.Array)
+    assert ak.to_list(batch) == [{"x": 1}]
+
+
+def test_schema(tmp_path):
+    filename = write_lines(tmp_path, ["[1, 2]", "[]", "[3]", "", "[4, 5, 6]"])
+    form = ak.forms.ListOffsetForm("i64", ak.forms.NumpyForm([], 8, "d"))
+    batches = list(ak.from_json_iter(filename, batch_size=3, schema=form))
+    assert [ak.to_list(x) for x in batches] == [
+        [[1.0, 2.0], [], [3.0]],
+        [[4.0, 5.0, 6.0]],
+    ]
+
+    form = ak.forms.Form.fromjson(
+        '{"class": "RecordArray", "contents": {"x": "int32"}}'
+    )
+    filename = write_lines(tmp_path, ['{"x": 1}', '{"x": 2}', '{"x": 3}'])
+    batches = list(ak.from_json_iter(filename, batch_size=2, schema=form))
+    assert [ak.to_list(x) for x in batches] == [[{"x": 1}, {"x": 2}], [{"x": 3}]]
+    assert all(str(ak.type(x).type) == '{"x": int32}' for x in batches)
+
+
+def test_complex_record_fields(tmp_path):
+    filename = write_lines(tmp_path, ['{"r": 1, "i": 2}', '{"r": 3, "i": 4}'])
+    (batch,) = ak.from_json_iter(
+        filename, batch_size=10, complex_record_fields=("r", "i")
+    )
+    assert ak.to_list(batch) == [1 + 2j, 3 + 4j]
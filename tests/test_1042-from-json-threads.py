@@ -0,0 +1,55 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_same_as_one_thread():
+    source = "".join(
+        '{{"x": {0}, "y": {1}}}\n'.format(i, list(range(i % 4))) for i in range(100)
+    )
+    expected = ak.from_json(source)
+    for threads in (2, 3, 7, 200):
+        array = ak.from_json(source, threads=threads)
+        assert ak.to_list(array) == ak.to_list(expected)
+        assert ak.type(array) == ak.type(expected)
+
+
+def test_small_chunks():
+    assert ak.to_list(ak.from_json("[1, 2]", threads=4)) == [1, 2]
+    assert ak.to_list(ak.from_json("[1, 2]\n[3]\n", threads=4)) == [[1, 2], [3]]
+    assert ak.to_list(ak.from_json("1\n\n2\n\n\n3\n4\n5\n", threads=3)) == [
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+
+
+def test_unify_types():
+    array = ak.from_json("1\n2\n3\n4\n5.5\nnull\n", threads=3)
+    assert ak.to_list(array) == [1, 2, 3, 4, 5.5, None]
+    assert str(ak.type(array)) == "6 * ?float64"
+
+
+def test_schema(tmp_path):
+    form = ak.forms.Form.fromjson(
+        '{"class": "RecordArray", "contents": {"x": "int64", "y": "float64"}}'
+    )
+    filename = os.path.join(str(tmp_path), "tmp.json")
+    with open(filename, "w") as file:
+        for i in range(10):
+            file.write('{{"x": {0}, "y": {0}.5}}\n'.format(i))
+    array = ak.from_json(filename, schema=form, threads=3)
+    assert ak.to_list(array) == [{"x": i, "y": i + 0.5} for i in range(10)]
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak.from_json("1\n2\n[3,\n4\n5\n", threads=2)
@@ -0,0 +1,61 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_records_lists_strings_options():
+    data = [
+        {"x": 1, "y": [1.1, 2.2], "z": "one", "w": None, "t": (1, b"a")},
+        {"x": 2, "y": [], "z": "twö", "w": 2, "t": (2, b"bb")},
+        None,
+        {"x": 4, "y": [4.4], "z": "", "w": 4, "t": (4, b"")},
+    ]
+    array = ak.Array(data)
+    assert ak.to_list(array) == data
+    assert array.tolist() == data
+    assert ak.to_list(array[::-1]) == data[::-1]
+    assert ak.to_list(array[[3, 0, 3]]) == [data[3], data[0], data[3]]
+    assert ak.to_list(array[1]) == data[1]
+    assert ak.to_list(array.layout) == data
+    assert isinstance(ak.to_list(array)[0]["t"], tuple)
+
+
+def test_listarray_and_regular():
+    content = ak.layout.NumpyArray(np.arange(10))
+    starts = ak.layout.Index64(np.array([6, 0, 3]))
+    stops = ak.layout.Index64(np.array([9, 0, 5]))
+    listarray = ak.layout.ListArray64(starts, stops, content)
+    assert ak.to_list(listarray) == [[6, 7, 8], [], [3, 4]]
+    assert ak.to_list(listarray[1:]) == [[], [3, 4]]
+
+    regular = ak.layout.RegularArray(content, 3, zeros_length=0)
+    assert ak.to_list(regular) == [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+    assert ak.to_list(ak.layout.RegularArray(content, 0, zeros_length=2)) == [[], []]
+    assert ak.to_list(ak.Array(np.arange(8).reshape(2, 2, 2))) == [
+        [[0, 1], [2, 3]],
+        [[4, 5], [6, 7]],
+    ]
+    assert ak.to_list(ak.to_regular(ak.Array([["ab", "cd"]]), axis=1)) == [["ab", "cd"]]
+
+
+def test_unions_and_partitions():
+    array = ak.Array([1, "two", [3], None, {"x": 5}])
+    assert ak.to_list(array) == [1, "two", [3], None, {"x": 5}]
+    assert ak.to_list(array[::-2]) == [{"x": 5}, [3], 1]
+
+    partitioned = ak.repartition(ak.Array([[1], [2, 3], [], [4]]), 3)
+    assert ak.to_list(partitioned) == [[1], [2, 3], [], [4]]
+
+
+def test_bytemasked_and_indexed():
+    content = ak.layout.NumpyArray(np.array([1.1, 2.2, 3.3]))
+    mask = ak.layout.Index8(np.array([1, 0, 1], np.int8))
+    bytemasked = ak.layout.ByteMaskedArray(mask, content, valid_when=True)
+    assert ak.to_list(bytemasked) == [1.1, None, 3.3]
+
+    index = ak.layout.Index64(np.array([2, 2, 0]))
+    assert ak.to_list(ak.layout.IndexedArray64(index, content)) == [3.3, 3.3, 1.1]
@@ -0,0 +1,128 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def builder(data):
+    out = ak.layout.ArrayBuilder()
+    for x in data:
+        out.fromiter(x)
+    return out.snapshot()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [1, 2, 3],
+        [1, 2.5],
+        [True, False],
+        [True, 1],
+        ["one", "twö", ""],
+        [[1, 2], [], [3]],
+        [[], []],
+        [[1.5], [2]],
+        [{"x": 1, "y": "one"}, {"x": 2, "y": "two"}],
+        [{"x": [1.1], "y": [[1]]}, {"x": [], "y": []}],
+        [{"x": 1}, {"y": 2}],
+        [{"x": 1}, {"x": 1, "y": 2}],
+        [1, None],
+        [(1, 2)],
+        [{}],
+    ],
+)
+def test_same_as_builder(data):
+    array = ak.from_iter(data, highlevel=False)
+    expected = builder(data)
+    assert array.form == expected.form
+    assert ak.to_list(array) == ak.to_list(expected)
+
+
+def test_form():
+    form = ak.forms.Form.fromjson(
+        """
+{
+    "class": "ListOffsetArray32",
+    "offsets": "i32",
+    "content": {
+        "class": "RecordArray",
+        "contents": {
+            "x": "float32",
+            "y": {"class": "ByteMaskedArray", "mask": "i8", "valid_when": true,
+                  "content": "int16"},
+            "z": {"class": "ListOffsetArray64", "offsets": "i64",
+                  "content": {"class": "NumpyArray", "primitive": "uint8",
+                              "parameters": {"__array__": "char"}},
+                  "parameters": {"__array__": "string"}},
+            "t": {"class": "RegularArray", "size": 2,
+                  "content": {"class": "RecordArray", "contents": ["int64", "bool"]}}
+        },
+        "parameters": {"__record__": "Point"}
+    }
+}"""
+    )
+    data = [
+        [{"x": 1, "y": None, "z": "one", "t": [(1, True), (2, False)], "w": 1}],
+        [],
+        [{"x": 2.5, "y": 3, "z": "", "t": [(3, True), (4, True)]}],
+    ]
+    array = ak.from_iter(data, form=form)
+    assert ak.to_list(array) == [
+        [{"x": 1, "y": None, "z": "one", "t": [(1, True), (2, False)]}],
+        [],
+        [{"x": 2.5, "y": 3, "z": "", "t": [(3, True), (4, True)]}],
+    ]
+    assert str(ak.type(array)) == (
+        '3 * var * Point["x": float32, "y": ?int16, "z": string, '
+        '"t": 2 * (int64, bool)]'
+    )
+    assert isinstance(array.layout, ak.layout.ListOffsetArray32)
+
+    assert ak.to_list(ak.from_iter([1, 2], form=ak.type(ak.Array([1.1])))) == [
+        1.0,
+        2.0,
+    ]
+    assert ak.from_iter(
+        {"x": 1}, form='{"class": "RecordArray", "contents": {"x": "int8"}}'
+    ).tolist() == {"x": 1}
+
+
+def test_form_mismatch():
+    with pytest.raises(ValueError):
+        ak.from_iter([1, "two"], form=ak.forms.NumpyForm([], 8, "d"))
+    with pytest.raises(ValueError):
+        ak.from_iter([1, None], form=ak.forms.NumpyForm([], 8, "q"))
+    with pytest.raises(ValueError):
+        ak.from_iter(
+            [[1, 2], [3]], form=ak.forms.RegularForm(ak.forms.NumpyForm([], 8, "q"), 2)
+        )
+    with pytest.raises(ValueError):
+        ak.from_iter(
+            [{"x": 1}],
+            form='{"class": "RecordArray", "contents": {"x": "int64", "y": "int64"}}',
+        )
+    with pytest.raises(TypeError):
+        ak.from_iter([1], form=123)
+
+
+def test_form_integers_out_of_range():
+    assert ak.from_iter([-128, 127], form='"int8"').tolist() == [-128, 127]
+    assert ak.from_iter([2 ** 64 - 1], form='"uint64"').tolist() == [2 ** 64 - 1]
+    assert ak.from_iter([0, 2 ** 63], form='"uint64"').tolist() == [0, 2 ** 63]
+    with pytest.raises(ValueError):
+        ak.from_iter([300], form='"int8"')
+    with pytest.raises(ValueError):
+        ak.from_iter([-1], form='"uint32"')
+    with pytest.raises(ValueError):
+        ak.from_iter([2 ** 63], form='"int64"')
+    with pytest.raises(ValueError):
+        ak.from_iter([-1, 2 ** 63], form='"uint64"')
+    with pytest.raises(ValueError):
+        ak.from_iter([2 ** 64], form='"uint64"')
+    with pytest.raises(ValueError):
+        ak.from_iter(
+            [[1, 2], [1000]], form='{"class": "ListOffsetArray64", "content": "int8"}'
+        )
@@ -0,0 +1,59 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.fixture
+def threads():
+    previous = ak.set_reducer_threads(1)
+    yield
+    ak.set_reducer_threads(previous)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int32, np.bool_])
+@pytest.mark.parametrize(
+    "reducer",
+    [
+        ak.sum,
+        ak.prod,
+        ak.min,
+        ak.max,
+        ak.argmin,
+        ak.argmax,
+        ak.count,
+        ak.count_nonzero,
+        ak.any,
+        ak.all,
+    ],
+)
+def test_same_as_one_thread(threads, dtype, reducer):
+    counts = np.tile([3, 0, 1, 7, 2, 0, 0, 4], 100)
+    content = np.sin(np.arange(counts.sum()) * 1.1) * 10
+    array = ak.unflatten(content.astype(dtype), counts)
+
+    expected = reducer(array, axis=-1)
+    expected_keepdims = reducer(array, axis=-1, keepdims=True)
+    for num in (2, 3, 8, 1000):
+        ak.set_reducer_threads(num)
+        result = reducer(array, axis=-1)
+        assert ak.to_list(result) == ak.to_list(expected)
+        assert result.layout.form == expected.layout.form
+        result = reducer(array, axis=-1, keepdims=True)
+        assert ak.to_list(result) == ak.to_list(expected_keepdims)
+
+
+def test_nested_and_masked(threads):
+    array = ak.Array([[[1, 2, 3], [], [4]], [], [[5, 6], [7]]])
+    expected = ak.to_list(ak.sum(array, axis=-1, mask_identity=True))
+    ak.set_reducer_threads(4)
+    assert ak.to_list(ak.sum(array, axis=-1, mask_identity=True)) == expected
+    assert expected == [[6, None, 4], [], [11, 7]]
+
+
+def test_invalid(threads):
+    with pytest.raises(ValueError):
+        ak.set_reducer_threads(0)
@@ -0,0 +1,50 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.mark.parametrize(
+    "reducer",
+    [
+        ak.sum,
+        ak.prod,
+        ak.min,
+        ak.max,
+        ak.argmin,
+        ak.argmax,
+        ak.count,
+        ak.count_nonzero,
+        ak.any,
+        ak.all,
+    ],
+)
+def test_same_as_parents(reducer):
+    # lists longer than, shorter than, and on the boundaries of a block
+    counts = np.array([0, 100000, 3, 0, 65536, 65535, 1, 0, 2], np.int64)
+    content = ak.layout.NumpyArray(
+        (np.sin(np.arange(counts.sum()) * 0.1) * 100).astype(np.int32)
+    )
+    offsets = ak.layout.Index64(np.concatenate([[0], np.cumsum(counts)]))
+
+    array = ak.Array(ak.layout.ListOffsetArray64(offsets, content))
+    # an IndexedArray content goes through the general algorithm (parents)
+    indexed = ak.layout.IndexedArray64(
+        ak.layout.Index64(np.arange(len(content))), content
+    )
+    expected = ak.Array(ak.layout.ListOffsetArray64(offsets, indexed))
+
+    for kwargs in ({}, {"mask_identity": True}, {"keepdims": True}):
+        assert ak.to_list(reducer(array, axis=-1, **kwargs)) == ak.to_list(
+            reducer(expected, axis=-1, **kwargs)
+        )
+
+
+def test_sliced_offsets():
+    array = ak.Array([[1, 2, 3], [], [4, 5], [6]])[1:]
+    assert ak.to_list(ak.sum(array, axis=-1)) == [0, 9, 6]
+    assert ak.to_list(ak.argmax(array, axis=-1)) == [None, 1, 0]
+    assert ak.to_list(ak.min(array[::-1], axis=-1)) == [6, 4, None]
@@ -0,0 +1,114 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_reduce_moments():
+    x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    y = np.array([2.0, 4.0, 7.0, 8.0, 9.0])
+    w = np.array([1.0, 2.0, 1.0, 0.5, 3.0])
+    starts = np.array([0, 3, 3])
+    stops = np.array([3, 3, 5])
+    count, sumw, meanx, meany, cxx, cyy, cxy, sumwxn = ak._ext.reduce_moments(
+        starts, stops, x, y, w, None, 2
+    )
+    assert count.tolist() == [3, 0, 2]
+    assert sumw.tolist() == [4.0, 0.0, 3.5]
+    for i, (start, stop) in enumerate(zip(starts, stops)):
+        if start == stop:
+            assert np.isnan(meanx[i]) and np.isnan(cxy[i])
+            continue
+        xi, yi, wi = x[start:stop], y[start:stop], w[start:stop]
+        mx = np.sum(wi * xi) / np.sum(wi)
+        my = np.sum(wi * yi) / np.sum(wi)
+        assert meanx[i] == pytest.approx(mx)
+        assert meany[i] == pytest.approx(my)
+        assert cxx[i] == pytest.approx(np.sum(wi * (xi - mx) ** 2))
+        assert cyy[i] == pytest.approx(np.sum(wi * (yi - my) ** 2))
+        assert cxy[i] == pytest.approx(np.sum(wi * (xi - mx) * (yi - my)))
+        assert sumwxn[i] == pytest.approx(np.sum((xi * wi) ** 2))
+
+    count, sumw, meanx, meany, cxx, cyy, cxy, sumwxn = ak._ext.reduce_moments(
+        [0], [5], x, valid=np.array([1, 0, 1, 0, 1], np.uint8)
+    )
+    assert count.tolist() == [3]
+    assert meanx.tolist() == [3.0]
+    assert cxx.tolist() == [8.0]
+    assert meany is None and cxy is None and sumwxn is None
+
+    with pytest.raises(ValueError):
+        ak._ext.reduce_moments([0], [6], x)
+
+
+def test_same_as_separate_sums():
+    x = ak.Array([[1, 2, 3, 5], [], None, [4, 6], [1.5, None, 7.5]])
+    w = ak.Array([2.0, 0.5, 1.0, 1.0, 3.0])
+    for mask_identity in (False, True):
+        kwargs = {"axis": -1, "mask_identity": mask_identity}
+        sumw = ak.sum(x * 0 + w, **kwargs)
+        sumwx = ak.sum(x * w, **kwargs)
+        xmean = sumwx / sumw
+        sumwxx = ak.sum((x - xmean) ** 2 * w, **kwargs)
+        sumwx3 = ak.sum((x * w) ** 3, **kwargs)
+
+        def check(result, expected):
+            assert ak.type(result) == ak.type(expected)
+            result, expected = ak.to_list(result), ak.to_list(expected)
+            assert [
+                None if r is None else pytest.approx(r, nan_ok=True) for r in result
+            ] == expected
+
+        check(ak.mean(x, weight=w, **kwargs), xmean)
+        check(ak.var(x, weight=w, **kwargs), sumwxx / sumw)
+        check(ak.std(x, weight=w, **kwargs), np.sqrt(sumwxx / sumw))
+        check(ak.moment(x, 3, weight=w, **kwargs), sumwx3 / sumw)
+
+    assert ak.to_list(ak.mean(x, axis=-1, keepdims=True)) == [
+        [2.75],
+        [None],
+        None,
+        [5.0],
+        [4.5],
+    ]
+    assert ak.mean(x) == pytest.approx(30.0 / 8)
+    assert ak.var(ak.Array([1, 2, 3, 4]), ddof=1) == pytest.approx(5.0 / 3)
+
+
+def test_two_variables():
+    x = ak.Array([[1, 2, 3, 4], [], [1.5, 2.5, 4.0]])
+    y = ak.Array([[1.1, 2.9, 5.2, 6.8], [], [3.0, 5.5, 7.5]])
+    covar = ak.covar(x, y, axis=-1)
+    corr = ak.corr(x, y, axis=-1)
+    fit = ak.linear_fit(x, y, axis=-1)
+    for i in (0, 2):
+        xi, yi = np.asarray(x[i]), np.asarray(y[i])
+        assert covar[i] == pytest.approx(np.cov(xi, yi, bias=True)[0, 1])
+        assert corr[i] == pytest.approx(np.corrcoef(xi, yi)[0, 1])
+        slope, intercept = np.polyfit(xi, yi, 1)
+        assert fit[i].slope == pytest.approx(slope)
+        assert fit[i].intercept == pytest.approx(intercept)
+    assert covar[1] is None and corr[1] is None and fit[1].slope is None
+
+    fit = ak.linear_fit(ak.flatten(x), ak.flatten(y))
+    assert isinstance(fit, ak.Record)
+    assert fit.slope == pytest.approx(np.polyfit(ak.flatten(x), ak.flatten(y), 1)[0])
+
+
+def test_numerical_stability():
+    array = ak.Array([[1e9 + 1, 1e9 + 2, 1e9 + 3], [1e12 + 4, 1e12 + 6]])
+    assert ak.to_list(ak.var(array, axis=-1)) == [pytest.approx(2.0 / 3), 1.0]
+
+
+def test_threads():
+    array = ak.Array(np.arange(1000, dtype=np.float64) ** 1.5)
+    array = ak.unflatten(array, [3, 0, 100, 97, 400, 400])
+    expected = ak.to_list(ak.var(array, axis=-1))
+    previous = ak.set_reducer_threads(3)
+    try:
+        assert ak.to_list(ak.var(array, axis=-1)) == expected
+    finally:
+        ak.set_reducer_threads(previous)
@@ -0,0 +1,94 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+pytest.importorskip("pyarrow.parquet")
+
+
+def records(start, stop):
+    return [
+        {"x": i, "y": [j * 1.1 for j in range(i % 4)], "z": {"w": str(i)}}
+        for i in range(start, stop)
+    ]
+
+
+@pytest.mark.parametrize("prefetch", [1, 2, 10])
+def test_single_file(tmp_path, prefetch):
+    filename = os.path.join(str(tmp_path), "test.parquet")
+    ak.to_parquet(ak.repartition(ak.Array(records(0, 20)), 3), filename)
+
+    array = ak.from_parquet(filename, lazy=True, prefetch=prefetch)
+    assert array.layout.numpartitions == 7
+    dataset = array.layout.partition(0).field("x").generator.callable._dataset
+
+    assert ak.to_list(array.layout.partition(0).field("x").array) == [0, 1, 2]
+    upcoming = range(1, 1 + min(prefetch, 6))
+    assert list(dataset._prefetched) == [(i, ("x",)) for i in upcoming]
+
+    for partition in array.layout.partitions:
+        ak.to_list(partition.field("x").array)
+    assert dataset._prefetched == {}
+
+    assert array.tolist() == records(0, 20)
+    assert dataset._prefetched == {}
+
+
+def test_skipped_row_groups_are_dropped(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.parquet")
+    ak.to_parquet(ak.repartition(ak.Array(records(0, 20)), 2), filename)
+
+    array = ak.from_parquet(filename, lazy=True, prefetch=2)
+    assert array.layout.numpartitions == 10
+    dataset = array.layout.partition(0).field("x").generator.callable._dataset
+
+    ak.to_list(array.layout.partition(0).field("x").array)
+    ak.to_list(array.layout.partition(0).field("y").array)
+    assert sorted(dataset._prefetched) == [
+        (1, ("x",)),
+        (1, ("y",)),
+        (2, ("x",)),
+        (2, ("y",)),
+    ]
+
+    assert ak.to_list(array.layout.partition(6).field("x").array) == [12, 13]
+    assert sorted(dataset._prefetched) == [
+        (1, ("y",)),
+        (2, ("y",)),
+        (7, ("x",)),
+        (8, ("x",)),
+    ]
+
+    assert ak.to_list(array.layout.partition(9).field("x").array) == [18, 19]
+    assert sorted(dataset._prefetched) == [(1, ("y",)), (2, ("y",))]
+
+
+def test_row_groups_and_directory(tmp_path):
+    for i in range(3):
+        filename = os.path.join(str(tmp_path), "part{0}.parquet".format(i))
+        ak.to_parquet(
+            ak.repartition(ak.Array(records(10 * i, 10 * i + 10)), 5), filename
+        )
+
+    expected = records(5, 10) + records(15, 20) + records(25, 30)
+    array = ak.from_parquet(tmp_path, row_groups=[1, 3, 5], lazy=True, prefetch=1)
+    assert array.tolist() == expected
+
+    ak.to_parquet.dataset(tmp_path)
+    array = ak.from_parquet(tmp_path, row_groups=[1, 3, 5], lazy=True, prefetch=4)
+    assert array.tolist() == expected
+
+
+def test_errors(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.parquet")
+    ak.to_parquet(ak.Array(records(0, 5)), filename)
+
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, lazy=True, prefetch=-1)
+    assert ak.from_parquet(filename, prefetch=1).tolist() == records(0, 5)
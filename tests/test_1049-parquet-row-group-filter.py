@@ -0,0 +1,87 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+pytest.importorskip("pyarrow.parquet")
+
+
+def records(start, stop):
+    return [
+        {"t": i, "y": [i + 0.5] * (i % 3), "z": {"w": -i}} for i in range(start, stop)
+    ]
+
+
+def test_single_file(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.parquet")
+    ak.to_parquet(ak.repartition(ak.Array(records(0, 20)), 5), filename)
+
+    for lazy in (False, True):
+        array = ak.from_parquet(filename, filter=("t", ">=", 12), lazy=lazy)
+        assert array.tolist() == records(10, 20)
+
+        array = ak.from_parquet(
+            filename, filter=[("t", ">=", 5), ("t", "<", 10)], lazy=lazy
+        )
+        assert array.tolist() == records(5, 10)
+
+        array = ak.from_parquet(
+            filename, filter=[[("t", "<", 2)], [("t", "in", [17, 100])]], lazy=lazy
+        )
+        assert array.tolist() == records(0, 5) + records(15, 20)
+
+    # nested fields, including lists of numbers
+    assert ak.from_parquet(filename, filter=("z.w", "==", -7)).tolist() == records(
+        5, 10
+    )
+    assert ak.from_parquet(filename, filter=("y", ">", 16)).tolist() == records(15, 20)
+
+    # combined with row_groups
+    assert ak.from_parquet(
+        filename, row_groups=[0, 1, 2], filter=("t", ">", 7), lazy=True
+    ).tolist() == records(5, 15)
+
+    empty = ak.from_parquet(filename, filter=("t", ">", 100))
+    assert isinstance(empty, ak.Array)
+    assert len(empty) == 0
+
+
+def test_partitioned_dataset(tmp_path):
+    for year in (2020, 2021):
+        os.makedirs(os.path.join(str(tmp_path), "year={0}".format(year)))
+        filename = os.path.join(str(tmp_path), "year={0}".format(year), "a.parquet")
+        start = (year - 2020) * 20
+        ak.to_parquet(ak.repartition(ak.Array(records(start, start + 20)), 5), filename)
+
+    def expected(start, stop):
+        return [
+            {"year": str(2020 + x["t"] // 20), "t": x["t"], "y": x["y"], "z": x["z"]}
+            for x in records(start, stop)
+        ]
+
+    for lazy in (False, True):
+        array = ak.from_parquet(tmp_path, filter=("t", "in", [3, 26]), lazy=lazy)
+        assert array.tolist() == expected(0, 5) + expected(25, 30)
+
+    ak.to_parquet.dataset(tmp_path)
+    for lazy in (False, True):
+        array = ak.from_parquet(tmp_path, filter=("t", "in", [3, 26]), lazy=lazy)
+        assert array.tolist() == expected(0, 5) + expected(25, 30)
+
+
+def test_errors(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.parquet")
+    ak.to_parquet(ak.Array(records(0, 5)), filename)
+
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, filter=("t", "~", 3))
+    with pytest.raises(ValueError):
+        ak.from_parquet(filename, filter=("z", "==", 3))
+    with pytest.raises(TypeError):
+        ak.from_parquet(filename, filter="t > 3")
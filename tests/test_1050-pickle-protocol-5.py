@@ -0,0 +1,67 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pickle
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(pickle, "PickleBuffer"), reason="pickle protocol 5 is required"
+)
+
+
+def dumps_out_of_band(obj):
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    return data, [x.raw() for x in buffers]
+
+
+def test_array_is_not_copied():
+    array = ak.Array([[{"x": 1, "y": [1.1]}, None], [], [{"x": 3, "y": []}]])
+    data, buffers = dumps_out_of_band(array)
+
+    layout = array.layout
+    originals = [
+        np.asarray(layout.offsets),
+        np.asarray(layout.content.index),
+        np.asarray(layout.content.content.field("x")),
+        np.asarray(layout.content.content.field("y").offsets),
+        np.asarray(layout.content.content.field("y").content),
+    ]
+    assert len(buffers) == len(originals)
+    for buffer in buffers:
+        assert any(np.shares_memory(np.asarray(buffer), x) for x in originals)
+
+    result = pickle.loads(data, buffers=buffers)
+    assert result.tolist() == array.tolist()
+    assert np.shares_memory(
+        np.asarray(result.layout.content.content.field("x")), np.asarray(buffers[2])
+    )
+
+
+def test_record():
+    record = ak.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": [2.2, 3.3]}])[1]
+    data, buffers = dumps_out_of_band(record)
+    assert len(buffers) == 3
+    result = pickle.loads(data, buffers=buffers)
+    assert isinstance(result, ak.Record)
+    assert result.tolist() == {"x": 2, "y": [2.2, 3.3]}
+
+
+def test_partitioned():
+    array = ak.repartition(ak.Array([[1, 2, 3], [], [4, 5], [6]]), 2)
+    data, buffers = dumps_out_of_band(array)
+    assert len(buffers) == 4
+    assert pickle.loads(data, buffers=buffers).tolist() == array.tolist()
+
+    layout = array.layout
+    data, buffers = dumps_out_of_band(layout)
+    result = pickle.loads(data, buffers=buffers)
+    assert isinstance(result, ak.partition.IrregularlyPartitionedArray)
+    assert result.stops == layout.stops
+    assert ak.to_list(result) == ak.to_list(layout)
+    assert ak.to_list(pickle.loads(pickle.dumps(layout))) == ak.to_list(layout)
@@ -0,0 +1,55 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_round_trip(tmp_path):
+    filename = os.path.join(str(tmp_path), "array.awkward")
+    array = ak.Array(
+        [{"x": 1, "y": [1.1, 2.2], "z": "one"}, None, {"x": 3, "y": [], "z": "three"}]
+    )
+    ak.to_mmap(array, filename)
+
+    result = ak.from_mmap(filename)
+    assert result.tolist() == array.tolist()
+    assert ak.type(result) == ak.type(ak.from_buffers(*ak.to_buffers(array)))
+
+    # the layout is a view of the file, so changes to the file are visible
+    mapped = np.memmap(filename, dtype=np.uint8, mode="r+")
+    words = mapped[: len(mapped) // 8 * 8].view(np.int64)
+    (where,) = np.nonzero((words[:-1] == 1) & (words[1:] == 3))
+    assert len(where) == 1
+    words[where[0]] = 100
+    mapped.flush()
+    assert result.x.tolist() == [100, None, 3]
+    del words, mapped
+
+    lazy = ak.from_mmap(filename, lazy=True)
+    assert isinstance(lazy.layout, ak.layout.VirtualArray)
+    assert lazy.x.tolist() == [100, None, 3]
+    assert lazy.tolist() == result.tolist()
+
+
+def test_partitioned(tmp_path):
+    filename = os.path.join(str(tmp_path), "array.awkward")
+    array = ak.repartition(ak.Array([[1, 2, 3], [], [4, 5], [6]]), 2)
+    ak.to_mmap(array, filename)
+
+    result = ak.from_mmap(filename, highlevel=False)
+    assert isinstance(result, ak.partition.PartitionedArray)
+    assert result.stops == [2, 4]
+    assert ak.to_list(result) == array.tolist()
+
+
+def test_not_an_mmap_file(tmp_path):
+    filename = os.path.join(str(tmp_path), "array.json")
+    with open(filename, "w") as file:
+        file.write("[1, 2, 3]")
+    with pytest.raises(ValueError):
+        ak.from_mmap(filename)
@@ -0,0 +1,99 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+array = ak.Array(
+    [{"x": 1, "y": [1.1, 2.2], "z": "one"}, None, {"x": 3, "y": [], "z": "three"}] * 100
+)
+
+
+@pytest.mark.parametrize(
+    "compression",
+    [
+        "zlib",
+        "shuffle-bz2",
+        "shuffle",
+        "delta-shuffle-zlib",
+        "delta",
+        {"offsets": "delta-zlib", "index": "delta-lzma", "data": "shuffle-zlib"},
+        {"offsets": "delta"},
+    ],
+)
+def test_round_trip(compression):
+    form, length, container = ak.to_buffers(ak.packed(array), compression=compression)
+    if isinstance(compression, str):
+        assert all(isinstance(x, bytes) for x in container.values())
+
+    result = ak.from_buffers(form, length, container, compression=compression)
+    assert result.tolist() == array.tolist()
+
+    lazy = ak.from_buffers(form, length, container, lazy=True, compression=compression)
+    assert lazy.tolist() == array.tolist()
+
+
+def test_smaller():
+    form, length, raw = ak.to_buffers(ak.packed(array))
+    form, length, compressed = ak.to_buffers(
+        ak.packed(array), compression={"offsets": "delta-zlib", "index": "delta-zlib"}
+    )
+    for key in raw:
+        if key.endswith("-offsets") or key.endswith("-index"):
+            assert len(compressed[key]) < raw[key].nbytes / 4
+        else:
+            assert np.array_equal(compressed[key], raw[key])
+
+
+def test_delta_for_all_buffers():
+    floats = ak.Array([[1.5]])
+    form, length, container = ak.to_buffers(floats, compression="delta-shuffle-zlib")
+    assert container["part0-node1-data"].startswith(b"shuffle-zlib <f8\n")
+    assert container["part0-node0-offsets"].startswith(b"delta-shuffle-zlib <i8\n")
+    result = ak.from_buffers(form, length, container, compression="delta-shuffle-zlib")
+    assert result.tolist() == [[1.5]]
+
+
+def test_missing_compression():
+    form, length, container = ak.to_buffers(array, compression="zlib")
+    with pytest.raises(ValueError) as err:
+        ak.from_buffers(form, length, container)
+    assert "pass the same compression" in str(err.value)
+
+    form, length, container = ak.to_buffers(array, compression={"offsets": "zlib"})
+    with pytest.raises(ValueError) as err:
+        ak.from_buffers(form, length, container)
+    assert "pass the same compression" in str(err.value)
+
+
+def test_partitioned():
+    partitioned = ak.repartition(array, 70)
+    form, length, container = ak.to_buffers(partitioned, compression="zlib")
+    result = ak.from_buffers(form, length, container, compression="zlib")
+    assert ak.partitions(result) == ak.partitions(partitioned)
+    assert result.tolist() == array.tolist()
+
+
+@pytest.mark.parametrize("module, codec", [("zstandard", "zstd"), ("lz4", "lz4")])
+def test_optional_compressors(module, codec):
+    pytest.importorskip(module)
+    compression = {"offsets": "delta-" + codec, "data": "shuffle-" + codec}
+    form, length, container = ak.to_buffers(array, compression=compression)
+    result = ak.from_buffers(form, length, container, compression=compression)
+    assert result.tolist() == array.tolist()
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak.to_buffers(array, compression="gzip")
+    with pytest.raises(ValueError):
+        ak.to_buffers(array, compression="shuffle-delta-zlib")
+    with pytest.raises(ValueError):
+        ak.to_buffers(array, compression={"content": "zlib"})
+    with pytest.raises(ValueError):
+        ak.to_buffers(array, compression={"data": "delta"})
+    with pytest.raises(TypeError):
+        ak.to_buffers(array, compression=["zlib"])
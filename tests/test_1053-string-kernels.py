@@ -0,0 +1,122 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+strings = ["one two", "", "three", "über  alles", None, "aaaa", "  pad  "]
+array = ak.Array(strings)
+
+
+def expected(function):
+    return [None if x is None else function(x) for x in strings]
+
+
+@pytest.mark.skipif(sys.version_info[0] < 3, reason="str methods on unicode")
+def test_like_python():
+    assert ak.strings.length(array).tolist() == expected(len)
+
+    for pattern in ["t", "th", "", "aa", "über", "e"]:
+        assert ak.strings.startswith(array, pattern).tolist() == expected(
+            lambda x: x.startswith(pattern)
+        )
+        assert ak.strings.endswith(array, pattern).tolist() == expected(
+            lambda x: x.endswith(pattern)
+        )
+        assert ak.strings.contains(array, pattern).tolist() == expected(
+            lambda x: pattern in x
+        )
+        assert ak.strings.find(array, pattern).tolist() == expected(
+            lambda x: x.find(pattern)
+        )
+
+    for separator in [" ", "  ", "aa", "e"]:
+        assert ak.strings.split(array, separator).tolist() == expected(
+            lambda x: x.split(separator)
+        )
+
+    assert ak.strings.upper(array).tolist() == expected(lambda x: x.upper())
+    assert ak.strings.lower(ak.Array(["ONE", "Two", "ÄÖ", ""])).tolist() == [
+        "one",
+        "two",
+        "äö",
+        "",
+    ]
+    assert ak.strings.upper(ak.Array(["ß", "x"])).tolist() == ["SS", "X"]
+
+    for chars in [None, "a", " e"]:
+        assert ak.strings.strip(array, chars).tolist() == expected(
+            lambda x: x.strip(chars)
+        )
+        assert ak.strings.lstrip(array, chars).tolist() == expected(
+            lambda x: x.lstrip(chars)
+        )
+        assert ak.strings.rstrip(array, chars).tolist() == expected(
+            lambda x: x.rstrip(chars)
+        )
+
+
+def test_nested_and_types():
+    nested = ak.Array([["abc", "b"], [], ["cab"]])
+    assert ak.strings.contains(nested, "ab").tolist() == [[True, False], [], [True]]
+    assert str(ak.type(ak.strings.split(nested, "a"))) == "3 * var * var * string"
+    assert str(ak.type(ak.strings.strip(nested, "c"))) == "3 * var * string"
+
+    records = ak.Array([{"x": "one", "y": 1}, {"x": "two", "y": 2}])
+    with pytest.raises(TypeError):
+        ak.strings.length(records)
+    assert ak.strings.length(records.x).tolist() == [3, 3]
+
+    with pytest.raises(TypeError):
+        ak.strings.startswith(ak.Array([1, 2, 3]), "1")
+    with pytest.raises(ValueError):
+        ak.strings.split(array, "")
+
+
+def test_bytestrings():
+    array = ak.Array([b"ab\xff", b"", b"xay"])
+    assert ak.strings.length(array).tolist() == [3, 0, 3]
+    assert ak.strings.find(array, b"a").tolist() == [0, -1, 1]
+    assert ak.strings.upper(array).tolist() == [b"AB\xff", b"", b"XAY"]
+    assert ak.strings.split(array, b"a").tolist() == [
+        [b"", b"b\xff"],
+        [b""],
+        [b"x", b"y"],
+    ]
+
+
+def test_join():
+    array = ak.Array([["a", "bb"], [], ["c"], ["", ""], None])
+    assert ak.strings.join(array, "--").tolist() == ["a--bb", "", "c", "--", None]
+    assert ak.strings.join(array, "").tolist() == ["abb", "", "c", "", None]
+    assert str(ak.type(ak.strings.join(array, ","))) == "5 * option[string]"
+
+    words = ak.strings.split(ak.Array(["one two three", "four"]), " ")
+    assert ak.strings.join(words[:, ::-1], " ").tolist() == ["three two one", "four"]
+
+    with pytest.raises(TypeError):
+        ak.strings.join(ak.Array(["one", "two"]), " ")
+
+
+@pytest.mark.parametrize("arrow", [False, True])
+def test_match_regex(arrow, monkeypatch):
+    if arrow:
+        pytest.importorskip("pyarrow.compute")
+    else:
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    assert ak.strings.match_regex(array, "^t.*e$").tolist() == expected(
+        lambda x: x == "three"
+    )
+    assert ak.strings.match_regex(array, r"e\s+t").tolist() == expected(
+        lambda x: x == "one two"
+    )
+    assert ak.strings.match_regex(ak.Array([b"ab", b"c"]), b"a").tolist() == [
+        True,
+        False,
+    ]
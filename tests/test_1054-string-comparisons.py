@@ -0,0 +1,67 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import operator
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+operators = [
+    operator.eq,
+    operator.ne,
+    operator.lt,
+    operator.le,
+    operator.gt,
+    operator.ge,
+]
+
+strings = ["one", "two", "", "three", "on", "one!", "über", "uber", "z"]
+
+
+@pytest.mark.parametrize("op", operators)
+def test_array_array(op):
+    one = ak.Array(strings)
+    two = ak.Array(strings[::-1])
+    expected = [op(x, y) for x, y in zip(strings, strings[::-1])]
+    assert ak.to_list(op(one, two)) == expected
+
+    # non-contiguous strings (ListArray rather than ListOffsetArray)
+    assert ak.to_list(op(one[::-1], two[::-1])) == expected[::-1]
+
+
+@pytest.mark.parametrize("op", operators)
+def test_array_scalar(op):
+    array = ak.Array(strings)
+    for scalar in ("one", "", "über", "zz"):
+        assert ak.to_list(op(array, scalar)) == [op(x, scalar) for x in strings]
+        assert ak.to_list(op(scalar, array)) == [op(scalar, x) for x in strings]
+
+
+@pytest.mark.parametrize("op", operators)
+def test_bytestrings(op):
+    data = [b"abc", b"\xff", b"", b"ab\x00", b"ab"]
+    one = ak.Array(data)
+    two = ak.Array(data[::-1])
+    expected = [op(x, y) for x, y in zip(data, data[::-1])]
+    assert ak.to_list(op(one, two)) == expected
+    assert ak.to_list(op(one, b"ab")) == [op(x, b"ab") for x in data]
+
+
+def test_nested_and_missing():
+    array = ak.Array([["a", "c"], [], ["b"], None])
+    assert ak.to_list(array < "b") == [[True, False], [], [False], None]
+    assert ak.to_list(array >= ak.Array(["b", "a", "b", "b"])) == [
+        [False, True],
+        [],
+        [True],
+        None,
+    ]
+
+
+def test_range_filter():
+    array = ak.Array(["apple", "banana", "cherry", "date", "b", "d"])
+    mask = (array >= "b") & (array < "d")
+    assert ak.to_list(array[mask]) == ["banana", "cherry", "b"]
@@ -0,0 +1,70 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_strings():
+    array = ak.Array([["one", "two", "three"], [], ["three", "", None, "two", ""]])
+    categorical = ak.to_categorical(array)
+    assert ak.is_categorical(categorical)
+    assert ak.to_list(ak.categories(categorical)) == ["one", "two", "three", ""]
+    assert ak.to_list(categorical) == ak.to_list(array)
+    index = np.asarray(categorical.layout.content.index)
+    assert index.tolist() == [0, 1, 2, 2, 3, -1, 1, 3]
+
+    # non-contiguous strings
+    array = ak.Array(["a", "bb", "a", "ccc", "bb"])[::-1]
+    categorical = ak.to_categorical(array)
+    assert ak.to_list(ak.categories(categorical)) == ["bb", "ccc", "a"]
+    assert np.asarray(categorical.layout.index).tolist() == [0, 1, 2, 0, 2]
+
+
+def test_numbers():
+    array = ak.Array([3.3, 1.1, 3.3, 2.2, 1.1])
+    categorical = ak.to_categorical(array)
+    assert ak.to_list(ak.categories(categorical)) == [3.3, 1.1, 2.2]
+    assert np.asarray(categorical.layout.index).tolist() == [0, 1, 0, 2, 1]
+
+    assert ak.to_list(ak.to_categorical(ak.Array([]))) == []
+
+
+def test_records():
+    array = ak.Array(
+        [
+            {"x": 1, "y": "a"},
+            {"x": 2, "y": "a"},
+            {"x": 1, "y": "a"},
+            {"x": 1, "y": "b"},
+        ]
+    )
+    categorical = ak.to_categorical(array)
+    assert ak.to_list(ak.categories(categorical)) == [
+        {"x": 1, "y": "a"},
+        {"x": 2, "y": "a"},
+        {"x": 1, "y": "b"},
+    ]
+    assert np.asarray(categorical.layout.index).tolist() == [0, 1, 0, 2]
+    assert ak.to_list(categorical) == ak.to_list(array)
+
+    # fields that can't be vectorized go through the Python loop
+    array = ak.Array([{"x": [1]}, {"x": [2]}, {"x": [1]}])
+    categorical = ak.to_categorical(array)
+    assert ak.to_list(ak.categories(categorical)) == [{"x": [1]}, {"x": [2]}]
+
+
+def test_equal_with_different_categories():
+    one = ak.to_categorical(ak.Array(["a", "b", "c", "a", None]))
+    two = ak.to_categorical(ak.Array(["c", "b", "z", "a", "q"]))
+    assert ak.to_list(one == two) == [False, True, False, True, False]
+
+    one = ak.to_categorical(ak.Array([1, 2, 3, 1]))
+    two = ak.to_categorical(ak.Array([1.0, 5.0, 3.0, 2.0]))
+    assert ak.to_list(one == two) == [True, False, True, False]
+
+    one = ak.to_categorical(ak.Array([{"x": 1}, {"x": 2}]))
+    two = ak.to_categorical(ak.Array([{"x": 2}, {"x": 2}]))
+    assert ak.to_list(one == two) == [False, True]
@@ -0,0 +1,93 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_numbers():
+    array = ak.Array([[3, 1, 3], [], [2, 2, None, 1]])
+    assert ak.to_list(ak.unique(array)) == [1, 2, 3]
+    assert ak.to_list(ak.unique(array, axis=-1)) == [[1, 3], [], [1, 2]]
+    assert ak.to_list(ak.unique(array, axis=1)) == [[1, 3], [], [1, 2]]
+
+    values, inverse, counts = ak.unique(
+        array, axis=-1, return_inverse=True, return_counts=True
+    )
+    assert ak.to_list(inverse) == [[1, 0, 1], [], [1, 1, None, 0]]
+    assert ak.to_list(counts) == [[1, 2], [], [1, 2]]
+    assert ak.to_list(values[inverse]) == ak.to_list(array)
+
+    values, inverse = ak.unique(array, return_inverse=True)
+    assert ak.to_list(inverse) == [2, 0, 2, 1, 1, 0]
+    assert ak.to_list(values[inverse]) == [3, 1, 3, 2, 2, 1]
+
+    assert ak.to_list(ak.unique(ak.Array([1.5, 0.5, 1.5]), axis=0)) == [0.5, 1.5]
+    assert ak.to_list(ak.unique(np.array([[1, 2, 1], [3, 3, 3]]), axis=-1)) == [
+        [1, 2],
+        [3],
+    ]
+    assert ak.to_list(ak.unique(ak.Array([]))) == []
+
+
+def test_strings():
+    array = ak.Array([["b", "a", "b"], [], ["c", None, "", "c"]])
+    assert ak.to_list(ak.unique(array)) == ["", "a", "b", "c"]
+    assert ak.to_list(ak.unique(array, axis=-1)) == [["a", "b"], [], ["", "c"]]
+
+    values, counts = ak.unique(array[::-1], axis=-1, return_counts=True)
+    assert ak.to_list(values) == [["", "c"], [], ["a", "b"]]
+    assert ak.to_list(counts) == [[1, 2], [], [1, 2]]
+
+
+def test_records():
+    array = ak.Array([{"x": 1, "y": "b"}, {"x": 0, "y": "a"}, {"x": 1, "y": "b"}])
+    assert ak.to_list(ak.unique(array)) == [{"x": 0, "y": "a"}, {"x": 1, "y": "b"}]
+
+    array = ak.Array(
+        [
+            {"x": 1, "y": None},
+            {"x": 1, "y": 2},
+            {"x": 1, "y": None},
+            {"x": 0, "y": 5},
+        ]
+    )
+    assert ak.to_list(ak.unique(array)) == [
+        {"x": 0, "y": 5},
+        {"x": 1, "y": 2},
+        {"x": 1, "y": None},
+    ]
+
+
+def test_deeper():
+    array = ak.Array([[[1, 1]], [[2], [3, 3]]])
+    assert ak.to_list(ak.unique(array, axis=-1)) == [[[1]], [[2], [3]]]
+    assert ak.to_list(ak.unique(array, axis=2)) == [[[1]], [[2], [3]]]
+    with pytest.raises(ValueError):
+        ak.unique(array, axis=1)
+    with pytest.raises(ValueError):
+        ak.unique(array, axis=-2)
+
+    with pytest.raises(ValueError):
+        ak.unique(ak.Array([1, 2, 2]), axis=5)
+    with pytest.raises(ValueError):
+        ak.unique(ak.Array([1, 2, 2]), axis=-3)
+    assert ak.to_list(ak.unique(ak.Array([1, 2, 2]), axis=-1)) == [1, 2]
+
+
+def test_value_counts():
+    array = ak.Array(["b", "a", "b", "c", "b", "a"])
+    assert ak.to_list(ak.value_counts(array)) == [
+        {"value": "b", "count": 3},
+        {"value": "a", "count": 2},
+        {"value": "c", "count": 1},
+    ]
+
+    array = ak.Array([[2, 1, 1, 3], [], [None, 5]])
+    assert ak.to_list(ak.value_counts(array, axis=-1)) == [
+        [{"value": 1, "count": 2}, {"value": 2, "count": 1}, {"value": 3, "count": 1}],
+        [],
+        [{"value": 5, "count": 1}],
+    ]
@@ -0,0 +1,82 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_top_level():
+    array = ak.Array(
+        [
+            {"name": "b", "x": 1},
+            {"name": "a", "x": 2},
+            {"name": "b", "x": 3},
+            {"name": "c", "x": 4},
+        ]
+    )
+    keys, groups = ak.group_by(array, "name")
+    assert ak.to_list(keys) == ["a", "b", "c"]
+    assert ak.to_list(groups.x) == [[2], [1, 3], [4]]
+    assert ak.to_list(ak.sum(groups.x, axis=-1)) == [2, 4, 4]
+
+    # the groups index the original array rather than copying it
+    assert isinstance(groups.layout.content, ak.layout.IndexedArray64)
+
+    keys, groups = ak.group_by(array.x, array.x % 2)
+    assert ak.to_list(keys) == [0, 1]
+    assert ak.to_list(groups) == [[2, 4], [1, 3]]
+
+
+def test_missing_keys():
+    keys, groups = ak.group_by(ak.Array([1, 2, 3]), ak.Array([None, 1, 1]))
+    assert ak.to_list(keys) == [1]
+    assert ak.to_list(groups) == [[2, 3]]
+
+    keys, groups = ak.group_by(ak.Array([]), ak.Array([]))
+    assert len(keys) == 0
+    assert len(groups) == 0
+
+
+def test_within_lists():
+    array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    key = ak.Array([[1, 0, 1], [], [7, 7]])
+    for axis in (1, -1):
+        keys, groups = ak.group_by(array, key, axis=axis)
+        assert ak.to_list(keys) == [[0, 1], [], [7]]
+        assert ak.to_list(groups) == [[[2.2], [1.1, 3.3]], [], [[4.4, 5.5]]]
+
+    array = ak.Array([[[1, 2, 3], [4]], [], [[5, 6]]])
+    key = ak.Array([[["x", "y", "x"], ["z"]], [], [[None, "q"]]])
+    keys, groups = ak.group_by(array, key, axis=-1)
+    assert ak.to_list(keys) == [[["x", "y"], ["z"]], [], [["q"]]]
+    assert ak.to_list(groups) == [[[[1, 3], [2]], [[4]]], [], [[[6]]]]
+
+
+def test_missing_lists():
+    keys, groups = ak.group_by(
+        ak.Array([[1, 2], None, [3]]), ak.Array([[0, 0], None, [1]]), axis=1
+    )
+    assert ak.to_list(keys) == [[0], None, [1]]
+    assert ak.to_list(groups) == [[[1, 2]], None, [[3]]]
+
+    keys, groups = ak.group_by(
+        ak.Array([[[1, 2], None], [[3]]]), ak.Array([[[0, 1], [5]], [None]]), axis=2
+    )
+    assert ak.to_list(keys) == [[[0, 1], None], [None]]
+    assert ak.to_list(groups) == [[[[1], [2]], None], [None]]
+
+
+def test_errors():
+    array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    with pytest.raises(ValueError):
+        ak.group_by(array, ak.Array([[1], [], [1, 2]]), axis=1)
+    with pytest.raises(ValueError):
+        ak.group_by(array, ak.Array([1, 2]))
+    with pytest.raises(ValueError):
+        ak.group_by(ak.Array([[[1]]]), ak.Array([[[1]]]), axis=1)
+    with pytest.raises(ValueError):
+        ak.group_by(
+            ak.Array([[[5]], [[6], [7]]]), ak.Array([[[0], [1]], [[2]]]), axis=2
+        )
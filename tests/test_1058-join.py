@@ -0,0 +1,98 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+left = ak.Array([{"id": 3, "x": 1.1}, {"id": 1, "x": 2.2}, {"id": 2, "x": 3.3}])
+right = ak.Array(
+    [{"id": 1, "y": "one"}, {"id": 3, "y": "three"}, {"id": 1, "y": "uno"}]
+)
+
+
+def test_inner():
+    out = ak.join(left, right, on="id")
+    assert ak.to_list(out) == [
+        ({"id": 3, "x": 1.1}, {"id": 3, "y": "three"}),
+        ({"id": 1, "x": 2.2}, {"id": 1, "y": "one"}),
+        ({"id": 1, "x": 2.2}, {"id": 1, "y": "uno"}),
+    ]
+    matched_left, matched_right = ak.unzip(out)
+    assert isinstance(matched_left.layout, ak.layout.IndexedArray64)
+    assert isinstance(matched_right.layout, ak.layout.IndexedArray64)
+
+    assert ak.to_list(ak.join(left, right[:0], on="id")) == []
+
+
+def test_left():
+    matched_left, matched_right = ak.unzip(ak.join(left, right, on="id", how="left"))
+    assert isinstance(matched_right.layout, ak.layout.IndexedOptionArray64)
+    assert ak.to_list(matched_left.x) == [1.1, 2.2, 2.2, 3.3]
+    assert ak.to_list(matched_right.y) == ["three", "one", "uno", None]
+
+    out = ak.join(left, right[:0], on="id", how="left")
+    assert ak.to_list(out) == [(x, None) for x in ak.to_list(left)]
+
+
+def test_several_fields():
+    one = ak.Array([{"a": 1, "b": "x"}, {"a": 1, "b": "y"}, {"a": 2, "b": "y"}])
+    two = ak.Array([{"a": 1, "b": "y", "c": 0}, {"a": 2, "b": "x", "c": 1}])
+    assert ak.to_list(ak.join(one, two, on=["a", "b"])) == [
+        ({"a": 1, "b": "y"}, {"a": 1, "b": "y", "c": 0})
+    ]
+
+
+def test_per_list():
+    one = ak.Array(
+        [
+            [{"k": "a", "v": 1}, {"k": "b", "v": 2}],
+            [],
+            [{"k": None, "v": 3}, {"k": "c", "v": 4}],
+        ]
+    )
+    two = ak.Array(
+        [
+            [{"k": "b", "w": 10}],
+            [{"k": "a", "w": 0}],
+            [{"k": "c", "w": 5}, {"k": None, "w": 6}, {"k": "c", "w": 7}],
+        ]
+    )
+    matched_one, matched_two = ak.unzip(ak.join(one, two, on="k", axis=1))
+    assert ak.to_list(matched_one.v) == [[2], [], [4, 4]]
+    assert ak.to_list(matched_two.w) == [[10], [], [5, 7]]
+
+    matched_one, matched_two = ak.unzip(ak.join(one, two, on="k", axis=1, how="left"))
+    assert ak.to_list(matched_one.v) == [[1, 2], [], [3, 4, 4]]
+    assert ak.to_list(matched_two.w) == [[None, 10], [], [None, 5, 7]]
+
+
+def test_missing_lists():
+    left = ak.Array([[{"k": 1}], None, [{"k": 2}]])
+    right = ak.Array([[{"k": 1}, {"k": 2}], [{"k": 2}], None])
+    assert ak.to_list(ak.join(left, right, on="k", axis=1)) == [
+        [({"k": 1}, {"k": 1})],
+        None,
+        None,
+    ]
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak.join(left, right, on="id", how="outer")
+    with pytest.raises(ValueError):
+        ak.join(left, right, on="x")
+    with pytest.raises(ValueError):
+        ak.join(ak.Array([[{"id": 1}]]), ak.Array([[{"id": 1}], []]), on="id", axis=1)
+
+    # same number of lists at axis=2, but in different outer lists
+    one = ak.Array([[[{"k": 1}], [{"k": 2}]], [[{"k": 3}]]])
+    two = ak.Array([[[{"k": 1}]], [[{"k": 2}], [{"k": 3}]]])
+    with pytest.raises(ValueError):
+        ak.join(one, two, on="k", axis=2)
+    assert ak.to_list(ak.join(one, one, on="k", axis=2)) == [
+        [[({"k": 1}, {"k": 1})], [({"k": 2}, {"k": 2})]],
+        [[({"k": 3}, {"k": 3})]],
+    ]
@@ -0,0 +1,76 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_example():
+    array = ak.Array([[3.3, 1.1, 5.5, 4.4], [], [2.2]])
+    assert str(ak.type(ak.argtopk(array, 2))) == "3 * 2 * ?int64"
+    assert ak.to_list(ak.argtopk(array, 2)) == [[2, 3], [None, None], [0, None]]
+    assert ak.to_list(ak.topk(array, 2)) == [[5.5, 4.4], [None, None], [2.2, None]]
+    assert ak.to_list(ak.topk(array, 2, largest=False)) == [
+        [1.1, 3.3],
+        [None, None],
+        [2.2, None],
+    ]
+    assert ak.to_list(ak.topk(array, 0)) == [[], [], []]
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.uint32, np.int64, np.float64])
+@pytest.mark.parametrize("largest", [True, False])
+def test_same_as_argsort(dtype, largest):
+    generator = np.random.RandomState(1054)
+    counts = generator.poisson(5, 200)
+    content = generator.randint(0, 10, counts.sum()).astype(dtype)
+    array = ak.unflatten(content, counts)
+    if dtype is np.float64:
+        array = ak.unflatten(np.where(content == 3, np.nan, content), counts)
+
+    for k in (1, 3, 20):
+        expected = ak.argsort(array, ascending=not largest)[:, :k]
+        expected = ak.pad_none(expected, k, clip=True)
+        assert ak.to_list(ak.argtopk(array, k, largest=largest)) == ak.to_list(expected)
+
+
+def test_other_structures():
+    assert ak.to_list(ak.topk(ak.Array([5, 1, 7]), 2)) == [7, 5]
+    assert ak.to_list(ak.topk(np.array([[1, 2, 3], [6, 5, 4]]), 1)) == [[3], [6]]
+    assert ak.to_list(ak.topk(ak.Array([[[1, 2], [3]]]), 1, axis=2)) == [[[2], [3]]]
+    assert ak.to_list(ak.topk(ak.Array([[1, None, 3, 2]]), 2)) == [[3, 2]]
+    assert ak.to_list(ak.topk(ak.Array([["b", "a", "c"]]), 2)) == [["c", "b"]]
+
+    with pytest.raises(ValueError):
+        ak.topk(ak.Array([[[1, 2], [3]]]), 1, axis=1)
+    with pytest.raises(ValueError):
+        ak.topk(ak.Array([[1, 2]]), -1)
+
+
+def test_empty_and_unknown():
+    assert ak.to_list(ak.topk(ak.Array([[], []]), 2)) == [[None, None], [None, None]]
+    assert ak.to_list(ak.argtopk(ak.Array([[], []]), 2)) == [
+        [None, None],
+        [None, None],
+    ]
+    assert ak.to_list(ak.topk(ak.Array([]), 2)) == [None, None]
+    assert ak.to_list(ak.topk(ak.Array([[[], [1]], []]), 2)) == [
+        [[None, None], [1, None]],
+        [],
+    ]
+    assert ak.to_list(ak.topk(ak.Array([1, None, 3]), 2)) == [3, 1]
+
+
+def test_unsupported():
+    with pytest.raises(TypeError):
+        ak.topk(ak.Array([[{"x": 3}, {"x": 5}], []]), 1)
+    with pytest.raises(TypeError):
+        ak.topk(ak.Array([{"x": [1, 2]}]), 1)
+    with pytest.raises(TypeError):
+        ak.topk(ak.Array([[1, 2], [[3]]]), 1)
+    with pytest.raises(TypeError):
+        ak.argtopk(ak.Array([[1 + 1j, 2]]), 1)
+    with pytest.raises(TypeError):
+        ak.argtopk(ak.Array(np.array([["2020-01-01"]], dtype="M8[D]")), 1)
@@ -0,0 +1,123 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+events = ak.Array(
+    [[{"x": 1.1, "y": 2.2}, {"x": 3.3, "y": 4.4}], [], [{"x": 5.5, "y": 6.6}]]
+)
+
+
+def test_deferred():
+    e = ak.Expr(events)
+    selection = np.sqrt(e.x ** 2 + e.y ** 2) > 3
+    assert isinstance(selection, ak.Expr)
+    assert repr(selection) == "<Expr greater(sqrt(add(power(x, 2), power(y, 2))), 3)>"
+
+    expected = ak.to_list(np.sqrt(events.x ** 2 + events.y ** 2) > 3)
+    assert ak.to_list(selection.evaluate(engine="numpy")) == expected
+    assert ak.to_list(selection.evaluate()) == expected
+
+
+def test_broadcasting():
+    one = ak.Array([[1, 2, 3], [], [4]])
+    two = ak.Array([10, 20, 30])
+    expr = ak.Expr(one) * two + 1
+    assert ak.to_list(expr.evaluate(engine="numpy")) == [[11, 21, 31], [], [121]]
+
+    # arrays on either side of an Expr are part of the expression
+    assert isinstance(events.x + ak.Expr(events.y), ak.Expr)
+    assert ak.to_list((events.x + ak.Expr(events.y)).evaluate(engine="numpy")) == (
+        ak.to_list(events.x + events.y)
+    )
+
+    expr = np.minimum(ak.Expr(one), 2) - np.float32(0.5)
+    assert ak.to_list(expr.evaluate()) == [[0.5, 1.5, 1.5], [], [1.5]]
+
+
+def test_types_match_eager():
+    array = ak.Array(np.arange(5, dtype=np.uint8))
+    for expr, eager in [
+        (ak.Expr(array) * 2, array * 2),
+        (ak.Expr(array) / 2, array / 2),
+        (-ak.Expr(array) > 2, -array > 2),
+    ]:
+        out = expr.evaluate(engine="numpy")
+        assert ak.type(out) == ak.type(eager)
+        assert ak.to_list(out) == ak.to_list(eager)
+
+
+def test_behaviors_are_evaluated_eagerly():
+    strings = ak.Array(["one", "two", "one"])
+    assert ak.to_list((ak.Expr(strings) == "one").evaluate()) == [True, False, True]
+
+
+def test_numexpr():
+    pytest.importorskip("numexpr")
+    e = ak.Expr(events)
+    expr = np.arctan2(e.y, e.x) * 2 <= abs(e.x - 4)
+    expected = np.arctan2(events.y, events.x) * 2 <= abs(events.x - 4)
+    assert ak.to_list(expr.evaluate(engine="numexpr")) == ak.to_list(expected)
+
+    with pytest.raises(ValueError):
+        np.minimum(e.x, 2).evaluate(engine="numexpr")
+
+
+@pytest.mark.parametrize(
+    "dtype", [np.bool_, np.int32, np.int64, np.float32, np.float64]
+)
+def test_numexpr_same_as_numpy(dtype):
+    pytest.importorskip("numexpr")
+    one = ak.values_astype(ak.Array([[1, 0, 3], [], [4]]), dtype)
+    two = ak.values_astype(ak.Array([[2, 2, 1], [], [0]]), dtype)
+    exprs = [
+        ak.Expr(one) + ak.Expr(two),
+        ak.Expr(one) * ak.Expr(two) + ak.Expr(one),
+        ak.Expr(one) >= ak.Expr(two),
+        np.sqrt(ak.Expr(one)),
+    ]
+    for expr in exprs:
+        expected = expr.evaluate(engine="numpy")
+        out = expr.evaluate()
+        assert ak.type(out) == ak.type(expected)
+        assert ak.to_list(out) == ak.to_list(expected)
+        # for these types, numexpr and NumPy agree; for others, they may not
+        if dtype in (np.int64, np.float64):
+            out = expr.evaluate(engine="numexpr")
+        else:
+            try:
+                out = expr.evaluate(engine="numexpr")
+            except ValueError:
+                continue
+        assert ak.type(out) == ak.type(expected)
+        assert ak.to_list(out) == ak.to_list(expected)
+
+
+def test_numexpr_different_types():
+    pytest.importorskip("numexpr")
+    array = ak.Array(np.array([1.5, 2.5, 3.5], dtype=np.float32))
+
+    # numexpr would compute this in float64, NumPy in float32
+    expr = ak.Expr(array) * 2.5
+    assert str(ak.type(expr.evaluate())) == "3 * float32"
+    assert ak.to_list(expr.evaluate()) == [3.75, 6.25, 8.75]
+    with pytest.raises(ValueError):
+        expr.evaluate(engine="numexpr")
+
+    flags = ak.Array([True, False, False])
+    expr = ak.Expr(flags) + ak.Expr(flags)
+    assert ak.to_list(expr.evaluate()) == ak.to_list(flags + flags)
+
+
+def test_errors():
+    e = ak.Expr(events)
+    with pytest.raises(TypeError):
+        (e.x + 1)[0]
+    with pytest.raises(AttributeError):
+        (e.x + 1).y
+    with pytest.raises(ValueError):
+        (e.x + 1).evaluate(engine="numba")
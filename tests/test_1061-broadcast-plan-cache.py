@@ -0,0 +1,64 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import gc
+import weakref
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def listarray(array):
+    offsets = np.asarray(array.layout.offsets)
+    return ak.Array(
+        ak.layout.ListArray64(
+            ak.layout.Index64(offsets[:-1]),
+            ak.layout.Index64(offsets[1:]),
+            array.layout.content,
+        )
+    )
+
+
+def test_fields_of_one_record():
+    events = ak.Array(
+        [[{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}], [], [{"x": 3, "y": 3.3}]]
+    )
+    assert ak.to_list(events.x + events.y) == [[2.1, 4.2], [], [6.3]]
+
+
+def test_fields_of_two_records():
+    one = ak.Array([[{"x": 1, "y": 1}, {"x": 2, "y": 2}], [], [{"x": 3, "y": 3}]])
+    two = listarray(ak.Array([[10, 20], [], [30]]))
+    two = ak.zip({"x": two, "y": two})
+    assert ak.to_list(ak.zip([one.x, one.y, two.x, two.y])) == [
+        [(1, 1, 10, 10), (2, 2, 20, 20)],
+        [],
+        [(3, 3, 30, 30)],
+    ]
+
+    three = listarray(ak.Array([[10], [20], [30]]))
+    with pytest.raises(ValueError):
+        ak.zip([one.x, one.y, three, three])
+
+
+def test_buffers_are_not_kept():
+    offsets = np.array([0, 2, 2, 3], np.int64)
+    one = ak.Array(
+        ak.layout.ListOffsetArray64(
+            ak.layout.Index64(offsets), ak.layout.NumpyArray(np.arange(3))
+        )
+    )
+    two = listarray(ak.Array([[10, 20], [], [30]]))
+    assert ak.to_list(one + two) == [[10, 21], [], [32]]
+
+    # changing the offsets in place is seen by the next call
+    offsets[1] = 1
+    with pytest.raises(ValueError):
+        one + two
+
+    ref = weakref.ref(offsets)
+    del one, offsets
+    gc.collect()
+    assert ref() is None
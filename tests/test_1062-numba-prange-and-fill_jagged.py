@@ -0,0 +1,77 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_fill_jagged():
+    array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 0.5]])
+    counts = np.array([sum(1 for x in row if x > 3) for row in array], np.int64)
+
+    def fill(offsets, content, array):
+        for i in range(len(array)):
+            j = offsets[i]
+            for x in array[i]:
+                if x > 3:
+                    content[j] = x
+                    j += 1
+
+    out = ak.numba.fill_jagged(counts, fill, array)
+    assert ak.to_list(out) == [[3.3], [], [4.4]]
+
+    def fill_index(offsets, content):
+        for i in range(len(offsets) - 1):
+            content[offsets[i] : offsets[i + 1]] = i
+
+    out = ak.numba.fill_jagged([2, 0, 1], fill_index, dtype=np.int32)
+    assert str(ak.type(out)) == "3 * var * int32"
+    assert ak.to_list(out) == [[0, 0], [], [2]]
+
+    with pytest.raises(ValueError):
+        ak.numba.fill_jagged([1, -1], fill_index)
+    with pytest.raises(TypeError):
+        ak.numba.fill_jagged([1.5], fill_index)
+
+
+def test_prange():
+    numba = pytest.importorskip("numba")
+
+    @numba.njit(parallel=True)
+    def sums(array):
+        out = np.zeros(len(array), np.float64)
+        for i in numba.prange(len(array)):
+            for x in array[i]:
+                out[i] += x.y
+        return out
+
+    array = ak.Array([[{"y": 1.1}, {"y": 2.2}], [], [{"y": 3.3}]] * 100)
+    assert sums(array).tolist() == pytest.approx([3.3, 0.0, 3.3] * 100)
+
+
+def test_prange_fill_jagged():
+    numba = pytest.importorskip("numba")
+
+    @numba.njit(parallel=True)
+    def count(array, counts):
+        for i in numba.prange(len(array)):
+            for x in array[i]:
+                if x > 3:
+                    counts[i] += 1
+
+    @numba.njit(parallel=True)
+    def fill(offsets, content, array):
+        for i in numba.prange(len(array)):
+            j = offsets[i]
+            for x in array[i]:
+                if x > 3:
+                    content[j] = x
+                    j += 1
+
+    array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 0.5]] * 100)
+    counts = np.zeros(len(array), np.int64)
+    count(array, counts)
+    out = ak.numba.fill_jagged(counts, fill, array)
+    assert ak.to_list(out) == [[3.3], [], [4.4]] * 100
@@ -0,0 +1,128 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def fill_records(builder, n):
+    for i in range(n):
+        record = builder.begin_list()
+        for j in range(i):
+            record.x.append(j * 1.1)
+            y = record.y.begin_list()
+            for k in range(j):
+                y.append(k)
+            record.y.end_list()
+            record.end_record()
+        builder.end_list()
+
+
+def fill_options(builder, n):
+    for i in range(n):
+        if i % 3 == 0:
+            builder.append_null()
+        else:
+            record = builder.append_valid()
+            record.f0.append(i % 2 == 0)
+            record.f1.append(i)
+            record.end_record()
+
+
+records_form = ak.Array([[{"x": 1.1, "y": [1]}]]).layout.form
+options_form = """{
+    "class": "IndexedOptionArray64",
+    "index": "i64",
+    "content": {"class": "RecordArray", "contents": ["bool", "int32"]}
+}"""
+
+
+def check(fill, form, jit):
+    expected = []
+    for n in (0, 1, 5, 100):
+        layoutbuilder = ak.numba.LayoutBuilder(form, initial=1, jit=jit)
+        fill(layoutbuilder.builder, n)
+        assert len(layoutbuilder) == n
+        expected.append(layoutbuilder.snapshot())
+        assert str(ak.type(expected[-1]).type) == str(form.type({}))
+    return expected
+
+
+def test_python():
+    arrays = check(fill_records, records_form, False)
+    assert ak.to_list(arrays[2]) == [
+        [],
+        [{"x": 0.0, "y": []}],
+        [{"x": 0.0, "y": []}, {"x": 1.1, "y": [0]}],
+        [{"x": 0.0, "y": []}, {"x": 1.1, "y": [0]}, {"x": 2.2, "y": [0, 1]}],
+        [
+            {"x": 0.0, "y": []},
+            {"x": 1.1, "y": [0]},
+            {"x": 2.2, "y": [0, 1]},
+            {"x": 3.3000000000000003, "y": [0, 1, 2]},
+        ],
+    ]
+
+    arrays = check(fill_options, ak.forms.Form.fromjson(options_form), False)
+    assert ak.to_list(arrays[2]) == [None, (False, 1), (True, 2), None, (True, 4)]
+
+
+def test_snapshot_while_filling():
+    layoutbuilder = ak.numba.LayoutBuilder(
+        {"class": "ListOffsetArray64", "offsets": "i64", "content": "int64"},
+        initial=1,
+        jit=False,
+    )
+    builder = layoutbuilder.builder
+    builder.begin_list().append(1)
+    builder.end_list()
+    first = layoutbuilder.snapshot()
+    for i in range(10):
+        builder.begin_list().append(i)
+        builder.end_list()
+    assert ak.to_list(first) == [[1]]
+    assert len(layoutbuilder.snapshot()) == 11
+
+
+def test_strings():
+    form = ak.Array(["one", "two"]).layout.form
+    layoutbuilder = ak.numba.LayoutBuilder(form, jit=False)
+    builder = layoutbuilder.builder
+    for word in (b"hey", b"", b"there"):
+        chars = builder.begin_list()
+        for x in bytearray(word):
+            chars.append(x)
+        builder.end_list()
+    assert ak.to_list(layoutbuilder.snapshot()) == ["hey", "", "there"]
+
+
+def test_errors():
+    with pytest.raises(TypeError):
+        ak.numba.LayoutBuilder(ak.Array([1, 2, 3]).layout.form.type)
+    with pytest.raises(TypeError):
+        ak.numba.LayoutBuilder(ak.to_regular(ak.Array([[1, 2], [3, 4]])).layout.form)
+    with pytest.raises(ValueError):
+        ak.numba.LayoutBuilder(ak.Array([{"x y": 1}]).layout.form)
+
+    layoutbuilder = ak.numba.LayoutBuilder(records_form, jit=False)
+    record = layoutbuilder.builder.begin_list()
+    record.x.append(1.1)
+    record.end_record()
+    layoutbuilder.builder.end_list()
+    with pytest.raises(ValueError):
+        layoutbuilder.snapshot()
+
+
+def test_numba():
+    numba = pytest.importorskip("numba")
+
+    assert [
+        ak.to_list(x) for x in check(numba.njit(fill_records), records_form, True)
+    ] == [ak.to_list(x) for x in check(fill_records, records_form, False)]
+
+    form = ak.forms.Form.fromjson(options_form)
+    assert [ak.to_list(x) for x in check(numba.njit(fill_options), form, None)] == [
+        ak.to_list(x) for x in check(fill_options, form, False)
+    ]
@@ -0,0 +1,105 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from __future__ import absolute_import
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+numba = pytest.importorskip("numba")
+
+
+def test_same_layout():
+    one = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    two = ak.Array(one.layout)
+    assert one.numba_type is two.numba_type
+    assert one._numbaview is two._numbaview
+    assert one.numba_type is one.numba_type
+
+    three = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    assert three.numba_type == one.numba_type
+    assert three._numbaview is not one._numbaview
+
+
+def test_invalidation():
+    array = ak.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": []}])
+    array.numba_type
+    assert array._numbaview is not None
+
+    array["z"] = array.x + 1
+    assert array._numbaview is None
+    assert "z" in str(array.numba_type)
+
+    behavior = dict(ak.behavior)
+    array.behavior = behavior
+    assert array._numbaview is None
+    array.numba_type
+    assert array._numbaview.behavior is behavior
+
+    @numba.njit
+    def f1(x):
+        out = 0
+        for item in x:
+            out += item.z
+        return out
+
+    assert f1(array) == 5
+    assert f1(array) == 5
+
+
+def test_partitioned():
+    array = ak.repartition(ak.Array([[1, 2, 3], [], [4, 5], [6]]), 2)
+    assert array.numba_type is ak.Array(array.layout).numba_type
+
+    @numba.njit
+    def f1(x):
+        out = 0
+        for item in x:
+            for y in item:
+                out += y
+        return out
+
+    assert f1(array) == 21
+
+    with pytest.raises(ValueError):
+        ak.partitioned(
+            [ak.Array([1, 2]).layout, ak.Array([1.1, 2.2]).layout]
+        ).numba_type
+
+
+def dummy_typer(viewtype):
+    return numba.float64
+
+
+def dummy_lower(context, builder, sig, args):
+    def compute(rec):
+        return rec.x + rec.y
+
+    return context.compile_internal(builder, compute, sig, args)
+
+
+def test_behavior_registered_later():
+    behavior = {}
+    array = ak.Array(
+        [{"x": 1.1, "y": 100}, {"x": 2.2, "y": 200}],
+        with_name="Dummy",
+        behavior=behavior,
+    )
+
+    @numba.njit
+    def f1(x, i):
+        return x[i].x
+
+    assert f1(array, 1) == 2.2
+    before = array.numba_type
+
+    behavior["__numba_typer__", "Dummy", "stuff"] = dummy_typer
+    behavior["__numba_lower__", "Dummy", "stuff"] = dummy_lower
+    assert array.numba_type != before
+    assert ak.Array(array.layout, behavior=behavior).numba_type == array.numba_type
+
+    @numba.njit
+    def f2(x, i):
+        return x[i].stuff
+
+    assert f2(array, 1) == 202.2